@@ -22,7 +22,7 @@ from dotenv import load_dotenv
 
 from scripts.download_subs import download_subtitles
 from src.ingest.parser import parse_vtt_file
-from src.translate.azure import translate_segments_async
+from src.translate.azure import close_translators, translate_segments_async
 from src.summarize.gpt import summarize_translated_segments
 from src.export.docx import export_to_docx
 from src.export.pdf import export_to_pdf
@@ -72,7 +72,8 @@ class VerbaPipeline:
         meeting_title: Optional[str] = None,
         send_email: bool = False,
         email_to: Optional[str] = None,
-        language: str = "en"
+        language: str = "en",
+        compress_pdf: bool = False
     ) -> str:
         """
         Run the complete pipeline.
@@ -83,6 +84,7 @@ class VerbaPipeline:
             send_email: Whether to send email after completion
             email_to: Email address to send to
             language: Subtitle language code
+            compress_pdf: Whether to gzip the emailed PDF
             
         Returns:
             Path to generated PDF file
@@ -131,20 +133,18 @@ class VerbaPipeline:
                 "processing_time": summary_result.processing_time
             })
             
-            # Step 5: Generate DOCX
-            progress.update(message="Creating DOCX document")
-            docx_path = self._generate_docx(summary_result, meeting_title, run_output_dir)
+            # Steps 5 and 6: Generate DOCX and PDF (independent, so run concurrently)
+            progress.update(2, message="Creating DOCX and PDF documents")
+            docx_path, pdf_path = asyncio.run(
+                self._generate_documents(summary_result, meeting_title, run_output_dir)
+            )
             self._add_step_metadata("generate_docx", docx_path)
-            
-            # Step 6: Generate PDF
-            progress.update(message="Creating PDF document")
-            pdf_path = self._generate_pdf(summary_result, meeting_title, run_output_dir)
             self._add_step_metadata("generate_pdf", pdf_path)
             
             # Step 7: Send email (if requested)
             if send_email and email_to:
                 progress.update(message="Sending email")
-                email_sent = self._send_email(pdf_path, email_to, meeting_title)
+                email_sent = self._send_email(pdf_path, email_to, meeting_title, compress_pdf)
                 self._add_step_metadata("send_email", email_sent)
             else:
                 progress.update(message="Skipping email")
@@ -178,7 +178,11 @@ class VerbaPipeline:
     
     async def _translate_segments(self, segments: list) -> list:
         """Translate segments to Portuguese."""
-        return await translate_segments_async(segments)
+        try:
+            return await translate_segments_async(segments)
+        finally:
+            # The session belongs to this asyncio.run loop; release it with the loop
+            await close_translators()
     
     def _summarize_segments(self, segments: list, video_duration: int, meeting_date: str, language_note: str):
         """Summarize segments with GPT."""
@@ -198,13 +202,33 @@ class VerbaPipeline:
         pdf_path = output_dir / f"{summary_result.slug}.pdf"
         return export_to_pdf(summary_result, title, company_name, pdf_path)
     
-    def _send_email(self, pdf_path: str, email_to: str, meeting_title: Optional[str]) -> bool:
+    async def _generate_documents(
+        self,
+        summary_result,
+        meeting_title: Optional[str],
+        output_dir: Path
+    ) -> Tuple[str, str]:
+        """Generate the DOCX and PDF documents in parallel worker threads."""
+        docx_path, pdf_path = await asyncio.gather(
+            asyncio.to_thread(self._generate_docx, summary_result, meeting_title, output_dir),
+            asyncio.to_thread(self._generate_pdf, summary_result, meeting_title, output_dir)
+        )
+        return docx_path, pdf_path
+    
+    def _send_email(
+        self,
+        pdf_path: str,
+        email_to: str,
+        meeting_title: Optional[str],
+        compress_pdf: bool = False
+    ) -> bool:
         """Send email with PDF attachment."""
         title = meeting_title or "Ata de Reunião"
         return send_meeting_minutes(
             pdf_path=pdf_path,
             to_email=email_to,
-            meeting_title=title
+            meeting_title=title,
+            compress_pdf=compress_pdf
         )
     
     def _add_step_metadata(self, step_name: str, result):
@@ -320,6 +344,12 @@ Examples:
         help="Email address to send to"
     )
     
+    parser.add_argument(
+        "--compress-pdf",
+        action="store_true",
+        help="Attach the emailed PDF gzip-compressed"
+    )
+    
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -382,7 +412,8 @@ Examples:
             meeting_title=args.title,
             send_email=args.send_email,
             email_to=args.email_to,
-            language=args.language
+            language=args.language,
+            compress_pdf=args.compress_pdf
         )
         
         print(f"\n✅ Success! PDF generated: {pdf_path}")
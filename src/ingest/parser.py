@@ -5,15 +5,81 @@ This module parses .vtt (WebVTT) subtitle files and converts them into
 structured JSON segments for further processing by the Verba pipeline.
 """
 
+import bisect
 import json
 import logging
+import re
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-import webvtt
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 logger = logging.getLogger(__name__)
 
+# HTML-style tags such as <b> or <c.color> that VTT cues may carry
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Some files use SRT-style comma decimals ("00:00:01,000")
+_COMMA_TO_DOT = str.maketrans(',', '.')
+
+
+def _normalize_timestamp(timestamp: str) -> str:
+    """Expand the short "MM:SS.mmm" cue timestamp form to "HH:MM:SS.mmm"."""
+    return f"00:{timestamp}" if timestamp.count(':') == 1 else timestamp
+
+
+def _iter_vtt(vtt_path: Path) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream the cues of a WebVTT file one at a time.
+    
+    Header metadata, NOTE/STYLE blocks, cue identifiers and cue settings
+    are skipped. As in webvtt-py, whitespace-only lines end a block and cues
+    without text are dropped; YouTube auto-subs rely on both.
+    
+    Args:
+        vtt_path: Path to the .vtt file
+    
+    Yields:
+        (start, end, text) tuples with "HH:MM:SS.mmm" timestamps and the
+        cue lines joined by newlines, with tags removed
+    
+    Raises:
+        ValueError: If the file does not start with a WEBVTT header
+    """
+    with open(vtt_path, 'r', encoding='utf-8-sig') as f:
+        if not f.readline().startswith('WEBVTT'):
+            raise ValueError("Missing WEBVTT header")
+        
+        start: Optional[str] = None
+        end = ''
+        lines: List[str] = []
+        for line in f:
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                # A blank line ends the current block
+                if start is not None:
+                    text = _TAG_RE.sub('', '\n'.join(lines))
+                    if text:
+                        yield start, end, text
+                start = None
+                lines = []
+            elif start is not None:
+                lines.append(line)
+            elif '-->' in line:
+                cue_start, _, rest = line.partition('-->')
+                start = _normalize_timestamp(cue_start.strip())
+                end = _normalize_timestamp(rest.split(None, 1)[0])
+        
+        if start is not None:
+            text = _TAG_RE.sub('', '\n'.join(lines))
+            if text:
+                yield start, end, text
+
 
 class VTTParser:
     """Parser for WebVTT subtitle files."""
@@ -21,7 +87,7 @@ class VTTParser:
     def __init__(self):
         """Initialize the VTT parser."""
         self.segments = []
-        
+    
     def parse_file(self, vtt_file_path: Union[str, Path]) -> List[Dict]:
         """
         Parse a VTT file and return structured segments.
@@ -45,18 +111,20 @@ class VTTParser:
             raise ValueError(f"File must have .vtt extension: {vtt_file_path}")
         
         try:
-            captions = webvtt.read(str(vtt_path))
             segments = []
             
-            for caption in captions:
+            # Build segments straight from the cue stream in a single pass
+            for start, end, text in _iter_vtt(vtt_path):
+                start_seconds = self._time_to_seconds(start)
+                end_seconds = self._time_to_seconds(end)
                 segment = {
-                    "start": caption.start,
-                    "end": caption.end,
-                    "start_seconds": self._time_to_seconds(caption.start),
-                    "end_seconds": self._time_to_seconds(caption.end),
-                    "duration": self._time_to_seconds(caption.end) - self._time_to_seconds(caption.start),
-                    "text": self._clean_text(caption.text),
-                    "raw_text": caption.text
+                    "start": start,
+                    "end": end,
+                    "start_seconds": start_seconds,
+                    "end_seconds": end_seconds,
+                    "duration": end_seconds - start_seconds,
+                    "text": self._clean_text(text),
+                    "raw_text": text
                 }
                 segments.append(segment)
                 
@@ -78,6 +146,14 @@ class VTTParser:
         Returns:
             Time in seconds as float
         """
+        # Fast path for the fixed-width "HH:MM:SS.mmm" form WebVTT almost always uses
+        if len(time_str) == 12 and time_str[2] == ':' and time_str[5] == ':':
+            try:
+                return (int(time_str[0:2]) * 3600 + int(time_str[3:5]) * 60
+                        + float(time_str[6:].translate(_COMMA_TO_DOT)))
+            except ValueError:
+                pass
+        
         try:
             # Split by colon and dot
             parts = time_str.replace(',', '.').split(':')
@@ -115,16 +191,10 @@ class VTTParser:
             return ""
         
         # Remove HTML tags (common in VTT files)
-        import re
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Replace multiple whitespace with single space
-        text = re.sub(r'\s+', ' ', text)
+        text = _TAG_RE.sub('', text)
         
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        
-        return text
+        # Collapse whitespace runs and trim the ends in one pass
+        return ' '.join(text.split())
     
     def get_full_transcript(self, join_char: str = " ") -> str:
         """
@@ -145,6 +215,8 @@ class VTTParser:
         """
         Get segments within a specific time range.
         
+        Segments are expected in start-time order, as WebVTT cues are.
+        
         Args:
             start_seconds: Start time in seconds
             end_seconds: End time in seconds
@@ -155,9 +227,15 @@ class VTTParser:
         if not self.segments:
             return []
             
+        # Binary search for the run of segments starting inside the range,
+        # then keep those that also end inside it
+        start_key = itemgetter("start_seconds")
+        lo = bisect.bisect_left(self.segments, start_seconds, key=start_key)
+        hi = bisect.bisect_right(self.segments, end_seconds, lo=lo, key=start_key)
+        
         return [
-            segment for segment in self.segments
-            if segment["start_seconds"] >= start_seconds and segment["end_seconds"] <= end_seconds
+            segment for segment in self.segments[lo:hi]
+            if segment["end_seconds"] <= end_seconds
         ]
     
     def export_to_json(self, output_path: Union[str, Path], pretty: bool = True) -> None:
@@ -171,12 +249,18 @@ class VTTParser:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(self.segments, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(self.segments, f, ensure_ascii=False)
-                
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(
+                self.segments,
+                option=orjson.OPT_INDENT_2 if pretty else 0
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(self.segments, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(self.segments, f, ensure_ascii=False)
+        
         logger.info(f"Exported {len(self.segments)} segments to {output_path}")
     
     def get_stats(self) -> Dict:
@@ -194,15 +278,21 @@ class VTTParser:
                 "average_segment_duration": 0.0
             }
         
-        total_duration = max(segment["end_seconds"] for segment in self.segments)
-        total_words = sum(len(segment["text"].split()) for segment in self.segments)
-        avg_duration = sum(segment["duration"] for segment in self.segments) / len(self.segments)
+        # Gather every figure in a single pass over the segments
+        total_duration = 0.0
+        total_words = 0
+        duration_sum = 0.0
+        for segment in self.segments:
+            if segment["end_seconds"] > total_duration:
+                total_duration = segment["end_seconds"]
+            total_words += len(segment["text"].split())
+            duration_sum += segment["duration"]
         
         return {
             "total_segments": len(self.segments),
             "total_duration": total_duration,
             "total_words": total_words,
-            "average_segment_duration": avg_duration
+            "average_segment_duration": duration_sum / len(self.segments)
         }
 
 
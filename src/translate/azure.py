@@ -10,14 +10,42 @@ import aiohttp
 import json
 import logging
 import os
+import random
+import sys
 import time
-from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# uvloop speeds up socket readiness and task dispatch; it has no Windows build
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
 
 logger = logging.getLogger(__name__)
 
+# Azure Translator accepts at most 50,000 characters per request
+_MAX_REQUEST_CHARS = 50000
+
+# Number of translations each AzureTranslator keeps for repeated texts
+_TRANSLATION_CACHE_SIZE = 4096
+
+# Throttled and transient server responses worth retrying
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 30.0
+
 
 @dataclass
 class TranslationResult:
@@ -30,6 +58,36 @@ class TranslationResult:
     processing_time: float
 
 
+class _CharRateLimiter:
+    """
+    Token bucket that paces requests by the number of characters they carry.
+    
+    Callers reserve characters immediately and sleep off any deficit, so no
+    lock is needed and concurrent requests are spaced out in arrival order.
+    """
+    
+    def __init__(self, chars_per_second: float):
+        self.rate = chars_per_second
+        self._tokens = chars_per_second
+        self._updated = time.monotonic()
+    
+    async def acquire(self, chars: int) -> None:
+        """
+        Wait until the given number of characters may be sent.
+        
+        Args:
+            chars: Number of characters about to be sent
+        """
+        now = time.monotonic()
+        # The bucket holds at most one second's worth of characters
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= chars
+        
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
 class AzureTranslator:
     """Azure Cognitive Services Translator client."""
     
@@ -38,7 +96,9 @@ class AzureTranslator:
         subscription_key: Optional[str] = None,
         endpoint: Optional[str] = None,
         region: Optional[str] = None,
-        target_language: str = "pt"
+        target_language: str = "pt",
+        max_concurrency: int = 5,
+        max_chars_per_second: Optional[float] = None
     ):
         """
         Initialize the Azure Translator client.
@@ -48,27 +108,177 @@ class AzureTranslator:
             endpoint: Azure Translator endpoint URL
             region: Azure Translator region
             target_language: Target language code (default: 'pt' for Portuguese)
+            max_concurrency: Maximum number of batch requests in flight at once
+            max_chars_per_second: Character throughput cap to stay under the
+                Azure quota (unlimited if None)
         """
         self.subscription_key = subscription_key or os.getenv("AZURE_TRANSLATOR_KEY")
         self.endpoint = endpoint or os.getenv("AZURE_TRANSLATOR_ENDPOINT", 
                                              "https://api.cognitive.microsofttranslator.com")
         self.region = region or os.getenv("AZURE_TRANSLATOR_REGION", "eastus")
         self.target_language = target_language
+        self.max_concurrency = max_concurrency
+        self.max_chars_per_second = max_chars_per_second or float(
+            os.getenv("AZURE_TRANSLATOR_MAX_CHARS_PER_SECOND", 0)
+        ) or None
         
         if not self.subscription_key:
             raise ValueError("Azure Translator subscription key is required")
         
+        self._rate_limiter = (
+            _CharRateLimiter(self.max_chars_per_second) if self.max_chars_per_second else None
+        )
+        
         # API configuration
         self.api_version = "3.0"
         self.translate_url = f"{self.endpoint}/translator/text/v3.0/translate"
         self.detect_url = f"{self.endpoint}/detect"
         
+        # Query parameters for the common case, built once and shared by requests
+        self._base_params = {'api-version': self.api_version, 'to': self.target_language}
+        self._detect_params = {'api-version': self.api_version}
+        
         # Headers for API requests
         self.headers = {
             'Ocp-Apim-Subscription-Key': self.subscription_key,
             'Ocp-Apim-Subscription-Region': self.region,
             'Content-Type': 'application/json'
         }
+        
+        # Shared HTTP session, created lazily on first request
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # LRU of translations keyed by (source language, target language, text)
+        self._translation_cache: "OrderedDict[Tuple[Optional[str], str, str], TranslationResult]" = OrderedDict()
+    
+    async def __aenter__(self) -> "AzureTranslator":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it if needed.
+        
+        Reusing one session keeps its connection pool, so consecutive
+        requests skip the TCP and TLS handshakes. A session is bound to the
+        event loop that created it, so a new one is opened when called
+        from a different loop (e.g. a later asyncio.run). Call aclose()
+        before a loop ends; its connections cannot be released afterwards.
+        
+        Returns:
+            Open aiohttp ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        
+        if self._session is not None and self._session_loop is not loop:
+            if not self._session.closed:
+                logger.warning(
+                    "Translator session was not closed before its event loop "
+                    "ended; call aclose() to release its connections"
+                )
+                await self._session.close()
+            self._session = None
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                ),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=_orjson_dumps if orjson is not None else json.dumps
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _translate_params(
+        self,
+        source_language: Optional[str],
+        target_language: str
+    ) -> Dict[str, str]:
+        """
+        Return the query parameters for a translate request.
+        
+        Args:
+            source_language: Source language code (auto-detect if None)
+            target_language: Target language code
+        
+        Returns:
+            The shared default parameters, or a copy with the overrides applied
+        """
+        if not source_language and target_language == self.target_language:
+            return self._base_params
+        
+        params = {**self._base_params, 'to': target_language}
+        
+        if source_language:
+            params['from'] = source_language
+        
+        return params
+    
+    async def _post_with_retry(
+        self,
+        url: str,
+        params: Dict[str, str],
+        body: List[Dict[str, str]],
+        error_message: str,
+        max_attempts: int = 3
+    ) -> List[Dict]:
+        """
+        POST a JSON body and return the decoded response.
+        
+        Throttled (429) and transient 5xx responses, connection errors and
+        timeouts are retried with exponential backoff and jitter, honoring
+        Retry-After when present.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            body: JSON request body
+            error_message: Prefix of the exception raised on failure
+            max_attempts: Maximum number of attempts, including the first
+        
+        Returns:
+            Decoded JSON response
+        """
+        session = await self._get_session()
+        
+        for attempt in range(max_attempts):
+            try:
+                async with session.post(url, params=params, json=body) as response:
+                    if response.status == 200:
+                        if orjson is not None:
+                            return orjson.loads(await response.read())
+                        return await response.json()
+                    
+                    if response.status not in _RETRY_STATUSES or attempt == max_attempts - 1:
+                        error_text = await response.text()
+                        raise Exception(f"{error_message} {response.status}: {error_text}")
+                    
+                    delay = _retry_delay(attempt, response.headers.get('Retry-After'))
+                    reason = str(response.status)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == max_attempts - 1:
+                    raise
+                delay = _retry_delay(attempt)
+                reason = repr(e)
+            
+            logger.warning(f"{error_message} {reason}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        
+        raise Exception(f"{error_message}: no request made (max_attempts={max_attempts})")
     
     async def translate_text(
         self,
@@ -88,51 +298,38 @@ class AzureTranslator:
             TranslationResult object
         """
         target_lang = target_language or self.target_language
-        
-        # Prepare request parameters
-        params = {
-            'api-version': self.api_version,
-            'to': target_lang
-        }
-        
-        if source_language:
-            params['from'] = source_language
+        params = self._translate_params(source_language, target_lang)
         
         # Prepare request body
         body = [{'text': text}]
         
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(len(text))
+        
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.translate_url,
-                    params=params,
-                    headers=self.headers,
-                    json=body
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Translation API error {response.status}: {error_text}")
-                    
-                    result = await response.json()
-                    
-                    # Extract translation result
-                    translation_data = result[0]
-                    detected_language = translation_data.get('detectedLanguage', {}).get('language', source_language or 'unknown')
-                    translated_text = translation_data['translations'][0]['text']
-                    confidence = translation_data.get('detectedLanguage', {}).get('score', 1.0)
-                    
-                    processing_time = time.time() - start_time
-                    
-                    return TranslationResult(
-                        original_text=text,
-                        translated_text=translated_text,
-                        source_language=detected_language,
-                        target_language=target_lang,
-                        confidence=confidence,
-                        processing_time=processing_time
-                    )
+            result = await self._post_with_retry(
+                self.translate_url, params, body, "Translation API error"
+            )
+            
+            # Extract translation result
+            translation_data = result[0]
+            detected = translation_data.get('detectedLanguage') or {}
+            detected_language = detected.get('language', source_language or 'unknown')
+            translated_text = translation_data['translations'][0]['text']
+            confidence = detected.get('score', 1.0)
+            
+            processing_time = time.time() - start_time
+            
+            return TranslationResult(
+                original_text=text,
+                translated_text=translated_text,
+                source_language=detected_language,
+                target_language=target_lang,
+                confidence=confidence,
+                processing_time=processing_time
+            )
         
         except Exception as e:
             logger.error(f"Translation error: {e}")
@@ -148,6 +345,12 @@ class AzureTranslator:
         """
         Translate multiple texts in batches.
         
+        Batches are sent concurrently, at most max_concurrency at a time,
+        and results are returned in the order of texts. Each distinct text
+        is requested once and recently translated texts are served from an
+        LRU cache. Empty or whitespace-only texts are not sent; they get an
+        empty translation.
+        
         Args:
             texts: List of texts to translate
             source_language: Source language code (auto-detect if None)
@@ -157,17 +360,123 @@ class AzureTranslator:
         Returns:
             List of TranslationResult objects
         """
-        results = []
-        
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_results = await self._translate_batch_internal(
-                batch, source_language, target_language
+        target_lang = target_language or self.target_language
+        cache = self._translation_cache
+        
+        # Collapse repeats and serve cached texts; only the rest go to Azure
+        found = {}
+        missing = []
+        for text in dict.fromkeys(text for text in texts if text and text.strip()):
+            key = (source_language, target_lang, text)
+            if key in cache:
+                cache.move_to_end(key)
+                found[text] = cache[key]
+            else:
+                missing.append(text)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Dispatch all batches at once; gather keeps them in order
+        batch_results = await asyncio.gather(*(
+            self._translate_batch_bounded(semaphore, batch, source_language, target_language)
+            for batch in _split_batches(missing, batch_size)
+        ))
+        
+        translated = (result for results in batch_results for result in results)
+        for text, result in zip(missing, translated):
+            found[text] = result
+            cache[(source_language, target_lang, text)] = result
+        
+        while len(cache) > _TRANSLATION_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        # Expand back to the order of texts; blank texts need no round-trip
+        return [
+            found[text] if text and text.strip() else TranslationResult(
+                original_text=text,
+                translated_text='',
+                source_language=source_language or 'unknown',
+                target_language=target_lang,
+                confidence=1.0,
+                processing_time=0.0
             )
-            results.extend(batch_results)
+            for text in texts
+        ]
+    
+    async def iter_translate_batch(
+        self,
+        texts: List[str],
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[TranslationResult]:
+        """
+        Translate texts and yield the results in order as batches complete.
+        
+        At most max_concurrency batches are in flight or waiting to be
+        consumed, so long inputs are not held in memory all at once the
+        way translate_batch holds them.
+        
+        Args:
+            texts: List of texts to translate
+            source_language: Source language code (auto-detect if None)
+            target_language: Target language code (uses instance default if None)
+            batch_size: Maximum number of texts per batch
+        
+        Yields:
+            TranslationResult objects, one per text
+        """
+        batches = iter(_split_batches(texts, batch_size))
+        in_flight = deque(
+            asyncio.ensure_future(self.translate_batch(batch, source_language, target_language, batch_size))
+            for batch in islice(batches, self.max_concurrency)
+        )
+        
+        try:
+            while in_flight:
+                results = await in_flight.popleft()
+                
+                # Keep the window full before handing results to the consumer
+                batch = next(batches, None)
+                if batch is not None:
+                    in_flight.append(asyncio.ensure_future(
+                        self.translate_batch(batch, source_language, target_language, batch_size)
+                    ))
+                
+                for result in results:
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Wait for the cancellations so no task is left pending or unretrieved
+            await asyncio.gather(*in_flight, return_exceptions=True)
+    
+    async def _translate_batch_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        texts: List[str],
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate a single batch once a concurrency slot is free.
         
-        return results
+        Args:
+            semaphore: Semaphore bounding the number of requests in flight
+            texts: List of texts to translate
+            source_language: Source language code
+            target_language: Target language code
+        
+        Returns:
+            List of TranslationResult objects
+        """
+        async with semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(sum(map(len, texts)))
+            
+            return await self._translate_batch_internal(
+                texts, source_language, target_language
+            )
     
     async def _translate_batch_internal(
         self,
@@ -187,15 +496,7 @@ class AzureTranslator:
             List of TranslationResult objects
         """
         target_lang = target_language or self.target_language
-        
-        # Prepare request parameters
-        params = {
-            'api-version': self.api_version,
-            'to': target_lang
-        }
-        
-        if source_language:
-            params['from'] = source_language
+        params = self._translate_params(source_language, target_lang)
         
         # Prepare request body
         body = [{'text': text} for text in texts]
@@ -203,37 +504,33 @@ class AzureTranslator:
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.translate_url,
-                    params=params,
-                    headers=self.headers,
-                    json=body
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Translation API error {response.status}: {error_text}")
-                    
-                    results_data = await response.json()
-                    processing_time = time.time() - start_time
-                    
-                    # Process results
-                    results = []
-                    for i, result_data in enumerate(results_data):
-                        detected_language = result_data.get('detectedLanguage', {}).get('language', source_language or 'unknown')
-                        translated_text = result_data['translations'][0]['text']
-                        confidence = result_data.get('detectedLanguage', {}).get('score', 1.0)
-                        
-                        results.append(TranslationResult(
-                            original_text=texts[i],
-                            translated_text=translated_text,
-                            source_language=detected_language,
-                            target_language=target_lang,
-                            confidence=confidence,
-                            processing_time=processing_time / len(texts)  # Distribute time across texts
-                        ))
-                    
-                    return results
+            results_data = await self._post_with_retry(
+                self.translate_url, params, body, "Translation API error"
+            )
+            if len(results_data) != len(texts):
+                raise Exception(
+                    f"Translation API error: expected {len(texts)} results, got {len(results_data)}"
+                )
+            
+            # Distribute time across texts
+            processing_time = (time.time() - start_time) / len(texts)
+            fallback_language = source_language or 'unknown'
+            
+            # Process results
+            results: List[TranslationResult] = []
+            for text, result_data in zip(texts, results_data):
+                detected = result_data.get('detectedLanguage') or {}
+                
+                results.append(TranslationResult(
+                    original_text=text,
+                    translated_text=result_data['translations'][0]['text'],
+                    source_language=detected.get('language', fallback_language),
+                    target_language=target_lang,
+                    confidence=detected.get('score', 1.0),
+                    processing_time=processing_time
+                ))
+            
+            return results
         
         except Exception as e:
             logger.error(f"Batch translation error: {e}")
@@ -249,34 +546,64 @@ class AzureTranslator:
         Returns:
             Dictionary with language code and confidence score
         """
-        params = {
-            'api-version': self.api_version
-        }
+        params = self._detect_params
         
         body = [{'text': text}]
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.detect_url,
-                    params=params,
-                    headers=self.headers,
-                    json=body
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Language detection API error {response.status}: {error_text}")
-                    
-                    result = await response.json()
-                    detection_data = result[0]
-                    
-                    return {
+            result = await self._post_with_retry(
+                self.detect_url, params, body, "Language detection API error"
+            )
+            detection_data = result[0]
+            
+            return {
+                'language': detection_data['language'],
+                'confidence': detection_data['score']
+            }
+        
+        except Exception as e:
+            logger.error(f"Language detection error: {e}")
+            raise
+    
+    async def detect_languages_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 100
+    ) -> List[Dict[str, Union[str, float]]]:
+        """
+        Detect the language of multiple texts in batches.
+        
+        Args:
+            texts: List of texts to analyze
+            batch_size: Maximum number of texts per request
+        
+        Returns:
+            List of dictionaries with language code and confidence score
+        """
+        params = self._detect_params
+        
+        results: List[Dict[str, Union[str, float]]] = []
+        
+        try:
+            for i in range(0, len(texts), batch_size):
+                body = [{'text': text} for text in texts[i:i + batch_size]]
+                
+                results_data = await self._post_with_retry(
+                    self.detect_url, params, body, "Language detection API error"
+                )
+                
+                results.extend(
+                    {
                         'language': detection_data['language'],
                         'confidence': detection_data['score']
                     }
+                    for detection_data in results_data
+                )
+            
+            return results
         
         except Exception as e:
-            logger.error(f"Language detection error: {e}")
+            logger.error(f"Batch language detection error: {e}")
             raise
     
     async def translate_segments(
@@ -299,41 +626,185 @@ class AzureTranslator:
         if not segments:
             return []
         
-        # Extract texts from segments
-        texts = []
-        for segment in segments:
-            text = segment.get('text', '') or segment.get('raw_text', '')
+        texts = [
+            segment.get('text') or segment.get('raw_text') or ''
+            for segment in segments
+        ]
+        for segment, text in zip(segments, texts):
             if not text:
                 logger.warning(f"Segment missing text: {segment}")
-                text = ""
-            texts.append(text)
         
-        # Translate texts
+        # Translate all texts in as few requests as the API limits allow;
+        # translate_batch skips the empty ones and returns one result per text
         translation_results = await self.translate_batch(
             texts, source_language, target_language
         )
         
-        # Add translation results to segments
-        translated_segments = []
-        for i, segment in enumerate(segments):
-            translated_segment = segment.copy()
-            
-            if i < len(translation_results):
-                result = translation_results[i]
-                translated_segment['text_translated'] = result.translated_text
-                translated_segment['translation_confidence'] = result.confidence
-                translated_segment['source_language'] = result.source_language
-                translated_segment['target_language'] = result.target_language
-            else:
-                # Fallback for missing translations
-                translated_segment['text_translated'] = translated_segment.get('text', '')
-                translated_segment['translation_confidence'] = 0.0
-                translated_segment['source_language'] = source_language or 'unknown'
-                translated_segment['target_language'] = target_language or self.target_language
-            
-            translated_segments.append(translated_segment)
-        
-        return translated_segments
+        return [
+            {
+                **segment,
+                'text_translated': result.translated_text,
+                'translation_confidence': result.confidence,
+                'source_language': result.source_language,
+                'target_language': result.target_language,
+            }
+            for segment, result in zip(segments, translation_results)
+        ]
+
+
+def _orjson_dumps(obj: object) -> str:
+    """Serialize a request body with orjson; aiohttp expects a str."""
+    return orjson.dumps(obj).decode()
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Compute how long to wait before retrying a request.
+    
+    Args:
+        attempt: Zero-based number of the attempt that failed
+        retry_after: Value of the response's Retry-After header, if any
+    
+    Returns:
+        Delay in seconds, capped at _MAX_RETRY_DELAY
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), _MAX_RETRY_DELAY)
+        except ValueError:
+            # HTTP-date form; fall back to exponential backoff
+            pass
+    
+    return min(2 ** attempt + random.random(), _MAX_RETRY_DELAY)
+
+
+def _split_batches(
+    texts: List[str],
+    batch_size: int,
+    max_chars: int = _MAX_REQUEST_CHARS
+) -> List[List[str]]:
+    """
+    Split texts into request-sized batches.
+    
+    A batch is closed when it reaches batch_size items or when the next
+    text would push its total length past max_chars.
+    
+    Args:
+        texts: List of texts to split
+        batch_size: Maximum number of texts per batch
+        max_chars: Maximum total characters per batch
+    
+    Returns:
+        List of batches, preserving the order of texts
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_chars = 0
+    
+    for text in texts:
+        if batch and (len(batch) == batch_size or batch_chars + len(text) > max_chars):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += len(text)
+    
+    if batch:
+        batches.append(batch)
+    
+    return batches
+
+
+def _run(coro):
+    """Run a coroutine on a new event loop, using uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
+# Translators shared by the convenience functions, keyed by event loop and settings
+_translator_cache: Dict[
+    Tuple[asyncio.AbstractEventLoop, Optional[str], Optional[str], Optional[str], str],
+    AzureTranslator
+] = {}
+
+# Per-loop tasks that close the loop's cached translators when it shuts down
+_shutdown_tasks: "Dict[asyncio.AbstractEventLoop, asyncio.Task[None]]" = {}
+
+
+async def _close_on_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Wait until the loop shuts down, then close its cached translators.
+    
+    asyncio.run and asyncio.Runner cancel leftover tasks before closing
+    their loop, so the sessions are closed while the loop can still run.
+    """
+    try:
+        await loop.create_future()
+    finally:
+        _shutdown_tasks.pop(loop, None)
+        await close_translators()
+
+
+def _get_translator(
+    subscription_key: Optional[str],
+    endpoint: Optional[str],
+    region: Optional[str],
+    target_language: str
+) -> AzureTranslator:
+    """
+    Return the cached translator for these settings, creating it on first use.
+    
+    Reusing the translator keeps its HTTP session warm across calls on the
+    same event loop. Its session is closed when the loop shuts down.
+    
+    Args:
+        subscription_key: Azure Translator subscription key
+        endpoint: Azure Translator endpoint URL
+        region: Azure Translator region
+        target_language: Target language code
+    
+    Returns:
+        Shared AzureTranslator instance
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, subscription_key, endpoint, region, target_language)
+    translator = _translator_cache.get(key)
+    
+    if translator is None:
+        if loop not in _shutdown_tasks:
+            _shutdown_tasks[loop] = loop.create_task(_close_on_shutdown(loop))
+        
+        translator = AzureTranslator(
+            subscription_key=subscription_key,
+            endpoint=endpoint,
+            region=region,
+            target_language=target_language
+        )
+        _translator_cache[key] = translator
+    
+    return translator
+
+
+async def close_translators() -> None:
+    """
+    Close the sessions of the running loop's cached translators.
+    
+    Translators cached by loops that are already closed are dropped too.
+    """
+    loop = asyncio.get_running_loop()
+    translators = []
+    
+    for key in list(_translator_cache):
+        if key[0] is loop:
+            translators.append(_translator_cache.pop(key))
+        elif key[0].is_closed():
+            del _translator_cache[key]
+    
+    for translator in translators:
+        await translator.aclose()
 
 
 # Standalone functions for convenience
@@ -359,12 +830,7 @@ async def translate_text(
     Returns:
         TranslationResult object
     """
-    translator = AzureTranslator(
-        subscription_key=subscription_key,
-        endpoint=endpoint,
-        region=region,
-        target_language=target_language
-    )
+    translator = _get_translator(subscription_key, endpoint, region, target_language)
     
     return await translator.translate_text(text, source_language, target_language)
 
@@ -391,12 +857,7 @@ async def translate_segments_async(
     Returns:
         List of segments with added translation fields
     """
-    translator = AzureTranslator(
-        subscription_key=subscription_key,
-        endpoint=endpoint,
-        region=region,
-        target_language=target_language
-    )
+    translator = _get_translator(subscription_key, endpoint, region, target_language)
     
     return await translator.translate_segments(segments, source_language, target_language)
 
@@ -408,10 +869,16 @@ def translate_segments(
     subscription_key: Optional[str] = None,
     endpoint: Optional[str] = None,
     region: Optional[str] = None
-) -> List[Dict]:
+) -> Union[List[Dict], "asyncio.Future[List[Dict]]"]:
     """
     Synchronous wrapper for translate_segments_async.
     
+    Without a running event loop the translation runs on a new one, backed
+    by uvloop when it is installed. asyncio.run cannot be nested, so when
+    called while an event loop is already running (e.g. Jupyter or an async
+    web handler) the translation is scheduled on that loop and the returned
+    future must be awaited.
+    
     Args:
         segments: List of segment dictionaries with 'text' key
         source_language: Source language code (auto-detect if None)
@@ -421,9 +888,17 @@ def translate_segments(
         region: Azure Translator region
         
     Returns:
-        List of segments with added translation fields
+        List of segments with added translation fields, or a future
+        resolving to it when an event loop is already running
     """
-    return asyncio.run(translate_segments_async(
+    coro = translate_segments_async(
         segments, source_language, target_language,
         subscription_key, endpoint, region
-    ))
+    )
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run(coro)
+    
+    return asyncio.ensure_future(coro)
@@ -4,6 +4,7 @@ Email utility module for sending meeting minutes via email.
 This module provides functionality to send generated PDF documents via email.
 """
 
+import gzip
 import logging
 import smtplib
 from email.mime.application import MIMEApplication
@@ -55,7 +56,8 @@ class EmailSender:
         from_email: Optional[str] = None,
         cc_emails: Optional[List[str]] = None,
         bcc_emails: Optional[List[str]] = None,
-        additional_attachments: Optional[List[Union[str, Path]]] = None
+        additional_attachments: Optional[List[Union[str, Path]]] = None,
+        compress_pdf: bool = False
     ) -> bool:
         """
         Send meeting minutes PDF via email.
@@ -68,6 +70,7 @@ class EmailSender:
             cc_emails: List of CC email addresses
             bcc_emails: List of BCC email addresses
             additional_attachments: List of additional files to attach
+            compress_pdf: Whether to gzip the PDF before attaching it
             
         Returns:
             True if email was sent successfully, False otherwise
@@ -90,24 +93,34 @@ class EmailSender:
         if cc_emails:
             msg['Cc'] = ', '.join(cc_emails)
         
-        # Email body
-        body = self._create_email_body(meeting_title, pdf_path)
-        msg.attach(MIMEText(body, 'html', 'utf-8'))
-        
         # Attach PDF
         try:
             with open(pdf_path, 'rb') as f:
-                pdf_attachment = MIMEApplication(f.read(), _subtype='pdf')
-                pdf_attachment.add_header(
-                    'Content-Disposition',
-                    'attachment',
-                    filename=pdf_path.name
-                )
-                msg.attach(pdf_attachment)
+                pdf_data = f.read()
+            
+            if compress_pdf:
+                # Shrinks the base64 payload for text-heavy PDFs
+                pdf_data = gzip.compress(pdf_data, compresslevel=9)
+                pdf_attachment = MIMEApplication(pdf_data, _subtype='gzip')
+                attachment_name = f"{pdf_path.name}.gz"
+            else:
+                pdf_attachment = MIMEApplication(pdf_data, _subtype='pdf')
+                attachment_name = pdf_path.name
+            
+            pdf_attachment.add_header(
+                'Content-Disposition',
+                'attachment',
+                filename=attachment_name
+            )
         except Exception as e:
             logger.error(f"Error attaching PDF: {e}")
             return False
         
+        # Email body describes the file actually attached
+        body = self._create_email_body(meeting_title, attachment_name, len(pdf_data))
+        msg.attach(MIMEText(body, 'html', 'utf-8'))
+        msg.attach(pdf_attachment)
+        
         # Attach additional files
         if additional_attachments:
             for file_path in additional_attachments:
@@ -117,13 +130,14 @@ class EmailSender:
         # Send email
         return self._send_email(msg, to_email, cc_emails, bcc_emails)
     
-    def _create_email_body(self, meeting_title: str, pdf_path: Path) -> str:
+    def _create_email_body(self, meeting_title: str, filename: str, size_bytes: int) -> str:
         """
         Create HTML email body.
         
         Args:
             meeting_title: Meeting title
-            pdf_path: Path to PDF file
+            filename: Name of the attached PDF file
+            size_bytes: Size of the attached PDF file in bytes
             
         Returns:
             HTML email body
@@ -180,8 +194,8 @@ class EmailSender:
                 
                 <div class="attachment-info">
                     <h4>📎 Arquivo Anexo:</h4>
-                    <p><strong>{pdf_path.name}</strong></p>
-                    <p>Tamanho: {self._format_file_size(pdf_path.stat().st_size)}</p>
+                    <p><strong>{filename}</strong></p>
+                    <p>Tamanho: {self._format_file_size(size_bytes)}</p>
                 </div>
                 
                 <p>O documento contém as seguintes seções:</p>
@@ -307,13 +321,11 @@ class EmailSender:
         if size_bytes == 0:
             return "0 B"
         
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024
-            i += 1
+        size_names = ("B", "KB", "MB", "GB")
+        # Each unit is 2**10 times the previous one, so the bit length picks it directly
+        i = min(len(size_names) - 1, (size_bytes.bit_length() - 1) // 10)
         
-        return f"{size_bytes:.1f} {size_names[i]}"
+        return f"{size_bytes / (1 << (i * 10)):.1f} {size_names[i]}"
     
     def test_connection(self) -> bool:
         """
@@ -341,7 +353,8 @@ def send_meeting_minutes(
     to_email: str,
     meeting_title: str = "Ata de Reunião",
     from_email: Optional[str] = None,
-    cc_emails: Optional[List[str]] = None
+    cc_emails: Optional[List[str]] = None,
+    compress_pdf: bool = False
 ) -> bool:
     """
     Convenience function to send meeting minutes via email.
@@ -352,6 +365,7 @@ def send_meeting_minutes(
         meeting_title: Meeting title for subject
         from_email: Sender email address
         cc_emails: List of CC email addresses
+        compress_pdf: Whether to gzip the PDF before attaching it
         
     Returns:
         True if email was sent successfully, False otherwise
@@ -359,7 +373,12 @@ def send_meeting_minutes(
     try:
         sender = EmailSender()
         return sender.send_meeting_minutes(
-            pdf_path, to_email, meeting_title, from_email, cc_emails
+            pdf_path=pdf_path,
+            to_email=to_email,
+            meeting_title=meeting_title,
+            from_email=from_email,
+            cc_emails=cc_emails,
+            compress_pdf=compress_pdf
         )
     except Exception as e:
         logger.error(f"Error sending meeting minutes: {e}")
@@ -4,21 +4,70 @@ Utility helpers module for common functionality.
 This module provides common utility functions used throughout the Verba pipeline.
 """
 
+import asyncio
+import atexit
+import bisect
+import datetime
 import logging
+import logging.handlers
+import queue
 import time
-from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
 import hashlib
 import json
+import mmap
 import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
 
 
 logger = logging.getLogger(__name__)
 
+# Records are handed off to a background listener so formatting and I/O
+# happen off the producer threads
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 T = TypeVar('T')
 
+# Pricing as of 2024 (approximate)
+_PRICING = MappingProxyType({
+    "gpt-4o": 0.03,  # $0.03 per 1K tokens
+    "gpt-4": 0.06,   # $0.06 per 1K tokens
+    "gpt-3.5-turbo": 0.002,  # $0.002 per 1K tokens
+    "azure-translator": 0.01,  # $0.01 per 1K characters
+})
+_DEFAULT_RATE = _PRICING["gpt-4o"]
+
+# Environment variables the pipeline cannot run without
+_REQUIRED_ENV_VARS = (
+    "AZURE_OPENAI_KEY",
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_TRANSLATOR_KEY",
+    "AZURE_TRANSLATOR_ENDPOINT"
+)
+
+# Precompiled patterns for chunk_text and the string utilities below
+_SENTENCE_END = re.compile(r'\. ')
+_WORD_BREAK = re.compile(r' ')
+_SLUG_NONWORD = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+_FILENAME_DELETE_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+_FILENAME_WS = re.compile(r'\s+')
+_VIDEO_ID_RE = re.compile(r'(?:v=|/|embed/|watch\?v=|youtu\.be/)([0-9A-Za-z_-]{11})')
+
 
 def timing_decorator(func: Callable[..., T]) -> Callable[..., T]:
     """
@@ -32,14 +81,16 @@ def timing_decorator(func: Callable[..., T]) -> Callable[..., T]:
     """
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.info(f"{func.__name__} executed in {execution_time:.2f} seconds")
+            # Skip building the message when INFO records would be discarded anyway
+            if logger.isEnabledFor(logging.INFO):
+                execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+                logger.info(f"{func.__name__} executed in {execution_time:.2f} seconds")
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             logger.error(f"{func.__name__} failed after {execution_time:.2f} seconds: {e}")
             raise
     return wrapper
@@ -65,6 +116,10 @@ def chunk_text(text: str, max_tokens: int = 7500, overlap: int = 0) -> List[str]
     if len(text) <= max_chars:
         return [text]
     
+    # Offsets of every sentence ending and word break, found in a single scan each
+    sentence_ends = [m.start() for m in _SENTENCE_END.finditer(text)]
+    word_ends = [m.start() for m in _WORD_BREAK.finditer(text)]
+    
     chunks = []
     start = 0
     
@@ -74,12 +129,14 @@ def chunk_text(text: str, max_tokens: int = 7500, overlap: int = 0) -> List[str]
         # If this is not the last chunk, try to break at a sentence boundary
         if end < len(text):
             # Look for sentence endings within the last 500 characters
-            sentence_end = text.rfind('. ', start, end)
+            i = bisect.bisect_right(sentence_ends, end - 2) - 1
+            sentence_end = sentence_ends[i] if i >= 0 else -1
             if sentence_end > start and (end - sentence_end) < 500:
                 end = sentence_end + 2
             else:
                 # Look for word boundaries
-                word_end = text.rfind(' ', start, end)
+                i = bisect.bisect_right(word_ends, end - 1) - 1
+                word_end = word_ends[i] if i >= 0 else -1
                 if word_end > start and (end - word_end) < 100:
                     end = word_end
         
@@ -95,43 +152,49 @@ def chunk_text(text: str, max_tokens: int = 7500, overlap: int = 0) -> List[str]
     return chunks
 
 
-def chunk_segments(segments: List[Dict], max_tokens: int = 7500) -> List[List[Dict]]:
+def iter_chunk_segments(segments: Iterable[Dict], max_tokens: int = 7500) -> Iterator[List[Dict]]:
     """
-    Split segments into chunks based on token count.
+    Lazily split segments into chunks based on token count.
     
     Args:
-        segments: List of segments from VTT parser
+        segments: Segments from VTT parser
         max_tokens: Maximum tokens per chunk
         
-    Returns:
-        List of segment chunks
+    Yields:
+        Segment chunks, one at a time
     """
-    if not segments:
-        return []
-    
-    chunks = []
     current_chunk = []
     current_tokens = 0
     
     for segment in segments:
-        # Estimate tokens (≈4 characters per token)
-        text = segment.get('text', '') or segment.get('text_translated', '')
-        segment_tokens = len(text) // 4
+        segment_tokens = estimate_tokens(segment.get('text') or segment.get('text_translated') or '')
         
         # Check if adding this segment would exceed the limit
         if current_tokens + segment_tokens > max_tokens and current_chunk:
-            chunks.append(current_chunk)
+            yield current_chunk
             current_chunk = []
             current_tokens = 0
         
         current_chunk.append(segment)
         current_tokens += segment_tokens
     
-    # Add the last chunk if it has segments
+    # Yield the last chunk if it has segments
     if current_chunk:
-        chunks.append(current_chunk)
+        yield current_chunk
+
+
+def chunk_segments(segments: List[Dict], max_tokens: int = 7500) -> List[List[Dict]]:
+    """
+    Split segments into chunks based on token count.
     
-    return chunks
+    Args:
+        segments: List of segments from VTT parser
+        max_tokens: Maximum tokens per chunk
+        
+    Returns:
+        List of segment chunks
+    """
+    return list(iter_chunk_segments(segments, max_tokens))
 
 
 def estimate_tokens(text: str) -> int:
@@ -144,13 +207,11 @@ def estimate_tokens(text: str) -> int:
     Returns:
         Estimated number of tokens
     """
-    if not text:
-        return 0
-    
     # Simple estimation: ≈4 characters per token
-    return len(text) // 4
+    return len(text) >> 2 if text else 0
 
 
+@lru_cache(maxsize=64)
 def calculate_cost(tokens: int, model: str = "gpt-4o") -> float:
     """
     Calculate estimated cost for token usage.
@@ -162,16 +223,7 @@ def calculate_cost(tokens: int, model: str = "gpt-4o") -> float:
     Returns:
         Estimated cost in USD
     """
-    # Pricing as of 2024 (approximate)
-    pricing = {
-        "gpt-4o": 0.03,  # $0.03 per 1K tokens
-        "gpt-4": 0.06,   # $0.06 per 1K tokens
-        "gpt-3.5-turbo": 0.002,  # $0.002 per 1K tokens
-        "azure-translator": 0.01,  # $0.01 per 1K characters
-    }
-    
-    rate = pricing.get(model, pricing["gpt-4o"])
-    return (tokens / 1000) * rate
+    return (tokens / 1000) * _PRICING.get(model, _DEFAULT_RATE)
 
 
 def generate_slug(text: str, max_length: int = 50) -> str:
@@ -185,11 +237,9 @@ def generate_slug(text: str, max_length: int = 50) -> str:
     Returns:
         URL-friendly slug
     """
-    import re
-    
     # Convert to lowercase and replace spaces with hyphens
-    slug = re.sub(r'[^\w\s-]', '', text.lower())
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = _SLUG_NONWORD.sub('', text.lower())
+    slug = _SLUG_DASH.sub('-', slug)
     
     # Truncate to max length
     if len(slug) > max_length:
@@ -202,6 +252,7 @@ def generate_slug(text: str, max_length: int = 50) -> str:
     return slug.strip('-')
 
 
+@lru_cache(maxsize=256)
 def extract_video_id(url: str) -> Optional[str]:
     """
     Extract video ID from YouTube URL.
@@ -212,21 +263,8 @@ def extract_video_id(url: str) -> Optional[str]:
     Returns:
         Video ID if found, None otherwise
     """
-    import re
-    
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'(?:watch\?v=)([0-9A-Za-z_-]{11})',
-        r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def create_output_directory(base_dir: Union[str, Path], video_id: str) -> Path:
@@ -240,11 +278,10 @@ def create_output_directory(base_dir: Union[str, Path], video_id: str) -> Path:
     Returns:
         Path to the created directory
     """
-    base_path = Path(base_dir)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_dir = base_path / f"{video_id}_{timestamp}"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    output_dir = os.path.join(base_dir, f"{video_id}_{timestamp}")
+    os.makedirs(output_dir, exist_ok=True)
+    return Path(output_dir)
 
 
 def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
@@ -264,8 +301,11 @@ def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
         return {}
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        if orjson is not None:
+            config = orjson.loads(config_path.read_bytes())
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
         logger.info(f"Configuration loaded from {config_path}")
         return config
     except Exception as e:
@@ -273,6 +313,30 @@ def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
         return {}
 
 
+def _normalize(obj: Any) -> Any:
+    """
+    Convert values the json module cannot encode into JSON-friendly ones.
+    
+    Args:
+        obj: Value to normalize
+    
+    Returns:
+        Normalized value
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else str(key): _normalize(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_normalize(item) for item in obj]
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    return str(obj)
+
+
 def save_metadata(output_dir: Path, metadata: Dict[str, Any]) -> None:
     """
     Save processing metadata to JSON file.
@@ -284,30 +348,75 @@ def save_metadata(output_dir: Path, metadata: Dict[str, Any]) -> None:
     metadata_file = output_dir / "metadata.json"
     
     try:
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+        # Normalize up front so both backends write the same values
+        metadata = _normalize(metadata)
+        if orjson is not None:
+            metadata_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(metadata_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2, ensure_ascii=False)
         logger.info(f"Metadata saved to {metadata_file}")
     except Exception as e:
         logger.error(f"Error saving metadata: {e}")
 
 
-def compute_file_hash(file_path: Union[str, Path]) -> str:
+def compute_file_hash(file_path: Union[str, Path], algorithm: str = "sha256") -> str:
     """
-    Compute SHA-256 hash of a file.
+    Compute the hash of a file.
     
     Args:
         file_path: Path to the file
+        algorithm: Hash algorithm; "sha256" (default), any other hashlib
+            algorithm name, or "blake3" for a faster, multithreaded
+            cryptographic hash (requires the optional blake3 package)
         
     Returns:
-        SHA-256 hash string
+        Hex digest string
     """
-    hash_sha256 = hashlib.sha256()
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("The blake3 package is required for algorithm='blake3'")
+        blake3_hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        blake3_hasher.update_mmap(file_path)
+        return blake3_hasher.hexdigest()
     
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_sha256.update(chunk)
+        # Hash straight from the page cache via mmap, avoiding a copy per block
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.new(algorithm, mm).hexdigest()
+        except (OSError, ValueError):
+            # Empty files and non-regular files cannot be mapped
+            pass
+        
+        # hashlib.file_digest (Python 3.11+) runs the read/update loop in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        
+        hasher = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    
+    return hasher.hexdigest()
+
+
+async def compute_file_hash_async(file_path: Union[str, Path], algorithm: str = "sha256") -> str:
+    """
+    Compute the hash of a file without blocking the event loop.
     
-    return hash_sha256.hexdigest()
+    The hash runs in a worker thread; hashlib releases the GIL while hashing,
+    so several files can be hashed in parallel with asyncio.gather.
+    
+    Args:
+        file_path: Path to the file
+        algorithm: Hash algorithm (see compute_file_hash)
+    
+    Returns:
+        Hex digest string
+    """
+    return await asyncio.to_thread(compute_file_hash, file_path, algorithm)
 
 
 def setup_logging(
@@ -323,18 +432,31 @@ def setup_logging(
         log_file: Optional log file path
         log_format: Optional log format string
     """
+    global _log_listener
+    
     if log_format is None:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(),
-            *([] if log_file is None else [logging.FileHandler(log_file)])
-        ]
-    )
+    level = logging.getLevelName(log_level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    
+    formatter = logging.Formatter(log_format)
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if log_file is not None:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Replace any previous configuration instead of silently keeping it
+    _stop_log_listener()
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(_log_queue))
+    
+    _log_listener = logging.handlers.QueueListener(_log_queue, *handlers)
+    _log_listener.start()
     
     # Set specific logger levels
     logging.getLogger("openai").setLevel(logging.WARNING)
@@ -342,6 +464,18 @@ def setup_logging(
     logging.getLogger("requests").setLevel(logging.WARNING)
 
 
+@atexit.register
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 def validate_environment() -> List[str]:
     """
     Validate that required environment variables are set.
@@ -349,19 +483,8 @@ def validate_environment() -> List[str]:
     Returns:
         List of missing environment variables
     """
-    required_vars = [
-        "AZURE_OPENAI_KEY",
-        "AZURE_OPENAI_ENDPOINT",
-        "AZURE_TRANSLATOR_KEY",
-        "AZURE_TRANSLATOR_ENDPOINT"
-    ]
-    
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
-    return missing_vars
+    # Variables set to an empty string count as missing
+    return [var for var in _REQUIRED_ENV_VARS if not os.getenv(var)]
 
 
 def format_duration(seconds: float) -> str:
@@ -376,15 +499,13 @@ def format_duration(seconds: float) -> str:
     """
     if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+    
+    minutes, secs = divmod(int(seconds), 60)
+    if minutes < 60:
         return f"{minutes}m {secs}s"
-    else:
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours}h {minutes}m {secs}s"
+    
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m {secs}s"
 
 
 def clean_filename(filename: str) -> str:
@@ -397,16 +518,11 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename
     """
-    import re
-    
-    # Remove leading/trailing dots and spaces first
-    filename = filename.strip('. ')
-    
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    # Remove leading/trailing dots and spaces first, then invalid characters
+    filename = filename.strip('. ').translate(_FILENAME_DELETE_TABLE)
     
     # Replace spaces with underscores
-    filename = re.sub(r'\s+', '_', filename)
+    filename = _FILENAME_WS.sub('_', filename)
     
     return filename
 
@@ -414,6 +530,9 @@ def clean_filename(filename: str) -> str:
 class ProgressTracker:
     """Simple progress tracker for long-running operations."""
     
+    # Minimum number of seconds between two progress log lines
+    LOG_INTERVAL = 0.1
+    
     def __init__(self, total_steps: int, description: str = "Processing"):
         """
         Initialize progress tracker.
@@ -425,21 +544,36 @@ class ProgressTracker:
         self.total_steps = total_steps
         self.current_step = 0
         self.description = description
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._last_log = float('-inf')
+    
+    @property
+    def percentage(self) -> float:
+        """Current progress as a percentage of total steps."""
+        if not self.total_steps:
+            return 0.0
+        return self.current_step * 100.0 / self.total_steps
     
     def update(self, step: int = 1, message: str = "") -> None:
         """
         Update progress.
         
+        Progress is logged at most once every LOG_INTERVAL seconds, and
+        always when the last step is reached.
+        
         Args:
             step: Number of steps to advance
             message: Optional status message
         """
         self.current_step += step
-        progress = (self.current_step / self.total_steps) * 100
-        elapsed = time.time() - self.start_time
+        now = time.monotonic()
+        
+        if now - self._last_log < self.LOG_INTERVAL and self.current_step < self.total_steps:
+            return
+        self._last_log = now
         
-        status = f"{self.description}: {self.current_step}/{self.total_steps} ({progress:.1f}%)"
+        elapsed = now - self.start_time
+        status = f"{self.description}: {self.current_step}/{self.total_steps} ({self.percentage:.1f}%)"
         if message:
             status += f" - {message}"
         
@@ -451,7 +585,7 @@ class ProgressTracker:
     
     def finish(self) -> None:
         """Mark progress as finished."""
-        total_time = time.time() - self.start_time
+        total_time = time.monotonic() - self.start_time
         logger.info(f"{self.description} completed in {format_duration(total_time)}")
 
 
@@ -465,6 +599,5 @@ def ensure_directory(path: Union[str, Path]) -> Path:
     Returns:
         Path object for the directory
     """
-    path = Path(path)
-    path.mkdir(parents=True, exist_ok=True)
-    return path 
\ No newline at end of file
+    os.makedirs(path, exist_ok=True)
+    return Path(path) 
\ No newline at end of file
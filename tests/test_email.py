@@ -5,112 +5,129 @@ These tests verify email sending functionality.
 """
 
 import os
-import tempfile
 import pytest
+from contextlib import ExitStack, contextmanager
+from email.mime.multipart import MIMEMultipart
 from pathlib import Path
+from smtplib import SMTP
 from unittest.mock import Mock, patch, MagicMock, mock_open
-import sys
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.utils.email import EmailSender, send_meeting_minutes
 
+_PDF_BYTES = b'PDF content'
+_TXT_BYTES = b'Text content'
+_TEST_BYTES = b'Test content'
+_FAKE_PDF = Path('/fake/minutes.pdf')
+
+
+@contextmanager
+def fake_file(path=_FAKE_PDF, data=_PDF_BYTES):
+    """Pretend every file exists and contains ``data`` without touching disk."""
+    with ExitStack() as stack:
+        stack.enter_context(patch('builtins.open', mock_open(read_data=data)))
+        stack.enter_context(patch('pathlib.Path.exists', return_value=True))
+        stack.enter_context(patch('pathlib.Path.stat', return_value=Mock(st_size=len(data))))
+        stack.enter_context(patch('os.path.exists', return_value=True))
+        stack.enter_context(patch('os.path.getsize', return_value=len(data)))
+        yield path
+
 
 class TestEmailSender:
     """Test cases for EmailSender class."""
     
-    def test_init_with_env_vars(self):
-        """Test EmailSender initialization with environment variables."""
-        with patch.dict(os.environ, {
-            'SMTP_SERVER': 'smtp.test.com',
-            'SMTP_PORT': '465',
-            'SMTP_USERNAME': 'test@test.com',
-            'SMTP_PASSWORD': 'testpass'
-        }):
-            sender = EmailSender()
-            
-            assert sender.smtp_server == 'smtp.test.com'
-            assert sender.smtp_port == 465
-            assert sender.username == 'test@test.com'
-            assert sender.password == 'testpass'
-            assert sender.use_tls == True
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sender(cls):
+        """EmailSender shared by the tests that do not exercise construction."""
+        return EmailSender(username='test@test.com', password='testpass')
     
-    def test_init_with_parameters(self):
-        """Test EmailSender initialization with explicit parameters."""
-        sender = EmailSender(
-            smtp_server='smtp.param.com',
-            smtp_port=587,
-            username='param@test.com',
-            password='parampass',
-            use_tls=False
+    @pytest.fixture
+    def mock_smtp(self):
+        """Patched smtplib.SMTP class and the server it yields as a context manager."""
+        with patch('src.utils.email.smtplib.SMTP') as smtp_class:
+            mock_server = MagicMock(spec=SMTP)
+            mock_server.__enter__.return_value = mock_server
+            smtp_class.return_value = mock_server
+            yield smtp_class, mock_server
+    
+    @pytest.mark.parametrize("env,kwargs,expected", [
+        (
+            {
+                'SMTP_SERVER': 'smtp.test.com',
+                'SMTP_PORT': '465',
+                'SMTP_USERNAME': 'test@test.com',
+                'SMTP_PASSWORD': 'testpass'
+            },
+            {},
+            {
+                'smtp_server': 'smtp.test.com',
+                'smtp_port': 465,
+                'username': 'test@test.com',
+                'password': 'testpass',
+                'use_tls': True
+            }
+        ),
+        (
+            {},
+            {
+                'smtp_server': 'smtp.param.com',
+                'smtp_port': 587,
+                'username': 'param@test.com',
+                'password': 'parampass',
+                'use_tls': False
+            },
+            {
+                'smtp_server': 'smtp.param.com',
+                'smtp_port': 587,
+                'username': 'param@test.com',
+                'password': 'parampass',
+                'use_tls': False
+            }
+        ),
+        (
+            {},
+            {'username': 'test@test.com', 'password': 'testpass'},
+            {'smtp_server': 'smtp.gmail.com', 'smtp_port': 587, 'use_tls': True}
         )
-        
-        assert sender.smtp_server == 'smtp.param.com'
-        assert sender.smtp_port == 587
-        assert sender.username == 'param@test.com'
-        assert sender.password == 'parampass'
-        assert sender.use_tls == False
+    ], ids=["env_vars", "parameters", "defaults"])
+    def test_init(self, env, kwargs, expected):
+        """Test EmailSender initialization from environment, arguments and defaults."""
+        with patch.dict(os.environ, env, clear=True):
+            sender = EmailSender(**kwargs)
+        
+        for attribute, value in expected.items():
+            assert getattr(sender, attribute) == value
     
-    def test_init_missing_credentials(self):
+    @pytest.mark.parametrize("env", [
+        {},
+        {'SMTP_USERNAME': 'test@test.com'}
+    ], ids=["missing_credentials", "missing_password"])
+    def test_init_missing_credentials(self, env):
         """Test EmailSender initialization with missing credentials."""
-        with patch.dict(os.environ, {}, clear=True):
+        with patch.dict(os.environ, env, clear=True):
             with pytest.raises(ValueError, match="Email username and password are required"):
                 EmailSender()
     
-    def test_init_missing_password(self):
-        """Test EmailSender initialization with missing password."""
-        with patch.dict(os.environ, {'SMTP_USERNAME': 'test@test.com'}, clear=True):
-            with pytest.raises(ValueError, match="Email username and password are required"):
-                EmailSender()
-    
-    def test_init_defaults(self):
-        """Test EmailSender initialization with default values."""
-        sender = EmailSender(username='test@test.com', password='testpass')
-        
-        assert sender.smtp_server == 'smtp.gmail.com'
-        assert sender.smtp_port == 587
-        assert sender.use_tls == True
-    
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_send_meeting_minutes_success(self, mock_smtp):
+    def test_send_meeting_minutes_success(self, sender, mock_smtp):
         """Test successful email sending."""
-        # Create temporary PDF file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = tmp_pdf.name
-        
-        try:
-            # Mock SMTP server
-            mock_server = MagicMock()
-            mock_smtp.return_value = mock_server
-            
-            sender = EmailSender(
-                username='test@test.com',
-                password='testpass'
+        _, mock_server = mock_smtp
+        
+        # Mock file operations
+        with fake_file() as pdf_path:
+            result = sender.send_meeting_minutes(
+                pdf_path=pdf_path,
+                to_email='recipient@test.com',
+                meeting_title='Test Meeting'
             )
-            
-            # Mock file operations
-            with patch('builtins.open', mock_open(read_data=b'PDF content')):
-                result = sender.send_meeting_minutes(
-                    pdf_path=pdf_path,
-                    to_email='recipient@test.com',
-                    meeting_title='Test Meeting'
-                )
-            
-            assert result == True
-            mock_server.starttls.assert_called_once()
-            mock_server.login.assert_called_once_with('test@test.com', 'testpass')
-            mock_server.send_message.assert_called_once()
-            mock_server.quit.assert_called_once()
-            
-        finally:
-            os.unlink(pdf_path)
+        
+        assert result == True
+        mock_server.starttls.assert_called_once()
+        mock_server.login.assert_called_once_with('test@test.com', 'testpass')
+        mock_server.send_message.assert_called_once()
+        mock_server.quit.assert_called_once()
     
-    def test_send_meeting_minutes_file_not_found(self):
+    def test_send_meeting_minutes_file_not_found(self, sender):
         """Test email sending with non-existent PDF file."""
-        sender = EmailSender(username='test@test.com', password='testpass')
-        
         result = sender.send_meeting_minutes(
             pdf_path='nonexistent.pdf',
             to_email='recipient@test.com'
@@ -118,232 +135,173 @@ class TestEmailSender:
         
         assert result == False
     
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_send_meeting_minutes_with_cc_bcc(self, mock_smtp):
+    def test_send_meeting_minutes_with_cc_bcc(self, sender, mock_smtp):
         """Test email sending with CC and BCC recipients."""
-        # Create temporary PDF file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = tmp_pdf.name
-        
-        try:
-            # Mock SMTP server
-            mock_server = MagicMock()
-            mock_smtp.return_value = mock_server
-            
-            sender = EmailSender(username='test@test.com', password='testpass')
-            
-            with patch('builtins.open', mock_open(read_data=b'PDF content')):
-                result = sender.send_meeting_minutes(
-                    pdf_path=pdf_path,
-                    to_email='recipient@test.com',
-                    cc_emails=['cc1@test.com', 'cc2@test.com'],
-                    bcc_emails=['bcc@test.com'],
-                    from_email='sender@test.com'
-                )
-            
-            assert result == True
-            mock_server.send_message.assert_called_once()
-            
-        finally:
-            os.unlink(pdf_path)
+        _, mock_server = mock_smtp
+        
+        with fake_file() as pdf_path:
+            result = sender.send_meeting_minutes(
+                pdf_path=pdf_path,
+                to_email='recipient@test.com',
+                cc_emails=['cc1@test.com', 'cc2@test.com'],
+                bcc_emails=['bcc@test.com'],
+                from_email='sender@test.com'
+            )
+        
+        assert result == True
+        mock_server.send_message.assert_called_once()
     
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_send_meeting_minutes_with_additional_attachments(self, mock_smtp):
+    def test_send_meeting_minutes_with_additional_attachments(self, sender, mock_smtp):
         """Test email sending with additional attachments."""
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = tmp_pdf.name
-        
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as tmp_txt:
-            tmp_txt.write(b'Text content')
-            txt_path = tmp_txt.name
-        
-        try:
-            # Mock SMTP server
-            mock_server = MagicMock()
-            mock_smtp.return_value = mock_server
-            
-            sender = EmailSender(username='test@test.com', password='testpass')
-            
-            with patch('builtins.open', mock_open(read_data=b'File content')):
-                result = sender.send_meeting_minutes(
-                    pdf_path=pdf_path,
-                    to_email='recipient@test.com',
-                    additional_attachments=[txt_path]
-                )
-            
-            assert result == True
-            
-        finally:
-            os.unlink(pdf_path)
-            os.unlink(txt_path)
+        _, mock_server = mock_smtp
+        
+        with fake_file(data=_TXT_BYTES) as pdf_path:
+            result = sender.send_meeting_minutes(
+                pdf_path=pdf_path,
+                to_email='recipient@test.com',
+                additional_attachments=['/fake/notes.txt']
+            )
+        
+        assert result == True
+    
+    def test_send_meeting_minutes_compressed_pdf(self, sender, tmp_path):
+        """Test email sending with a gzip-compressed PDF attachment."""
+        import gzip
+        
+        # Create temporary PDF file
+        pdf_path = tmp_path / "minutes.pdf"
+        pdf_path.write_bytes(_PDF_BYTES)
+        
+        with patch.object(sender, '_send_email', return_value=True) as mock_send:
+            result = sender.send_meeting_minutes(
+                pdf_path=pdf_path,
+                to_email='recipient@test.com',
+                compress_pdf=True
+            )
+        
+        assert result == True
+        msg = mock_send.call_args[0][0]
+        attachment = msg.get_payload()[1]
+        assert attachment.get_content_type() == 'application/gzip'
+        assert attachment.get_filename() == pdf_path.name + '.gz'
+        assert gzip.decompress(attachment.get_payload(decode=True)) == _PDF_BYTES
+        
+        # The body advertises the attached file, not the original PDF
+        body = msg.get_payload()[0].get_payload(decode=True).decode('utf-8')
+        assert pdf_path.name + '.gz' in body
+        assert sender._format_file_size(len(attachment.get_payload(decode=True))) in body
     
-    def test_create_email_body(self):
+    def test_create_email_body(self, sender, tmp_path):
         """Test email body creation."""
         # Create temporary PDF file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = Path(tmp_pdf.name)
-        
-        try:
-            sender = EmailSender(username='test@test.com', password='testpass')
-            
-            body = sender._create_email_body('Test Meeting', pdf_path)
-            
-            # Verify key content is present
-            assert 'Test Meeting' in body
-            assert 'Ata de Reunião Gerada Automaticamente' in body
-            assert 'Resumo Executivo' in body
-            assert 'Decisões' in body
-            assert 'Próximas Ações' in body
-            assert 'Transcrição Completa' in body
-            assert pdf_path.name in body
-            assert 'Sistema Verba' in body
-            
-        finally:
-            os.unlink(pdf_path)
+        pdf_path = tmp_path / "minutes.pdf"
+        pdf_path.write_bytes(_PDF_BYTES)
+        
+        body = sender._create_email_body(
+            'Test Meeting', pdf_path.name, pdf_path.stat().st_size
+        )
+        
+        # Verify key content is present
+        assert 'Test Meeting' in body
+        assert 'Ata de Reunião Gerada Automaticamente' in body
+        assert 'Resumo Executivo' in body
+        assert 'Decisões' in body
+        assert 'Próximas Ações' in body
+        assert 'Transcrição Completa' in body
+        assert pdf_path.name in body
+        assert 'Sistema Verba' in body
     
-    def test_attach_file_success(self):
+    def test_attach_file_success(self, sender, tmp_path):
         """Test successful file attachment."""
         # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as tmp_file:
-            tmp_file.write(b'Test content')
-            file_path = tmp_file.name
-        
-        try:
-            sender = EmailSender(username='test@test.com', password='testpass')
-            
-            # Mock MIMEMultipart
-            mock_msg = MagicMock()
-            
-            with patch('builtins.open', mock_open(read_data=b'Test content')):
-                result = sender._attach_file(mock_msg, file_path)
-            
-            assert result == True
-            mock_msg.attach.assert_called_once()
-            
-        finally:
-            os.unlink(file_path)
+        file_path = tmp_path / "attachment.txt"
+        file_path.write_bytes(_TEST_BYTES)
+        
+        # Mock MIMEMultipart
+        mock_msg = Mock(spec=MIMEMultipart)
+        
+        with patch('builtins.open', mock_open(read_data=_TEST_BYTES)):
+            result = sender._attach_file(mock_msg, file_path)
+        
+        assert result == True
+        mock_msg.attach.assert_called_once()
     
-    def test_attach_file_not_found(self):
+    def test_attach_file_not_found(self, sender):
         """Test file attachment with non-existent file."""
-        sender = EmailSender(username='test@test.com', password='testpass')
-        mock_msg = MagicMock()
+        mock_msg = Mock(spec=MIMEMultipart)
         
         result = sender._attach_file(mock_msg, 'nonexistent.txt')
         
         assert result == False
         mock_msg.attach.assert_not_called()
     
-    def test_attach_file_read_error(self):
+    def test_attach_file_read_error(self, sender, tmp_path):
         """Test file attachment with read error."""
         # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as tmp_file:
-            tmp_file.write(b'Test content')
-            file_path = tmp_file.name
-        
-        try:
-            sender = EmailSender(username='test@test.com', password='testpass')
-            mock_msg = MagicMock()
-            
-            # Mock file open to raise exception
-            with patch('builtins.open', side_effect=IOError("Read error")):
-                result = sender._attach_file(mock_msg, file_path)
-            
-            assert result == False
-            mock_msg.attach.assert_not_called()
-            
-        finally:
-            os.unlink(file_path)
-    
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_send_email_success(self, mock_smtp):
-        """Test successful email sending."""
-        # Mock SMTP server
-        mock_server = MagicMock()
-        mock_smtp.return_value = mock_server
+        file_path = tmp_path / "attachment.txt"
+        file_path.write_bytes(_TEST_BYTES)
         
-        sender = EmailSender(username='test@test.com', password='testpass')
+        mock_msg = Mock(spec=MIMEMultipart)
         
-        # Mock message
-        mock_msg = MagicMock()
-        
-        result = sender._send_email(
-            msg=mock_msg,
-            to_email='recipient@test.com',
-            cc_emails=['cc@test.com'],
-            bcc_emails=['bcc@test.com']
-        )
-        
-        assert result == True
-        mock_server.starttls.assert_called_once()
-        mock_server.login.assert_called_once_with('test@test.com', 'testpass')
-        mock_server.send_message.assert_called_once()
-        mock_server.quit.assert_called_once()
-    
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_send_email_smtp_error(self, mock_smtp):
-        """Test email sending with SMTP error."""
-        # Mock SMTP server to raise exception
-        mock_smtp.side_effect = Exception("SMTP Error")
-        
-        sender = EmailSender(username='test@test.com', password='testpass')
-        mock_msg = MagicMock()
-        
-        result = sender._send_email(
-            msg=mock_msg,
-            to_email='recipient@test.com'
-        )
+        # Mock file open to raise exception
+        with patch('builtins.open', side_effect=IOError("Read error")):
+            result = sender._attach_file(mock_msg, file_path)
         
         assert result == False
+        mock_msg.attach.assert_not_called()
     
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_send_email_login_error(self, mock_smtp):
-        """Test email sending with login error."""
-        # Mock SMTP server
-        mock_server = MagicMock()
-        mock_server.login.side_effect = Exception("Login failed")
-        mock_smtp.return_value = mock_server
-        
-        sender = EmailSender(username='test@test.com', password='testpass')
-        mock_msg = MagicMock()
+    @pytest.mark.parametrize("smtp_exc,login_exc,expected,expect_close", [
+        (None, None, True, True),
+        (Exception("SMTP Error"), None, False, False),
+        (None, Exception("Login failed"), False, True)
+    ], ids=["success", "smtp_error", "login_error"])
+    def test_send_email(self, sender, mock_smtp, smtp_exc, login_exc, expected, expect_close):
+        """Test email sending outcomes for connection and login failures."""
+        smtp_class, mock_server = mock_smtp
+        if smtp_exc is not None:
+            smtp_class.side_effect = smtp_exc
+        if login_exc is not None:
+            mock_server.login.side_effect = login_exc
+        
+        mock_msg = Mock(spec=MIMEMultipart)
         
         result = sender._send_email(
             msg=mock_msg,
-            to_email='recipient@test.com'
+            to_email='recipient@test.com',
+            cc_emails=['cc@test.com'],
+            bcc_emails=['bcc@test.com']
         )
         
-        assert result == False
-        mock_server.quit.assert_called_once()
+        assert result == expected
+        if expected:
+            mock_server.starttls.assert_called_once_with()
+            mock_server.login.assert_called_once_with('test@test.com', 'testpass')
+            mock_server.send_message.assert_called_once_with(
+                mock_msg,
+                to_addrs=['recipient@test.com', 'cc@test.com', 'bcc@test.com']
+            )
+        # The server is used as a context manager, which closes the connection on exit
+        if expect_close:
+            mock_server.__exit__.assert_called_once()
+        else:
+            mock_server.__exit__.assert_not_called()
     
-    def test_format_file_size(self):
+    @pytest.mark.parametrize("size_bytes,expected", [
+        (0, "0 B"),
+        (512, "512.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1048576, "1.0 MB"),
+        (1073741824, "1.0 GB"),
+        (1099511627776, "1024.0 GB")
+    ])
+    def test_format_file_size(self, sender, size_bytes, expected):
         """Test file size formatting."""
-        sender = EmailSender(username='test@test.com', password='testpass')
-        
-        # Test different file sizes
-        test_cases = [
-            (0, "0 B"),
-            (512, "512 B"),
-            (1024, "1.0 KB"),
-            (1536, "1.5 KB"),
-            (1048576, "1.0 MB"),
-            (1073741824, "1.0 GB")
-        ]
-        
-        for size_bytes, expected in test_cases:
-            result = sender._format_file_size(size_bytes)
-            assert result == expected
+        assert sender._format_file_size(size_bytes) == expected
     
-    @patch('src.utils.email.smtplib.SMTP')
-    def test_test_connection_success(self, mock_smtp):
+    def test_test_connection_success(self, sender, mock_smtp):
         """Test successful connection test."""
-        # Mock SMTP server
-        mock_server = MagicMock()
-        mock_smtp.return_value = mock_server
-        
-        sender = EmailSender(username='test@test.com', password='testpass')
+        _, mock_server = mock_smtp
         
         result = sender.test_connection()
         
@@ -353,23 +311,18 @@ class TestEmailSender:
         mock_server.quit.assert_called_once()
     
     @patch('src.utils.email.smtplib.SMTP')
-    def test_test_connection_failure(self, mock_smtp):
+    def test_test_connection_failure(self, mock_smtp, sender):
         """Test connection test failure."""
         # Mock SMTP server to raise exception
         mock_smtp.side_effect = Exception("Connection failed")
         
-        sender = EmailSender(username='test@test.com', password='testpass')
-        
         result = sender.test_connection()
         
         assert result == False
     
-    @patch('src.utils.email.smtplib.SMTP')
     def test_test_connection_no_tls(self, mock_smtp):
         """Test connection test without TLS."""
-        # Mock SMTP server
-        mock_server = MagicMock()
-        mock_smtp.return_value = mock_server
+        _, mock_server = mock_smtp
         
         sender = EmailSender(
             username='test@test.com',
@@ -396,32 +349,26 @@ class TestStandaloneFunctions:
         mock_email_sender_class.return_value = mock_sender
         mock_sender.send_meeting_minutes.return_value = True
         
-        # Create temporary PDF file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = tmp_pdf.name
-        
-        try:
+        with fake_file() as pdf_path:
             result = send_meeting_minutes(
                 pdf_path=pdf_path,
                 to_email='recipient@test.com',
                 meeting_title='Test Meeting',
                 from_email='sender@test.com',
-                cc_emails=['cc@test.com']
+                cc_emails=['cc@test.com'],
+                compress_pdf=True
             )
-            
-            assert result == True
-            mock_email_sender_class.assert_called_once()
-            mock_sender.send_meeting_minutes.assert_called_once_with(
-                pdf_path=pdf_path,
-                to_email='recipient@test.com',
-                meeting_title='Test Meeting',
-                from_email='sender@test.com',
-                cc_emails=['cc@test.com']
-            )
-            
-        finally:
-            os.unlink(pdf_path)
+        
+        assert result == True
+        mock_email_sender_class.assert_called_once()
+        mock_sender.send_meeting_minutes.assert_called_once_with(
+            pdf_path=pdf_path,
+            to_email='recipient@test.com',
+            meeting_title='Test Meeting',
+            from_email='sender@test.com',
+            cc_emails=['cc@test.com'],
+            compress_pdf=True
+        )
     
     @patch('src.utils.email.EmailSender')
     def test_send_meeting_minutes_convenience_function_failure(self, mock_email_sender_class):
@@ -429,20 +376,13 @@ class TestStandaloneFunctions:
         # Mock EmailSender to raise exception
         mock_email_sender_class.side_effect = Exception("Email error")
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = tmp_pdf.name
-        
-        try:
+        with fake_file() as pdf_path:
             result = send_meeting_minutes(
                 pdf_path=pdf_path,
                 to_email='recipient@test.com'
             )
-            
-            assert result == False
-            
-        finally:
-            os.unlink(pdf_path)
+        
+        assert result == False
     
     @patch('src.utils.email.EmailSender')
     def test_send_meeting_minutes_convenience_function_defaults(self, mock_email_sender_class):
@@ -452,27 +392,21 @@ class TestStandaloneFunctions:
         mock_email_sender_class.return_value = mock_sender
         mock_sender.send_meeting_minutes.return_value = True
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-            tmp_pdf.write(b'PDF content')
-            pdf_path = tmp_pdf.name
-        
-        try:
+        with fake_file() as pdf_path:
             result = send_meeting_minutes(
                 pdf_path=pdf_path,
                 to_email='recipient@test.com'
             )
-            
-            assert result == True
-            mock_sender.send_meeting_minutes.assert_called_once_with(
-                pdf_path=pdf_path,
-                to_email='recipient@test.com',
-                meeting_title='Ata de Reunião',
-                from_email=None,
-                cc_emails=None
-            )
-            
-        finally:
-            os.unlink(pdf_path)
+        
+        assert result == True
+        mock_sender.send_meeting_minutes.assert_called_once_with(
+            pdf_path=pdf_path,
+            to_email='recipient@test.com',
+            meeting_title='Ata de Reunião',
+            from_email=None,
+            cc_emails=None,
+            compress_pdf=False
+        )
 
 
 if __name__ == "__main__":
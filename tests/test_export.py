@@ -4,45 +4,78 @@ Unit tests for the export modules (docx.py and pdf.py).
 These tests verify DOCX and PDF generation functionality.
 """
 
-import os
-import tempfile
+import re
 import pytest
+from dataclasses import dataclass, replace
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-import sys
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from unittest.mock import patch, MagicMock, mock_open
 
 from src.export.docx import DocxExporter, export_to_docx, create_template_docx, format_actions_for_docx
 from src.export.pdf import PDFExporter, export_to_pdf, convert_docx_to_pdf, create_css_template
 
 
+@dataclass(frozen=True, slots=True)
 class MockSummaryResult:
     """Mock summary result for testing."""
     
-    def __init__(self):
-        self.resumo_executivo = "Este é um resumo executivo de teste."
-        self.decisoes = [
-            "Decisão 1: Implementar nova funcionalidade",
-            "Decisão 2: Revisar processo existente"
-        ]
-        self.proximas_acoes = [
-            {
-                "responsavel": "João",
-                "acao": "Criar documentação",
-                "prazo": "2024-01-15"
-            },
-            {
-                "responsavel": "Maria",
-                "acao": "Revisar código",
-                "prazo": "2024-01-20"
-            }
-        ]
-        self.transcricao_completa = "Esta é a transcrição completa da reunião de teste."
-        self.tokens_used = 1500
-        self.processing_time = 12.5
-        self.cost_estimate = 0.045
+    resumo_executivo: str = "Este é um resumo executivo de teste."
+    decisoes: tuple = (
+        "Decisão 1: Implementar nova funcionalidade",
+        "Decisão 2: Revisar processo existente"
+    )
+    proximas_acoes: tuple = (
+        {
+            "responsavel": "João",
+            "acao": "Criar documentação",
+            "prazo": "2024-01-15"
+        },
+        {
+            "responsavel": "Maria",
+            "acao": "Revisar código",
+            "prazo": "2024-01-20"
+        }
+    )
+    transcricao_completa: str = "Esta é a transcrição completa da reunião de teste."
+    tokens_used: int = 1500
+    processing_time: float = 12.5
+    cost_estimate: float = 0.045
+
+
+@pytest.fixture(scope="session")
+def summary_result():
+    """Summary result shared read-only across the export tests."""
+    return MockSummaryResult()
+
+
+@pytest.fixture(scope="session")
+def empty_summary_result(summary_result):
+    """Summary result without decisions or actions."""
+    return replace(summary_result, decisoes=(), proximas_acoes=())
+
+
+class _DocStub:
+    """Plain holder for the parts of a python-docx Document the exporter uses."""
+    
+    add_paragraph = MagicMock()
+    add_table = MagicMock()
+    add_page_break = MagicMock()
+    core_properties = MagicMock()
+    styles = MagicMock()
+    save = MagicMock()
+
+
+@pytest.fixture
+def mock_document(monkeypatch):
+    """Patched python-docx Document class and the document it returns."""
+    mock_doc = _DocStub()
+    document_class = MagicMock(return_value=mock_doc)
+    monkeypatch.setattr('src.export.docx.Document', document_class)
+    yield document_class, mock_doc
+    
+    # The stub's mocks are shared class attributes, so clear them for the next test
+    for name in ('add_paragraph', 'add_table', 'add_page_break',
+                 'core_properties', 'styles', 'save'):
+        getattr(_DocStub, name).reset_mock()
 
 
 class TestDocxExporter:
@@ -59,72 +92,50 @@ class TestDocxExporter:
         exporter = DocxExporter(template_path=template_path)
         assert exporter.template_path == template_path
 
-    @patch('src.export.docx.Document')
-    def test_create_document_basic(self, mock_document_class):
+    def test_create_document_basic(self, mock_document, summary_result, tmp_path):
         """Test basic document creation."""
-        # Mock Document and its methods
-        mock_doc = MagicMock()
-        mock_document_class.return_value = mock_doc
-        
-        # Mock properties
-        mock_doc.core_properties = MagicMock()
+        mock_document_class, mock_doc = mock_document
         
         exporter = DocxExporter()
-        summary_result = MockSummaryResult()
         
         # Create document
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "test.docx"
+        output_path = tmp_path / "test.docx"
+        result_path = exporter.create_document(
+            summary_result=summary_result,
+            meeting_title="Test Meeting",
+            company_name="Test Company",
+            output_path=output_path
+        )
+        
+        # Verify document was created
+        assert result_path == str(output_path)
+        mock_document_class.assert_called_once()
+        mock_doc.save.assert_called_once_with(str(output_path))
+
+    def test_create_document_with_template(self, mock_document, summary_result, tmp_path):
+        """Test document creation with template."""
+        mock_document_class, _ = mock_document
+        template_path = "/tmp/fake_template.docx"
+        
+        exporter = DocxExporter(template_path=template_path)
+        
+        output_path = tmp_path / "test.docx"
+        # The template only has to look present; Document itself is mocked
+        with patch('pathlib.Path.exists', return_value=True):
             result_path = exporter.create_document(
                 summary_result=summary_result,
-                meeting_title="Test Meeting",
-                company_name="Test Company",
                 output_path=output_path
             )
-            
-            # Verify document was created
-            assert result_path == str(output_path)
-            mock_document_class.assert_called_once()
-            mock_doc.save.assert_called_once_with(str(output_path))
-
-    @patch('src.export.docx.Document')
-    def test_create_document_with_template(self, mock_document_class):
-        """Test document creation with template."""
-        # Create a temporary template file
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp_template:
-            template_path = tmp_template.name
-        
-        try:
-            mock_doc = MagicMock()
-            mock_document_class.return_value = mock_doc
-            mock_doc.core_properties = MagicMock()
-            
-            exporter = DocxExporter(template_path=template_path)
-            summary_result = MockSummaryResult()
-            
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                output_path = Path(tmp_dir) / "test.docx"
-                result_path = exporter.create_document(
-                    summary_result=summary_result,
-                    output_path=output_path
-                )
-                
-                # Verify template was used
-                mock_document_class.assert_called_once_with(template_path)
-                assert result_path == str(output_path)
-                
-        finally:
-            os.unlink(template_path)
-
-    @patch('src.export.docx.Document')
-    def test_create_document_auto_path(self, mock_document_class):
+        
+        # Verify template was used
+        mock_document_class.assert_called_once_with(template_path)
+        assert result_path == str(output_path)
+
+    def test_create_document_auto_path(self, mock_document, summary_result):
         """Test document creation with auto-generated path."""
-        mock_doc = MagicMock()
-        mock_document_class.return_value = mock_doc
-        mock_doc.core_properties = MagicMock()
+        _, mock_doc = mock_document
         
         exporter = DocxExporter()
-        summary_result = MockSummaryResult()
         
         result_path = exporter.create_document(summary_result=summary_result)
         
@@ -133,11 +144,9 @@ class TestDocxExporter:
         assert result_path.endswith(".docx")
         mock_doc.save.assert_called_once()
 
-    @patch('src.export.docx.Document')
-    def test_add_header(self, mock_document_class):
+    def test_add_header(self):
         """Test header addition."""
         mock_doc = MagicMock()
-        mock_document_class.return_value = mock_doc
         
         # Mock paragraph methods
         mock_para = MagicMock()
@@ -149,16 +158,13 @@ class TestDocxExporter:
         exporter._add_header(mock_doc, "Test Meeting", "Test Company")
         
         # Verify paragraphs were added (company, title, date, separator, empty)
-        assert mock_doc.add_paragraph.call_count >= 4
+        assert mock_doc.add_paragraph.call_count == 5
 
-    @patch('src.export.docx.Document')
-    def test_add_summary_sections(self, mock_document_class):
+    def test_add_summary_sections(self, summary_result):
         """Test summary sections addition."""
         mock_doc = MagicMock()
-        mock_document_class.return_value = mock_doc
         
         exporter = DocxExporter()
-        summary_result = MockSummaryResult()
         
         # Mock the helper methods
         exporter._add_section_heading = MagicMock()
@@ -171,21 +177,16 @@ class TestDocxExporter:
         
         # Verify all sections were added
         assert exporter._add_section_heading.call_count == 4  # 4 sections
-        assert exporter._add_paragraph.call_count >= 2  # Resumo + Transcrição
+        assert exporter._add_paragraph.call_count == 2  # Resumo + Transcrição
         assert exporter._add_bullet_point.call_count == 2  # 2 decisions
         exporter._add_actions_table.assert_called_once()
         exporter._add_processing_info.assert_called_once()
 
-    @patch('src.export.docx.Document')
-    def test_add_summary_sections_empty_lists(self, mock_document_class):
+    def test_add_summary_sections_empty_lists(self, empty_summary_result):
         """Test summary sections with empty decisions and actions."""
         mock_doc = MagicMock()
-        mock_document_class.return_value = mock_doc
         
         exporter = DocxExporter()
-        summary_result = MockSummaryResult()
-        summary_result.decisoes = []
-        summary_result.proximas_acoes = []
         
         # Mock the helper methods
         exporter._add_section_heading = MagicMock()
@@ -194,57 +195,27 @@ class TestDocxExporter:
         exporter._add_actions_table = MagicMock()
         exporter._add_processing_info = MagicMock()
         
-        exporter._add_summary_sections(mock_doc, summary_result)
+        exporter._add_summary_sections(mock_doc, empty_summary_result)
         
         # Verify bullet points and actions table were not called for empty lists
         exporter._add_bullet_point.assert_not_called()
         exporter._add_actions_table.assert_not_called()
         # But "(nenhuma)" paragraphs should be added
-        assert exporter._add_paragraph.call_count >= 4  # Resumo + Transcrição + 2x "(nenhuma)"
+        assert exporter._add_paragraph.call_count == 4  # Resumo + Transcrição + 2x "(nenhuma)"
 
 
 class TestDocxFunctions:
     """Test cases for standalone docx functions."""
 
-    @patch('src.export.docx.DocxExporter')
-    def test_export_to_docx(self, mock_exporter_class):
-        """Test export_to_docx convenience function."""
-        mock_exporter = MagicMock()
-        mock_exporter_class.return_value = mock_exporter
-        mock_exporter.create_document.return_value = "/path/to/output.docx"
-        
-        summary_result = MockSummaryResult()
-        result = export_to_docx(
-            summary_result=summary_result,
-            meeting_title="Test Meeting",
-            company_name="Test Company",
-            output_path="/path/to/output.docx",
-            template_path="/path/to/template.docx"
-        )
-        
-        # Verify exporter was created and used correctly
-        mock_exporter_class.assert_called_once_with(template_path="/path/to/template.docx")
-        mock_exporter.create_document.assert_called_once_with(
-            summary_result=summary_result,
-            meeting_title="Test Meeting",
-            company_name="Test Company",
-            output_path="/path/to/output.docx"
-        )
-        assert result == "/path/to/output.docx"
-
-    @patch('src.export.docx.Document')
-    def test_create_template_docx(self, mock_document_class):
+    def test_create_template_docx(self, mock_document, tmp_path):
         """Test template DOCX creation."""
-        mock_doc = MagicMock()
-        mock_document_class.return_value = mock_doc
-        mock_doc.core_properties = MagicMock()
+        _, mock_doc = mock_document
+        
+        output_path = tmp_path / "template.docx"
+        result = create_template_docx(output_path)
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "template.docx"
-            result = create_template_docx(output_path)
-            
-            assert result == str(output_path)
-            mock_doc.save.assert_called_once_with(str(output_path))
+        assert result == str(output_path)
+        mock_doc.save.assert_called_once_with(str(output_path))
 
     def test_format_actions_for_docx(self):
         """Test action formatting for DOCX."""
@@ -264,6 +235,12 @@ class TestDocxFunctions:
 class TestPDFExporter:
     """Test cases for PDFExporter class."""
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pdf_exporter(cls):
+        """PDFExporter shared by the tests that only render content."""
+        return PDFExporter()
+    
     def test_init_default(self):
         """Test PDFExporter initialization with default parameters."""
         exporter = PDFExporter()
@@ -276,54 +253,46 @@ class TestPDFExporter:
         exporter = PDFExporter(css_path=css_path)
         assert exporter.css_path == css_path
 
-    @patch('src.export.pdf.HTML')
-    @patch('src.export.pdf.CSS')
-    def test_create_pdf_from_html(self, mock_css_class, mock_html_class):
+    def test_create_pdf_from_html(self, monkeypatch, tmp_path):
         """Test PDF creation from HTML."""
         # Mock HTML and CSS objects
         mock_html = MagicMock()
-        mock_css = MagicMock()
-        mock_html_class.return_value = mock_html
-        mock_css_class.return_value = mock_css
+        mock_html_class = MagicMock(return_value=mock_html)
+        monkeypatch.setattr('src.export.pdf.HTML', mock_html_class)
+        monkeypatch.setattr('src.export.pdf.CSS', MagicMock())
         
         exporter = PDFExporter()
         html_content = "<html><body><h1>Test</h1></body></html>"
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "test.pdf"
-            result = exporter.create_pdf_from_html(html_content, output_path)
-            
-            assert result == str(output_path)
-            mock_html_class.assert_called_once_with(string=html_content)
-            mock_html.write_pdf.assert_called_once()
-
-    @patch('src.export.pdf.HTML')
-    @patch('src.export.pdf.CSS')
-    def test_create_pdf_from_html_with_css(self, mock_css_class, mock_html_class):
+        output_path = tmp_path / "test.pdf"
+        result = exporter.create_pdf_from_html(html_content, output_path)
+        
+        assert result == str(output_path)
+        mock_html_class.assert_called_once_with(string=html_content)
+        mock_html.write_pdf.assert_called_once()
+
+    def test_create_pdf_from_html_with_css(self, monkeypatch, tmp_path):
         """Test PDF creation from HTML with custom CSS."""
-        mock_html = MagicMock()
-        mock_css = MagicMock()
-        mock_html_class.return_value = mock_html
-        mock_css_class.return_value = mock_css
+        mock_css_class = MagicMock()
+        monkeypatch.setattr('src.export.pdf.HTML', MagicMock())
+        monkeypatch.setattr('src.export.pdf.CSS', mock_css_class)
         
         exporter = PDFExporter()
         html_content = "<html><body><h1>Test</h1></body></html>"
         css_content = "body { font-family: Arial; }"
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "test.pdf"
-            result = exporter.create_pdf_from_html(html_content, output_path, css_content)
-            
-            assert result == str(output_path)
-            mock_css_class.assert_called_once_with(string=css_content, font_config=exporter.font_config)
+        output_path = tmp_path / "test.pdf"
+        result = exporter.create_pdf_from_html(html_content, output_path, css_content)
+        
+        assert result == str(output_path)
+        mock_css_class.assert_called_once_with(string=css_content, font_config=exporter.font_config)
 
-    @patch('src.export.pdf.PDFExporter.create_pdf_from_html')
-    def test_create_pdf_from_summary(self, mock_create_pdf):
+    def test_create_pdf_from_summary(self, monkeypatch, summary_result):
         """Test PDF creation from summary result."""
-        mock_create_pdf.return_value = "/path/to/output.pdf"
+        mock_create_pdf = MagicMock(return_value="/path/to/output.pdf")
+        monkeypatch.setattr(PDFExporter, 'create_pdf_from_html', mock_create_pdf)
         
         exporter = PDFExporter()
-        summary_result = MockSummaryResult()
         
         result = exporter.create_pdf_from_summary(
             summary_result=summary_result,
@@ -335,36 +304,34 @@ class TestPDFExporter:
         assert result == "/path/to/output.pdf"
         mock_create_pdf.assert_called_once()
 
-    def test_generate_html_content(self):
+    def test_generate_html_content(self, pdf_exporter, summary_result):
         """Test HTML content generation."""
-        exporter = PDFExporter()
-        summary_result = MockSummaryResult()
         
-        html_content = exporter._generate_html_content(
+        html_content = pdf_exporter._generate_html_content(
             summary_result=summary_result,
             meeting_title="Test Meeting",
             company_name="Test Company"
         )
         
-        # Verify key content is present
-        assert "Test Company" in html_content
-        assert "Test Meeting" in html_content
-        assert "Resumo Executivo" in html_content
-        assert "Decisões" in html_content
-        assert "Próximas Ações" in html_content
-        assert "Transcrição Completa" in html_content
-        assert summary_result.resumo_executivo in html_content
-        assert summary_result.transcricao_completa in html_content
-
-    def test_generate_html_content_empty_lists(self):
+        # Verify key content is present in a single scan
+        tokens = [
+            "Test Company",
+            "Test Meeting",
+            "Resumo Executivo",
+            "Decisões",
+            "Próximas Ações",
+            "Transcrição Completa",
+            summary_result.resumo_executivo,
+            summary_result.transcricao_completa
+        ]
+        pattern = re.compile("|".join(re.escape(token) for token in tokens))
+        assert set(tokens) <= set(pattern.findall(html_content))
+
+    def test_generate_html_content_empty_lists(self, pdf_exporter, empty_summary_result):
         """Test HTML content generation with empty decisions and actions."""
-        exporter = PDFExporter()
-        summary_result = MockSummaryResult()
-        summary_result.decisoes = []
-        summary_result.proximas_acoes = []
         
-        html_content = exporter._generate_html_content(
-            summary_result=summary_result,
+        html_content = pdf_exporter._generate_html_content(
+            summary_result=empty_summary_result,
             meeting_title="Test Meeting",
             company_name="Test Company"
         )
@@ -372,37 +339,29 @@ class TestPDFExporter:
         # Verify empty state messages are present
         assert "(nenhuma)" in html_content
 
-    def test_format_transcript(self):
+    def test_format_transcript(self, pdf_exporter):
         """Test transcript formatting."""
-        exporter = PDFExporter()
         transcript = "Este é um texto longo que precisa ser formatado adequadamente."
         
-        result = exporter._format_transcript(transcript)
+        result = pdf_exporter._format_transcript(transcript)
         
         # Should return HTML-safe content
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_escape_html(self):
+    @pytest.mark.parametrize("input_text,expected", [
+        ("<script>", "&lt;script&gt;"),
+        ("Text & more", "Text &amp; more"),
+        ("Quote \"here\"", "Quote &quot;here&quot;"),
+        ("Normal text", "Normal text")
+    ], ids=["tag", "ampersand", "quote", "plain"])
+    def test_escape_html(self, pdf_exporter, input_text, expected):
         """Test HTML escaping."""
-        exporter = PDFExporter()
-        
-        # Test special characters
-        test_cases = [
-            ("<script>", "&lt;script&gt;"),
-            ("Text & more", "Text &amp; more"),
-            ("Quote \"here\"", "Quote &quot;here&quot;"),
-            ("Normal text", "Normal text")
-        ]
-        
-        for input_text, expected in test_cases:
-            result = exporter._escape_html(input_text)
-            assert result == expected
+        assert pdf_exporter._escape_html(input_text) == expected
 
-    def test_get_default_css(self):
+    def test_get_default_css(self, pdf_exporter):
         """Test default CSS generation."""
-        exporter = PDFExporter()
-        css = exporter._get_default_css()
+        css = pdf_exporter._get_default_css()
         
         # Verify CSS contains essential styles
         assert "body" in css
@@ -415,64 +374,78 @@ class TestPDFExporter:
 class TestPDFFunctions:
     """Test cases for standalone PDF functions."""
 
-    @patch('src.export.pdf.PDFExporter')
-    def test_export_to_pdf(self, mock_exporter_class):
-        """Test export_to_pdf convenience function."""
-        mock_exporter = MagicMock()
-        mock_exporter_class.return_value = mock_exporter
-        mock_exporter.create_pdf_from_summary.return_value = "/path/to/output.pdf"
-        
-        summary_result = MockSummaryResult()
-        result = export_to_pdf(
-            summary_result=summary_result,
-            meeting_title="Test Meeting",
-            company_name="Test Company",
-            output_path="/path/to/output.pdf",
-            css_path="/path/to/styles.css"
-        )
-        
-        # Verify exporter was created and used correctly
-        mock_exporter_class.assert_called_once_with(css_path="/path/to/styles.css")
-        mock_exporter.create_pdf_from_summary.assert_called_once_with(
-            summary_result=summary_result,
-            meeting_title="Test Meeting",
-            company_name="Test Company",
-            output_path="/path/to/output.pdf"
-        )
-        assert result == "/path/to/output.pdf"
-
-    @patch('subprocess.run')
-    def test_convert_docx_to_pdf(self, mock_subprocess):
+    def test_convert_docx_to_pdf(self, monkeypatch):
         """Test DOCX to PDF conversion."""
+        mock_subprocess = MagicMock()
         mock_subprocess.return_value.returncode = 0
+        monkeypatch.setattr('subprocess.run', mock_subprocess)
+        docx_path = "/tmp/fake.docx"
         
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp_docx:
-            docx_path = tmp_docx.name
+        with patch('pathlib.Path.exists', return_value=True):
+            result = convert_docx_to_pdf(docx_path)
         
-        try:
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                result = convert_docx_to_pdf(docx_path)
-                
-                # Verify auto-generated PDF path
-                assert result.endswith('.pdf')
-                
-        finally:
-            os.unlink(docx_path)
+        # Verify auto-generated PDF path
+        assert result.endswith('.pdf')
 
     def test_create_css_template(self):
         """Test CSS template creation."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "template.css"
+        output_path = "/fake/template.css"
+        
+        with patch('builtins.open', mock_open()) as mocked_open, \
+                patch('pathlib.Path.mkdir'):
             result = create_css_template(output_path)
-            
-            assert result == str(output_path)
-            assert output_path.exists()
-            
-            # Verify CSS content
-            with open(output_path, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-                assert "body" in css_content
-                assert "font-family" in css_content
+        
+        assert result == output_path
+        mocked_open.assert_called_once_with(Path(output_path), 'w', encoding='utf-8')
+        
+        # Verify CSS content
+        css_content = "".join(
+            call.args[0] for call in mocked_open.return_value.write.call_args_list
+        )
+        assert "body" in css_content
+        assert "font-family" in css_content
+
+
+class TestExportFunctions:
+    """Test cases for the export_to_* convenience functions."""
+    
+    @pytest.mark.parametrize("exporter_path,export_fn,method,extra_kw,output_path", [
+        (
+            'src.export.docx.DocxExporter',
+            export_to_docx,
+            'create_document',
+            {"template_path": "/path/to/template.docx"},
+            "/path/to/output.docx"
+        ),
+        (
+            'src.export.pdf.PDFExporter',
+            export_to_pdf,
+            'create_pdf_from_summary',
+            {"css_path": "/path/to/styles.css"},
+            "/path/to/output.pdf"
+        )
+    ], ids=["docx", "pdf"])
+    def test_export_to(self, monkeypatch, summary_result, exporter_path, export_fn, method, extra_kw, output_path):
+        """Test that the convenience function builds the exporter and forwards the summary."""
+        mock_exporter_class = MagicMock()
+        monkeypatch.setattr(exporter_path, mock_exporter_class)
+        mock_exporter = mock_exporter_class.return_value
+        getattr(mock_exporter, method).return_value = output_path
+        
+        result = export_fn(
+            summary_result=summary_result,
+            meeting_title="Test Meeting",
+            company_name="Test Company",
+            output_path=output_path,
+            **extra_kw
+        )
+        
+        # Verify exporter was created and used correctly; both functions pass positionally
+        mock_exporter_class.assert_called_once_with(*extra_kw.values())
+        getattr(mock_exporter, method).assert_called_once_with(
+            summary_result, "Test Meeting", "Test Company", output_path
+        )
+        assert result == output_path
 
 
 if __name__ == "__main__":
@@ -4,17 +4,18 @@ Unit tests for utility helpers module.
 
 import pytest
 from unittest.mock import patch, mock_open, MagicMock
-import tempfile
 import os
 import json
 import logging
+import logging.handlers
 from pathlib import Path
-import time
 
+from src.utils import helpers
 from src.utils.helpers import (
     timing_decorator,
     chunk_text,
     chunk_segments,
+    iter_chunk_segments,
     estimate_tokens,
     calculate_cost,
     generate_slug,
@@ -23,6 +24,7 @@ from src.utils.helpers import (
     load_config,
     save_metadata,
     compute_file_hash,
+    compute_file_hash_async,
     setup_logging,
     validate_environment,
     format_duration,
@@ -32,35 +34,63 @@ from src.utils.helpers import (
 )
 
 
+# Roughly 8000 characters (2000 tokens)
+_LARGE_TEXT = "This is a sentence. " * 400
+_LONG_A = "a" * 100
+_SEGMENTS = [
+    {"text": "A" * 100, "start": "00:00:01.000"},
+    {"text": "B" * 200, "start": "00:00:02.000"},
+    {"text": "C" * 150, "start": "00:00:03.000"}
+]
+_CONFIG_BYTES = b'{"key": "value", "number": 42}'
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmp_path_factory):
+    """Shared scratch directory for the filesystem tests in this module."""
+    return tmp_path_factory.mktemp("helpers_tests")
+
+
+@pytest.fixture
+def case_dir(tmp_root, request):
+    """Per-test subdirectory of the shared scratch directory."""
+    path = tmp_root / request.node.name
+    path.mkdir()
+    return path
+
+
 class TestTimingDecorator:
     """Test cases for timing decorator."""
     
-    def test_timing_decorator_success(self):
+    def test_timing_decorator_success(self, monkeypatch, caplog):
         """Test timing decorator with successful function execution."""
+        # Simulate 100 ms of work without actually sleeping
+        monkeypatch.setattr('src.utils.helpers.time.perf_counter_ns', iter([0, 100_000_000]).__next__)
+        
         @timing_decorator
         def test_func(x, y):
-            time.sleep(0.1)  # Simulate work
             return x + y
         
-        with patch('src.utils.helpers.logger') as mock_logger:
-            result = test_func(1, 2)
-            assert result == 3
-            mock_logger.info.assert_called_once()
-            assert "test_func executed in" in mock_logger.info.call_args[0][0]
+        caplog.set_level(logging.INFO, logger='src.utils.helpers')
+        
+        assert test_func(1, 2) == 3
+        assert caplog.record_tuples == [
+            ('src.utils.helpers', logging.INFO, "test_func executed in 0.10 seconds")
+        ]
     
-    def test_timing_decorator_exception(self):
+    def test_timing_decorator_exception(self, monkeypatch, caplog):
         """Test timing decorator with function that raises exception."""
+        monkeypatch.setattr('src.utils.helpers.time.perf_counter_ns', iter([0, 100_000_000]).__next__)
+        
         @timing_decorator
         def failing_func():
-            time.sleep(0.1)
             raise ValueError("Test error")
         
-        with patch('src.utils.helpers.logger') as mock_logger:
-            with pytest.raises(ValueError, match="Test error"):
-                failing_func()
-            
-            mock_logger.error.assert_called_once()
-            assert "failing_func failed after" in mock_logger.error.call_args[0][0]
+        with pytest.raises(ValueError, match="Test error"):
+            failing_func()
+        
+        errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+        assert errors == ["failing_func failed after 0.10 seconds: Test error"]
     
     def test_timing_decorator_preserves_function_metadata(self):
         """Test that timing decorator preserves function metadata."""
@@ -85,9 +115,7 @@ class TestTextProcessing:
     
     def test_chunk_text_large(self):
         """Test chunking large text."""
-        # Create text that's roughly 8000 characters (2000 tokens)
-        text = "This is a sentence. " * 400
-        chunks = chunk_text(text, max_tokens=500)  # 2000 chars max
+        chunks = chunk_text(_LARGE_TEXT, max_tokens=500)  # 2000 chars max
         
         assert len(chunks) > 1
         assert all(len(chunk) <= 2000 for chunk in chunks)
@@ -105,17 +133,19 @@ class TestTextProcessing:
         assert len(chunks) > 1
         # Check that there's some overlap between consecutive chunks
         for i in range(len(chunks) - 1):
-            # There should be some common text between chunks
-            assert any(word in chunks[i+1] for word in chunks[i].split()[-3:])
+            # There should be some common words between chunks
+            assert set(chunks[i].split()[-3:]) & set(chunks[i+1].split())
     
     def test_chunk_text_sentence_boundary(self):
         """Test chunking with sentence boundary detection."""
         text = "First sentence. Second sentence. Third sentence. Fourth sentence."
         chunks = chunk_text(text, max_tokens=15, overlap=0)  # 60 chars max
         
-        # Should break at sentence boundaries when possible
-        assert len(chunks) > 1
-        assert all(chunk.endswith('.') or chunk == chunks[-1] for chunk in chunks)
+        # Should break at the last sentence boundary that fits
+        assert chunks == [
+            "First sentence. Second sentence. Third sentence.",
+            "Fourth sentence."
+        ]
     
     def test_chunk_text_word_boundary(self):
         """Test chunking with word boundary detection."""
@@ -128,23 +158,23 @@ class TestTextProcessing:
     
     def test_chunk_segments(self):
         """Test segment chunking."""
-        segments = [
-            {"text": "A" * 100, "start": "00:00:01.000"},
-            {"text": "B" * 200, "start": "00:00:02.000"},
-            {"text": "C" * 150, "start": "00:00:03.000"}
-        ]
-        
-        chunks = chunk_segments(segments, max_tokens=100)  # 400 chars max
+        chunks = chunk_segments(_SEGMENTS, max_tokens=100)  # 400 chars max
         
         assert len(chunks) > 1
-        assert all(isinstance(chunk, list) for chunk in chunks)
-        assert all(len(chunk) > 0 for chunk in chunks)
+        assert all(isinstance(chunk, list) and chunk for chunk in chunks)
     
     def test_chunk_segments_empty(self):
         """Test segment chunking with empty list."""
         chunks = chunk_segments([], max_tokens=100)
         assert chunks == []
     
+    def test_iter_chunk_segments_is_lazy(self):
+        """Test that iter_chunk_segments yields the same chunks lazily."""
+        chunk_iter = iter_chunk_segments(iter(_SEGMENTS), max_tokens=100)
+        
+        assert not isinstance(chunk_iter, list)
+        assert list(chunk_iter) == chunk_segments(_SEGMENTS, max_tokens=100)
+    
     def test_chunk_segments_with_translated_text(self):
         """Test segment chunking with translated text."""
         segments = [
@@ -155,47 +185,32 @@ class TestTextProcessing:
         chunks = chunk_segments(segments, max_tokens=50)  # 200 chars max
         
         assert len(chunks) > 1
-        assert all(isinstance(chunk, list) for chunk in chunks)
-    
-    def test_estimate_tokens(self):
+        assert all(isinstance(chunk, list) and chunk for chunk in chunks)
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("", 0),
+        ("test", 1),  # 4 chars / 4 = 1 token
+        ("a" * 400, 100),  # 400 chars / 4 = 100 tokens
+    ], ids=["empty", "one_token", "short"])
+    def test_estimate_tokens(self, text, expected):
         """Test token estimation."""
-        assert estimate_tokens("") == 0
-        assert estimate_tokens("test") == 1  # 4 chars / 4 = 1 token
-        assert estimate_tokens("a" * 400) == 100  # 400 chars / 4 = 100 tokens
+        assert estimate_tokens(text) == expected
 
 
 class TestCostCalculation:
     """Test cases for cost calculation functions."""
     
-    def test_calculate_cost_gpt4o(self):
-        """Test cost calculation for GPT-4o."""
-        cost = calculate_cost(1000, "gpt-4o")
-        assert cost == 0.03  # 1000 tokens * $0.03 / 1000
-    
-    def test_calculate_cost_gpt4(self):
-        """Test cost calculation for GPT-4."""
-        cost = calculate_cost(1000, "gpt-4")
-        assert cost == 0.06  # 1000 tokens * $0.06 / 1000
-    
-    def test_calculate_cost_gpt35_turbo(self):
-        """Test cost calculation for GPT-3.5-turbo."""
-        cost = calculate_cost(1000, "gpt-3.5-turbo")
-        assert cost == 0.002  # 1000 tokens * $0.002 / 1000
-    
-    def test_calculate_cost_azure_translator(self):
-        """Test cost calculation for Azure Translator."""
-        cost = calculate_cost(1000, "azure-translator")
-        assert cost == 0.01  # 1000 tokens * $0.01 / 1000
-    
-    def test_calculate_cost_unknown_model(self):
-        """Test cost calculation for unknown model."""
-        cost = calculate_cost(1000, "unknown-model")
-        assert cost == 0.03  # Falls back to gpt-4o pricing
-    
-    def test_calculate_cost_zero_tokens(self):
-        """Test cost calculation with zero tokens."""
-        cost = calculate_cost(0, "gpt-4o")
-        assert cost == 0.0
+    @pytest.mark.parametrize("tokens,model,expected", [
+        (1000, "gpt-4o", 0.03),  # 1000 tokens * $0.03 / 1000
+        (1000, "gpt-4", 0.06),
+        (1000, "gpt-3.5-turbo", 0.002),
+        (1000, "azure-translator", 0.01),
+        (1000, "unknown-model", 0.03),  # Falls back to gpt-4o pricing
+        (0, "gpt-4o", 0.0),
+    ], ids=["gpt4o", "gpt4", "gpt35_turbo", "azure_translator", "unknown_model", "zero_tokens"])
+    def test_calculate_cost(self, tokens, model, expected):
+        """Test cost calculation per model."""
+        assert calculate_cost(tokens, model) == expected
 
 
 class TestStringUtilities:
@@ -208,8 +223,7 @@ class TestStringUtilities:
         assert generate_slug("Multiple   Spaces") == "multiple-spaces"
         
         # Test max length
-        long_text = "a" * 100
-        slug = generate_slug(long_text, max_length=10)
+        slug = generate_slug(_LONG_A, max_length=10)
         assert len(slug) <= 10
     
     def test_generate_slug_hyphen_break(self):
@@ -233,14 +247,23 @@ class TestStringUtilities:
             "https://youtube.com/watch?v=dQw4w9WgXcQ"
         ]
         
-        for url in urls:
-            video_id = extract_video_id(url)
-            assert video_id == "dQw4w9WgXcQ"
+        assert list(map(extract_video_id, urls)) == ["dQw4w9WgXcQ"] * len(urls)
+    
+    def test_extract_video_id_is_memoized(self):
+        """Test that repeated URLs are served from the cache."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        extract_video_id.cache_clear()
+        
+        for _ in range(1000):
+            assert extract_video_id(url) == "dQw4w9WgXcQ"
         
-        # Test invalid URL
-        assert extract_video_id("https://example.com") is None
-        assert extract_video_id("") is None
-        assert extract_video_id("not_a_url") is None
+        cache_info = extract_video_id.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 999)
+    
+    @pytest.mark.parametrize("url", ["https://example.com", "", "not_a_url"])
+    def test_extract_video_id_invalid(self, url):
+        """Test YouTube video ID extraction from invalid URLs."""
+        assert extract_video_id(url) is None
     
     def test_format_duration(self):
         """Test duration formatting."""
@@ -251,13 +274,16 @@ class TestStringUtilities:
         assert format_duration(60) == "1m 0s"
         assert format_duration(3600) == "1h 0m 0s"
     
-    def test_clean_filename(self):
+    @pytest.mark.parametrize("filename,expected", [
+        ("hello<world>", "helloworld"),
+        ("file with spaces.txt", "file_with_spaces.txt"),
+        ("  .hidden  ", "hidden"),
+        ("file/with\\slashes", "filewithslashes"),
+        ("file|with?special*chars", "filewithspecialchars"),
+    ])
+    def test_clean_filename(self, filename, expected):
         """Test filename cleaning."""
-        assert clean_filename("hello<world>") == "helloworld"
-        assert clean_filename("file with spaces.txt") == "file_with_spaces.txt"
-        assert clean_filename("  .hidden  ") == "hidden"
-        assert clean_filename("file/with\\slashes") == "filewithslashes"
-        assert clean_filename("file|with?special*chars") == "filewithspecialchars"
+        assert clean_filename(filename) == expected
     
     def test_clean_filename_empty(self):
         """Test filename cleaning with empty/whitespace-only strings."""
@@ -269,307 +295,339 @@ class TestStringUtilities:
 class TestDirectoryOperations:
     """Test cases for directory operations."""
     
-    def test_create_output_directory(self):
+    def test_create_output_directory(self, case_dir):
         """Test output directory creation."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_dir = Path(tmp_dir)
-            video_id = "test_video_123"
-            
-            output_dir = create_output_directory(base_dir, video_id)
-            
-            assert output_dir.exists()
-            assert output_dir.is_dir()
-            assert video_id in output_dir.name
-    
-    def test_create_output_directory_existing(self):
+        base_dir = case_dir
+        video_id = "test_video_123"
+        
+        output_dir = create_output_directory(base_dir, video_id)
+        
+        assert output_dir.exists()
+        assert output_dir.is_dir()
+        assert video_id in output_dir.name
+    
+    def test_create_output_directory_existing(self, case_dir):
         """Test output directory creation when directory already exists."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_dir = Path(tmp_dir)
-            video_id = "test_video_123"
-            
-            # Create directory first time
-            output_dir1 = create_output_directory(base_dir, video_id)
-            
-            # Create again - should handle existing directory
-            output_dir2 = create_output_directory(base_dir, video_id)
-            
-            assert output_dir1.exists()
-            assert output_dir2.exists()
-            # Should be same or similar directory
-            assert output_dir1.parent == output_dir2.parent
-    
-    def test_ensure_directory(self):
+        base_dir = case_dir
+        video_id = "test_video_123"
+        
+        # Create directory first time
+        output_dir1 = create_output_directory(base_dir, video_id)
+        
+        # Create again - should handle existing directory
+        output_dir2 = create_output_directory(base_dir, video_id)
+        
+        assert output_dir1.exists()
+        assert output_dir2.exists()
+        # Should be same or similar directory
+        assert output_dir1.parent == output_dir2.parent
+    
+    def test_ensure_directory(self, case_dir):
         """Test ensure_directory function."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            test_path = Path(tmp_dir) / "new_dir" / "nested_dir"
-            
-            result = ensure_directory(test_path)
-            
-            assert result.exists()
-            assert result.is_dir()
-            assert result == test_path
-    
-    def test_ensure_directory_existing(self):
+        test_path = case_dir / "new_dir" / "nested_dir"
+        
+        result = ensure_directory(test_path)
+        
+        assert result.exists()
+        assert result.is_dir()
+        assert result == test_path
+    
+    def test_ensure_directory_existing(self, case_dir):
         """Test ensure_directory with existing directory."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            existing_dir = Path(tmp_dir)
-            
-            result = ensure_directory(existing_dir)
-            
-            assert result == existing_dir
-            assert result.exists()
-    
-    def test_ensure_directory_string_path(self):
+        existing_dir = case_dir
+        
+        result = ensure_directory(existing_dir)
+        
+        assert result == existing_dir
+        assert result.exists()
+    
+    def test_ensure_directory_string_path(self, case_dir):
         """Test ensure_directory with string path."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            test_path = os.path.join(tmp_dir, "string_path")
-            
-            result = ensure_directory(test_path)
-            
-            assert result.exists()
-            assert result.is_dir()
-            assert str(result) == test_path
+        test_path = os.path.join(case_dir, "string_path")
+        
+        result = ensure_directory(test_path)
+        
+        assert result.exists()
+        assert result.is_dir()
+        assert str(result) == test_path
 
 
 class TestProgressTracker:
     """Test cases for ProgressTracker class."""
     
-    def test_progress_tracker_init(self):
-        """Test ProgressTracker initialization."""
-        tracker = ProgressTracker(10, "Test")
-        assert tracker.total_steps == 10
-        assert tracker.current_step == 0
-        assert tracker.description == "Test"
-    
-    def test_progress_tracker_update(self):
-        """Test progress tracking update."""
+    def test_progress_tracker_lifecycle(self):
+        """Test ProgressTracker initialization, updates and percentage."""
         tracker = ProgressTracker(10, "Test")
-        tracker.update(3, "Processing")
-        assert tracker.current_step == 3
-        
-        tracker.update(2)
-        assert tracker.current_step == 5
-    
-    def test_progress_tracker_finish(self):
+        assert (tracker.total_steps, tracker.current_step, tracker.description, tracker.percentage) == (10, 0, "Test", 0.0)
+        
+        for step, current_step, percentage in [(3, 3, 30.0), (2, 5, 50.0), (5, 10, 100.0)]:
+            tracker.update(step)
+            assert (tracker.current_step, tracker.percentage) == (current_step, percentage)
+    
+    @pytest.mark.parametrize("total_steps, expected", [(11, 100.0), (3, 100.0), (0, 0.0)])
+    def test_progress_tracker_percentage_when_complete(self, total_steps, expected):
+        """Test that a finished tracker reports exactly 100% (or 0% with no steps)."""
+        tracker = ProgressTracker(total_steps, "Test")
+        tracker.current_step = total_steps
+        assert tracker.percentage == expected
+    
+    def test_progress_tracker_update_throttles_logging(self, monkeypatch, caplog):
+        """Test that rapid updates are logged at most once per interval."""
+        monkeypatch.setattr('src.utils.helpers.time.monotonic', lambda: 0.0)
+        caplog.set_level(logging.INFO, logger='src.utils.helpers')
+        
+        tracker = ProgressTracker(100, "Test")
+        caplog.clear()
+        for _ in range(100):
+            tracker.update()
+        
+        # First update and the final step are logged, everything in between is dropped
+        assert len(caplog.records) == 2
+        assert "100/100" in caplog.records[-1].getMessage()
+    
+    def test_progress_tracker_finish(self, caplog):
         """Test progress tracking finish."""
         tracker = ProgressTracker(10, "Test")
         tracker.update(5)
         
-        with patch('src.utils.helpers.logger') as mock_logger:
-            tracker.finish()
-            mock_logger.info.assert_called_once()
-            assert "Test completed" in mock_logger.info.call_args[0][0]
-    
-    def test_progress_tracker_percentage(self):
-        """Test progress percentage calculation."""
-        tracker = ProgressTracker(10, "Test")
-        assert tracker.percentage == 0.0
-        
-        tracker.update(5)
-        assert tracker.percentage == 50.0
+        caplog.set_level(logging.INFO, logger='src.utils.helpers')
+        caplog.clear()
+        tracker.finish()
         
-        tracker.update(5)
-        assert tracker.percentage == 100.0
+        assert len(caplog.records) == 1
+        assert "Test completed" in caplog.records[0].getMessage()
 
 
 class TestEnvironmentValidation:
     """Test cases for environment validation."""
     
-    @patch.dict(os.environ, {
-        "AZURE_OPENAI_KEY": "test_key",
-        "AZURE_OPENAI_ENDPOINT": "test_endpoint",
-        "AZURE_TRANSLATOR_KEY": "test_key",
-        "AZURE_TRANSLATOR_ENDPOINT": "test_endpoint"
-    })
-    def test_validate_environment_complete(self):
+    @pytest.fixture
+    def set_env(self, monkeypatch):
+        """Set only the given required variables, unsetting the rest."""
+        def _set_env(*present):
+            for var in helpers._REQUIRED_ENV_VARS:
+                if var in present:
+                    monkeypatch.setenv(var, "test_value")
+                else:
+                    monkeypatch.delenv(var, raising=False)
+        return _set_env
+    
+    def test_validate_environment_complete(self, set_env):
         """Test environment validation with all variables set."""
-        missing = validate_environment()
-        assert missing == []
+        set_env(*helpers._REQUIRED_ENV_VARS)
+        assert validate_environment() == []
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_validate_environment_missing(self):
+    def test_validate_environment_missing(self, set_env):
         """Test environment validation with missing variables."""
-        missing = validate_environment()
-        assert len(missing) == 4
-        assert "AZURE_OPENAI_KEY" in missing
-        assert "AZURE_OPENAI_ENDPOINT" in missing
-        assert "AZURE_TRANSLATOR_KEY" in missing
-        assert "AZURE_TRANSLATOR_ENDPOINT" in missing
-    
-    @patch.dict(os.environ, {
-        "AZURE_OPENAI_KEY": "test_key",
-        "AZURE_OPENAI_ENDPOINT": "test_endpoint"
-    })
-    def test_validate_environment_partial(self):
+        set_env()
+        assert validate_environment() == list(helpers._REQUIRED_ENV_VARS)
+    
+    def test_validate_environment_partial(self, set_env):
         """Test environment validation with some variables set."""
-        missing = validate_environment()
-        assert len(missing) == 2
-        assert "AZURE_TRANSLATOR_KEY" in missing
-        assert "AZURE_TRANSLATOR_ENDPOINT" in missing
+        set_env("AZURE_OPENAI_KEY", "AZURE_OPENAI_ENDPOINT")
+        assert validate_environment() == ["AZURE_TRANSLATOR_KEY", "AZURE_TRANSLATOR_ENDPOINT"]
 
 
 class TestLoggingSetup:
     """Test cases for logging setup."""
     
-    @patch('src.utils.helpers.logging.basicConfig')
-    def test_setup_logging_default(self, mock_basic_config):
+    @pytest.fixture(autouse=True)
+    def root_logger(self):
+        """Yield the root logger and restore its configuration afterwards."""
+        root = logging.getLogger()
+        saved_handlers = root.handlers[:]
+        saved_level = root.level
+        
+        yield root
+        
+        helpers._stop_log_listener()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+    
+    def test_setup_logging_default(self, root_logger):
         """Test logging setup with default parameters."""
         setup_logging()
         
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args[1]
-        assert call_args['level'] == logging.INFO
-        assert 'format' in call_args
+        assert root_logger.level == logging.INFO
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], logging.handlers.QueueHandler)
+        
+        listener_handlers = helpers._log_listener.handlers
+        assert len(listener_handlers) == 1
+        assert isinstance(listener_handlers[0], logging.StreamHandler)
+        assert "%(asctime)s" in listener_handlers[0].formatter._fmt
     
-    @patch('src.utils.helpers.logging.basicConfig')
-    def test_setup_logging_custom_level(self, mock_basic_config):
+    def test_setup_logging_custom_level(self, root_logger):
         """Test logging setup with custom level."""
         setup_logging(log_level="DEBUG")
         
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args[1]
-        assert call_args['level'] == logging.DEBUG
+        assert root_logger.level == logging.DEBUG
     
-    @patch('src.utils.helpers.logging.basicConfig')
-    def test_setup_logging_with_file(self, mock_basic_config):
+    def test_setup_logging_with_file(self, case_dir):
         """Test logging setup with file output."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            log_file = tmp_file.name
-        
-        try:
-            setup_logging(log_file=log_file)
-            
-            mock_basic_config.assert_called_once()
-            call_args = mock_basic_config.call_args[1]
-            assert 'handlers' in call_args
-            
-        finally:
-            os.unlink(log_file)
-    
-    @patch('src.utils.helpers.logging.basicConfig')
-    def test_setup_logging_custom_format(self, mock_basic_config):
+        log_file = case_dir / "verba.log"
+        setup_logging(log_file=str(log_file))
+        
+        listener_handlers = helpers._log_listener.handlers
+        assert any(isinstance(h, logging.FileHandler) for h in listener_handlers)
+        
+        logging.getLogger("verba.test").info("written by listener")
+        helpers._stop_log_listener()
+        
+        assert "written by listener" in log_file.read_text()
+    
+    def test_setup_logging_custom_format(self):
         """Test logging setup with custom format."""
         custom_format = "%(levelname)s - %(message)s"
         setup_logging(log_format=custom_format)
         
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args[1]
-        assert call_args['format'] == custom_format
+        for handler in helpers._log_listener.handlers:
+            assert handler.formatter._fmt == custom_format
     
-    @patch('src.utils.helpers.logging.basicConfig')
-    def test_setup_logging_invalid_level(self, mock_basic_config):
+    def test_setup_logging_invalid_level(self, root_logger):
         """Test logging setup with invalid level."""
         setup_logging(log_level="INVALID")
         
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args[1]
         # Should default to INFO for invalid level
-        assert call_args['level'] == logging.INFO
+        assert root_logger.level == logging.INFO
+    
+    def test_setup_logging_replaces_previous_configuration(self, root_logger):
+        """Test that calling setup_logging twice does not stack handlers."""
+        setup_logging()
+        first_listener = helpers._log_listener
+        setup_logging(log_level="WARNING")
+        
+        assert root_logger.level == logging.WARNING
+        assert len(root_logger.handlers) == 1
+        assert helpers._log_listener is not first_listener
 
 
 class TestFileOperations:
     """Test cases for file operation functions."""
     
-    def test_load_config_existing_file(self):
+    def test_load_config_existing_file(self, case_dir):
         """Test loading configuration from existing file."""
-        config_data = {"key": "value", "number": 42}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            json.dump(config_data, tmp)
-            tmp_path = tmp.name
+        config_file = case_dir / "config.json"
+        config_file.write_bytes(_CONFIG_BYTES)
         
-        try:
-            config = load_config(tmp_path)
-            assert config == config_data
-        finally:
-            os.unlink(tmp_path)
+        assert load_config(config_file) == {"key": "value", "number": 42}
     
     def test_load_config_non_existent_file(self):
         """Test loading configuration from non-existent file."""
         config = load_config("non_existent_file.json")
         assert config == {}
     
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, case_dir):
         """Test loading configuration from invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-            tmp.write("invalid json content")
-            tmp_path = tmp.name
+        config_file = case_dir / "config.json"
+        config_file.write_text("invalid json content")
         
-        try:
-            config = load_config(tmp_path)
-            assert config == {}  # Should return empty dict for invalid JSON
-        finally:
-            os.unlink(tmp_path)
+        # Should return empty dict for invalid JSON
+        assert load_config(config_file) == {}
     
-    def test_save_metadata(self):
+    def test_save_metadata(self, case_dir):
         """Test saving metadata to JSON file."""
         metadata = {"test": "data", "timestamp": "2024-01-01"}
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_dir = Path(tmp_dir)
+        output_dir = case_dir
+        save_metadata(output_dir, metadata)
+        
+        metadata_file = output_dir / "metadata.json"
+        assert metadata_file.exists()
+        
+        with open(metadata_file, 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+            assert saved_data == metadata
+    
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_save_metadata_normalizes_values(self, case_dir, use_orjson):
+        """Test that both JSON backends encode datetimes, paths and sets the same way."""
+        from datetime import datetime
+        
+        metadata = {
+            "created": datetime(2024, 1, 1, 10, 30),
+            "source": Path("meeting.vtt"),
+            "languages": {"en"},
+            "nested": {1: (2, 3)}
+        }
+        
+        output_dir = case_dir
+        if use_orjson:
+            pytest.importorskip("orjson")
             save_metadata(output_dir, metadata)
-            
-            metadata_file = output_dir / "metadata.json"
-            assert metadata_file.exists()
-            
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                saved_data = json.load(f)
-                assert saved_data == metadata
-    
-    def test_save_metadata_creates_directory(self):
+        else:
+            with patch('src.utils.helpers.orjson', None):
+                save_metadata(output_dir, metadata)
+        
+        with open(output_dir / "metadata.json", 'r', encoding='utf-8') as f:
+            saved_data = json.load(f)
+        
+        assert saved_data == {
+            "created": "2024-01-01T10:30:00",
+            "source": "meeting.vtt",
+            "languages": ["en"],
+            "nested": {"1": [2, 3]}
+        }
+    
+    def test_save_metadata_creates_directory(self, case_dir):
         """Test that save_metadata creates directory if it doesn't exist."""
         metadata = {"test": "data"}
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_dir = Path(tmp_dir) / "new_dir"
-            save_metadata(output_dir, metadata)
-            
-            assert output_dir.exists()
-            metadata_file = output_dir / "metadata.json"
-            assert metadata_file.exists()
+        output_dir = case_dir / "new_dir"
+        save_metadata(output_dir, metadata)
+        
+        assert output_dir.exists()
+        metadata_file = output_dir / "metadata.json"
+        assert metadata_file.exists()
     
-    def test_compute_file_hash(self):
+    def test_compute_file_hash(self, case_dir):
         """Test file hash computation."""
-        test_content = b"This is test content"
+        file_path = case_dir / "content.bin"
+        file_path.write_bytes(b"This is test content")
         
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp.write(test_content)
-            tmp_path = tmp.name
-        
-        try:
-            hash1 = compute_file_hash(tmp_path)
-            hash2 = compute_file_hash(tmp_path)
-            
-            # Same file should produce same hash
-            assert hash1 == hash2
-            assert len(hash1) == 64  # SHA-256 hex length
-            
-        finally:
-            os.unlink(tmp_path)
-    
-    def test_compute_file_hash_different_content(self):
+        hash1 = compute_file_hash(file_path)
+        hash2 = compute_file_hash(file_path)
+        
+        # Same file should produce the same, known SHA-256 digest
+        assert hash1 == hash2 == "726df8bcc21cb319dde031e10a3ab40ee5ce4979cef01451a9be341fec8e8153"
+    
+    def test_compute_file_hash_different_content(self, case_dir):
         """Test file hash computation with different content."""
-        content1 = b"Content 1"
-        content2 = b"Content 2"
-        
-        with tempfile.NamedTemporaryFile(delete=False) as tmp1:
-            tmp1.write(content1)
-            tmp1_path = tmp1.name
-        
-        with tempfile.NamedTemporaryFile(delete=False) as tmp2:
-            tmp2.write(content2)
-            tmp2_path = tmp2.name
-        
-        try:
-            hash1 = compute_file_hash(tmp1_path)
-            hash2 = compute_file_hash(tmp2_path)
-            
-            # Different content should produce different hashes
-            assert hash1 != hash2
-            
-        finally:
-            os.unlink(tmp1_path)
-            os.unlink(tmp2_path)
+        file1 = case_dir / "content1.bin"
+        file2 = case_dir / "content2.bin"
+        file1.write_bytes(b"Content 1")
+        file2.write_bytes(b"Content 2")
+        
+        # Different content should produce different hashes
+        assert compute_file_hash(file1) != compute_file_hash(file2)
+    
+    def test_compute_file_hash_empty_file(self, case_dir):
+        """Test file hash computation for an empty file, which cannot be memory-mapped."""
+        import hashlib
+        
+        file_path = case_dir / "empty.bin"
+        file_path.touch()
+        
+        assert compute_file_hash(file_path) == hashlib.sha256(b"").hexdigest()
+    
+    def test_compute_file_hash_blake3(self, case_dir):
+        """Test file hash computation with the BLAKE3 algorithm."""
+        blake3 = pytest.importorskip("blake3")
+        test_content = b"This is test content"
+        file_path = case_dir / "content.bin"
+        file_path.write_bytes(test_content)
+        
+        file_hash = compute_file_hash(file_path, algorithm="blake3")
+        
+        assert file_hash == blake3.blake3(test_content).hexdigest()
+        assert file_hash != compute_file_hash(file_path)
+    
+    async def test_compute_file_hash_async(self, case_dir):
+        """Test async file hash computation matches the sync version."""
+        file_path = case_dir / "content.bin"
+        file_path.write_bytes(b"This is test content")
+        
+        assert await compute_file_hash_async(file_path) == compute_file_hash(file_path)
     
     def test_compute_file_hash_nonexistent_file(self):
         """Test file hash computation with non-existent file."""
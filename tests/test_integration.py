@@ -8,19 +8,56 @@ import asyncio
 import json
 import os
 import tempfile
+import threading
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-import sys
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from scripts.run_local import VerbaPipeline
 from src.ingest.parser import VTTParser
 from src.utils.helpers import extract_video_id, validate_environment
 
 
+@pytest.fixture
+def pipeline_mocks(monkeypatch):
+    """Replace every external pipeline stage where run_local looks it up."""
+    mocks = SimpleNamespace(
+        download=Mock(),
+        parse=Mock(),
+        translate=AsyncMock(),
+        summarize=Mock(),
+        docx=Mock(),
+        pdf=Mock(),
+        email=Mock()
+    )
+    for name, mock in [
+        ("download_subtitles", mocks.download),
+        ("parse_vtt_file", mocks.parse),
+        ("translate_segments_async", mocks.translate),
+        ("summarize_translated_segments", mocks.summarize),
+        ("export_to_docx", mocks.docx),
+        ("export_to_pdf", mocks.pdf),
+        ("send_meeting_minutes", mocks.email)
+    ]:
+        monkeypatch.setattr(f"scripts.run_local.{name}", mock)
+    return mocks
+
+
+@pytest.fixture(scope="class")
+def shared_tmp(tmp_path_factory):
+    """Scratch directory shared by all tests in a class."""
+    return tmp_path_factory.mktemp("verba_integration")
+
+
+@pytest.fixture
+def tmp_dir(shared_tmp, request):
+    """Per-test subdirectory of the class scratch directory, as a string path."""
+    path = shared_tmp / request.node.name
+    path.mkdir()
+    return str(path)
+
+
 class TestPipelineIntegration:
     """Integration tests for the complete pipeline."""
 
@@ -36,6 +73,11 @@ class TestPipelineIntegration:
         for url, expected_id in test_urls:
             video_id = extract_video_id(url)
             assert video_id == expected_id, f"Failed to extract ID from {url}"
+        
+        # Repeated URLs are served from the cache
+        hits = extract_video_id.cache_info().hits
+        assert extract_video_id(test_urls[0][0]) == test_urls[0][1]
+        assert extract_video_id.cache_info().hits == hits + 1
 
     def test_environment_validation(self):
         """Test environment variable validation."""
@@ -54,146 +96,181 @@ class TestPipelineIntegration:
             if not os.getenv(var):
                 assert var in missing_vars
 
-    @patch('scripts.download_subs.download_subtitles')
-    @patch('src.ingest.parser.parse_vtt_file')
-    @patch('src.translate.azure.translate_segments_async')
-    @patch('src.summarize.gpt.summarize_translated_segments')
-    @patch('src.export.docx.export_to_docx')
-    @patch('src.export.pdf.export_to_pdf')
-    @patch('src.utils.email.send_meeting_minutes')
-    def test_complete_pipeline_success(
-        self,
-        mock_email,
-        mock_pdf,
-        mock_docx,
-        mock_summarize,
-        mock_translate,
-        mock_parse,
-        mock_download
-    ):
+    def test_complete_pipeline_success(self, pipeline_mocks, tmp_dir):
         """Test successful execution of the complete pipeline."""
         
         # Mock return values
-        mock_download.return_value = "/tmp/test.vtt"
-        mock_parse.return_value = [
+        pipeline_mocks.download.return_value = ("/tmp/test.vtt", 10)
+        pipeline_mocks.parse.return_value = [
             {"text": "Hello world", "start_seconds": 0.0, "end_seconds": 5.0},
             {"text": "This is a test", "start_seconds": 5.0, "end_seconds": 10.0}
         ]
-        mock_translate.return_value = [
+        pipeline_mocks.translate.return_value = [
             {"text": "Olá mundo", "text_translated": "Olá mundo", "start_seconds": 0.0, "end_seconds": 5.0},
             {"text": "Isto é um teste", "text_translated": "Isto é um teste", "start_seconds": 5.0, "end_seconds": 10.0}
         ]
         
         # Mock summary result
         mock_summary = Mock()
-        mock_summary.executive_summary = "Resumo executivo"
-        mock_summary.decisions = ["Decisão 1", "Decisão 2"] 
-        mock_summary.next_actions = ["Ação 1", "Ação 2"]
-        mock_summary.full_transcript = "Transcrição completa"
+        mock_summary.slug = "ata"
+        mock_summary.resumo_executivo = "Resumo executivo"
+        mock_summary.decisoes = ["Decisão 1", "Decisão 2"]
+        mock_summary.proximas_acoes = ["Ação 1", "Ação 2"]
         mock_summary.tokens_used = 1000
         mock_summary.processing_time = 5.0
-        mock_summarize.return_value = mock_summary
+        pipeline_mocks.summarize.return_value = mock_summary
         
-        mock_docx.return_value = "/tmp/output/ata.docx"
-        mock_pdf.return_value = "/tmp/output/ata.pdf"
-        mock_email.return_value = True
+        pipeline_mocks.docx.return_value = "/tmp/output/ata.docx"
+        pipeline_mocks.pdf.return_value = "/tmp/output/ata.pdf"
+        pipeline_mocks.email.return_value = True
 
-        # Create temporary directory for pipeline
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
-            
-            # Run pipeline
-            result_pdf = pipeline.run_pipeline(
-                video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                meeting_title="Test Meeting",
-                send_email=True,
-                email_to="test@example.com",
-                language="en"
+        pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
+        
+        # Run pipeline
+        result_pdf = pipeline.run_pipeline(
+            video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            meeting_title="Test Meeting",
+            send_email=True,
+            email_to="test@example.com",
+            language="en"
+        )
+        
+        # Verify all components were called
+        pipeline_mocks.download.assert_called_once()
+        pipeline_mocks.parse.assert_called_once()
+        pipeline_mocks.translate.assert_called_once()
+        pipeline_mocks.summarize.assert_called_once()
+        pipeline_mocks.docx.assert_called_once()
+        pipeline_mocks.pdf.assert_called_once()
+        pipeline_mocks.email.assert_called_once()
+        
+        # Verify result
+        assert result_pdf == "/tmp/output/ata.pdf"
+        
+        # Check metadata was saved
+        metadata_files = list(Path(tmp_dir).rglob("metadata.json"))
+        assert len(metadata_files) > 0
+        
+        # Verify metadata content
+        with open(metadata_files[0], 'r') as f:
+            metadata = json.load(f)
+            assert "pipeline_version" in metadata
+            assert "start_time" in metadata
+            assert "steps" in metadata
+            assert len(metadata["steps"]) == 7
+    
+    def test_pipeline_writes_metadata_once(self, pipeline_mocks, tmp_dir):
+        """Test that step metadata is collected in memory and written a single time."""
+        pipeline_mocks.download.return_value = ("/tmp/test.vtt", 10)
+        pipeline_mocks.parse.return_value = [{"text": "Hello world"}]
+        pipeline_mocks.translate.return_value = [{"text": "Olá mundo"}]
+        pipeline_mocks.summarize.return_value = Mock(
+            slug="ata",
+            resumo_executivo="Resumo executivo",
+            decisoes=[],
+            proximas_acoes=[],
+            tokens_used=1000,
+            processing_time=5.0
+        )
+        
+        pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
+        
+        with patch('scripts.run_local.save_metadata') as mock_save:
+            pipeline.run_pipeline(video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        
+        mock_save.assert_called_once()
+        assert [step["step"] for step in mock_save.call_args[0][1]["steps"]] == [
+            "download_subtitles",
+            "parse_vtt",
+            "translate_segments",
+            "summarize_segments",
+            "generate_docx",
+            "generate_pdf",
+            "send_email"
+        ]
+    
+    def test_generate_documents_runs_exports_concurrently(self, tmp_path):
+        """Test that DOCX and PDF export overlap instead of running back to back."""
+        docx_started = threading.Event()
+        pdf_started = threading.Event()
+        
+        def fake_docx(summary_result, title, company_name, path):
+            docx_started.set()
+            # Only returns once the PDF export is running at the same time
+            assert pdf_started.wait(timeout=5)
+            return str(path)
+        
+        def fake_pdf(summary_result, title, company_name, path):
+            pdf_started.set()
+            assert docx_started.wait(timeout=5)
+            return str(path)
+        
+        summary_result = Mock(slug="ata")
+        pipeline = VerbaPipeline(output_dir=tmp_path, tmp_dir=tmp_path)
+        
+        with patch('scripts.run_local.export_to_docx', side_effect=fake_docx), \
+                patch('scripts.run_local.export_to_pdf', side_effect=fake_pdf):
+            docx_path, pdf_path = asyncio.run(
+                pipeline._generate_documents(summary_result, "Test Meeting", tmp_path)
             )
-            
-            # Verify all components were called
-            mock_download.assert_called_once()
-            mock_parse.assert_called_once()
-            mock_translate.assert_called_once()
-            mock_summarize.assert_called_once()
-            mock_docx.assert_called_once()
-            mock_pdf.assert_called_once()
-            mock_email.assert_called_once()
-            
-            # Verify result
-            assert result_pdf == "/tmp/output/ata.pdf"
-            
-            # Check metadata was saved
-            metadata_files = list(Path(tmp_dir).rglob("metadata.json"))
-            assert len(metadata_files) > 0
-            
-            # Verify metadata content
-            with open(metadata_files[0], 'r') as f:
-                metadata = json.load(f)
-                assert "pipeline_version" in metadata
-                assert "start_time" in metadata
-                assert "steps" in metadata
-                assert len(metadata["steps"]) == 7
+        
+        assert docx_path == str(tmp_path / "ata.docx")
+        assert pdf_path == str(tmp_path / "ata.pdf")
 
-    @patch('scripts.download_subs.download_subtitles')
-    def test_pipeline_download_failure(self, mock_download):
+    def test_pipeline_download_failure(self, pipeline_mocks, tmp_dir):
         """Test pipeline behavior when subtitle download fails."""
-        mock_download.side_effect = Exception("Download failed")
+        pipeline_mocks.download.side_effect = Exception("Download failed")
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
-            
-            with pytest.raises(Exception, match="Download failed"):
-                pipeline.run_pipeline(
-                    video_url="https://www.youtube.com/watch?v=invalid",
-                    language="en"
-                )
+        pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
+        
+        with pytest.raises(Exception, match="Download failed"):
+            pipeline.run_pipeline(
+                video_url="https://www.youtube.com/watch?v=invalid",
+                language="en"
+            )
 
-    def test_pipeline_invalid_video_url(self):
+    def test_pipeline_invalid_video_url(self, tmp_dir):
         """Test pipeline behavior with invalid video URL."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
-            
-            with pytest.raises(ValueError, match="Could not extract video ID"):
-                pipeline.run_pipeline(
-                    video_url="https://invalid-url.com",
-                    language="en"
-                )
+        pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
+        
+        with pytest.raises(ValueError, match="Could not extract video ID"):
+            pipeline.run_pipeline(
+                video_url="https://invalid-url.com",
+                language="en"
+            )
 
     @patch('scripts.download_subs.download_subtitles')
     @patch('src.ingest.parser.parse_vtt_file')
-    def test_pipeline_empty_subtitles(self, mock_parse, mock_download):
+    def test_pipeline_empty_subtitles(self, mock_parse, mock_download, tmp_dir):
         """Test pipeline behavior with empty subtitle file."""
         mock_download.return_value = "/tmp/test.vtt"
         mock_parse.return_value = []  # Empty segments
         
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
-            
-            # Should handle empty segments gracefully
-            with pytest.raises(Exception):  # Translation will fail with empty segments
-                pipeline.run_pipeline(
-                    video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                    language="en"
-                )
+        pipeline = VerbaPipeline(output_dir=tmp_dir, tmp_dir=tmp_dir)
+        
+        # Should handle empty segments gracefully
+        with pytest.raises(Exception):  # Translation will fail with empty segments
+            pipeline.run_pipeline(
+                video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                language="en"
+            )
 
-    def test_pipeline_initialization(self):
+    def test_pipeline_initialization(self, tmp_dir):
         """Test pipeline initialization creates required directories."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_dir = Path(tmp_dir) / "output"
-            tmp_work_dir = Path(tmp_dir) / "tmp"
-            
-            pipeline = VerbaPipeline(output_dir=str(output_dir), tmp_dir=str(tmp_work_dir))
-            
-            # Check directories were created
-            assert output_dir.exists()
-            assert tmp_work_dir.exists()
-            
-            # Check metadata initialization
-            assert "pipeline_version" in pipeline.metadata
-            assert "start_time" in pipeline.metadata
-            assert "steps" in pipeline.metadata
-            assert pipeline.metadata["steps"] == []
+        output_dir = Path(tmp_dir) / "output"
+        tmp_work_dir = Path(tmp_dir) / "tmp"
+        
+        pipeline = VerbaPipeline(output_dir=str(output_dir), tmp_dir=str(tmp_work_dir))
+        
+        # Check directories were created
+        assert output_dir.exists()
+        assert tmp_work_dir.exists()
+        
+        # Check metadata initialization
+        assert "pipeline_version" in pipeline.metadata
+        assert "start_time" in pipeline.metadata
+        assert "steps" in pipeline.metadata
+        assert pipeline.metadata["steps"] == []
 
 
 class TestComponentIntegration:
@@ -218,40 +295,25 @@ This is a test
         try:
             # Parse VTT file
             parser = VTTParser()
+            segments = parser.parse_file(tmp_path)
+            
+            # Verify segments structure for downstream processing
+            assert len(segments) == 2
+            for segment in segments:
+                assert "text" in segment
+                assert "start_seconds" in segment
+                assert "end_seconds" in segment
+                assert "duration" in segment
+                assert isinstance(segment["start_seconds"], float)
+                assert isinstance(segment["end_seconds"], float)
+                assert segment["duration"] > 0
             
-            # Mock webvtt.read for this test
-            with patch('webvtt.read') as mock_webvtt:
-                class MockCaption:
-                    def __init__(self, start, end, text):
-                        self.start = start
-                        self.end = end
-                        self.text = text
-                
-                mock_captions = [
-                    MockCaption("00:00:01.000", "00:00:05.000", "Hello world"),
-                    MockCaption("00:00:06.000", "00:00:10.000", "This is a test")
-                ]
-                mock_webvtt.return_value = mock_captions
-                
-                segments = parser.parse_file(tmp_path)
-                
-                # Verify segments structure for downstream processing
-                assert len(segments) == 2
-                for segment in segments:
-                    assert "text" in segment
-                    assert "start_seconds" in segment
-                    assert "end_seconds" in segment
-                    assert "duration" in segment
-                    assert isinstance(segment["start_seconds"], float)
-                    assert isinstance(segment["end_seconds"], float)
-                    assert segment["duration"] > 0
-                
-                # Test statistics
-                stats = parser.get_stats()
-                assert stats["total_segments"] == 2
-                assert stats["total_duration"] == 10.0
-                assert stats["total_words"] == 6  # "Hello world" + "This is a test"
-                
+            # Test statistics
+            stats = parser.get_stats()
+            assert stats["total_segments"] == 2
+            assert stats["total_duration"] == 10.0
+            assert stats["total_words"] == 6  # "Hello world" + "This is a test"
+        
         finally:
             os.unlink(tmp_path)
 
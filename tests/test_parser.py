@@ -11,6 +11,31 @@ import os
 from src.ingest.parser import VTTParser, parse_vtt_file, vtt_to_json
 
 
+_SAMPLE_VTT = """WEBVTT
+
+00:00:01.000 --> 00:00:05.000
+Hello world
+
+00:00:06.000 --> 00:00:10.000
+This is a test
+"""
+
+# yt-dlp --write-auto-subs output: whitespace-only lines inside cues and empty transition cues
+_YOUTUBE_VTT = (
+    "WEBVTT\nKind: captions\nLanguage: en\n\n"
+    "00:00:00.160 --> 00:00:02.390 align:start position:0%\n"
+    " \nhello<00:00:00.480><c> there</c><00:00:01.000><c> everyone</c>\n\n"
+    "00:00:02.390 --> 00:00:02.400 align:start position:0%\n"
+    "hello there everyone\n \n\n"
+    "00:00:02.400 --> 00:00:04.000 align:start position:0%\n"
+    "hello there everyone\nhow<00:00:03.000><c> are</c><c> you</c>\n\n"
+    "00:00:04.000 --> 00:00:04.010 align:start position:0%\n"
+    " \n\n"
+    "00:00:04.010 --> 00:00:06.000 align:start position:0%\n"
+    "thanks for joining\n"
+)
+
+
 class TestVTTParser:
     """Test cases for VTTParser class."""
     
@@ -51,6 +76,15 @@ class TestVTTParser:
         # Test None
         assert parser._clean_text(None) == ""
     
+    @pytest.mark.parametrize("caption,expected", [
+        ("<c.speaker>Line  1</c>\n<i>continued</i> ", "Line 1 continued"),
+        ("\t<b>tabs</b>\tand\r\nbreaks", "tabs and breaks"),
+        ("<00:00:01.000><c> timed</c>", "timed"),
+    ])
+    def test_clean_text_captions(self, caption, expected):
+        """Test text cleaning on representative caption markup."""
+        assert VTTParser()._clean_text(caption) == expected
+    
     def test_parse_file_not_found(self):
         """Test parsing non-existent file."""
         parser = VTTParser()
@@ -65,42 +99,64 @@ class TestVTTParser:
         with pytest.raises(ValueError):
             parser.parse_file("test.txt")
     
-    @patch('webvtt.read')
-    def test_parse_file_success(self, mock_webvtt_read):
+    def test_parse_file_success(self, tmp_path):
         """Test successful VTT file parsing."""
-        # Mock webvtt caption objects
-        class MockCaption:
-            def __init__(self, start, end, text):
-                self.start = start
-                self.end = end
-                self.text = text
-        
-        mock_captions = [
-            MockCaption("00:00:01.000", "00:00:05.000", "Hello world"),
-            MockCaption("00:00:06.000", "00:00:10.000", "This is a test")
+        vtt_file = tmp_path / "captions.vtt"
+        vtt_file.write_text(_SAMPLE_VTT, encoding='utf-8')
+        
+        parser = VTTParser()
+        segments = parser.parse_file(vtt_file)
+        
+        assert len(segments) == 2
+        assert segments[0]["text"] == "Hello world"
+        assert segments[0]["start"] == "00:00:01.000"
+        assert segments[0]["end"] == "00:00:05.000"
+        assert segments[0]["start_seconds"] == 1.0
+        assert segments[0]["end_seconds"] == 5.0
+        assert segments[0]["duration"] == 4.0
+    
+    def test_parse_file_skips_metadata_and_cue_settings(self, tmp_path):
+        """Test parsing headers, NOTE/STYLE blocks, cue ids, cue settings and short timestamps."""
+        vtt_file = tmp_path / "captions.vtt"
+        vtt_file.write_text(
+            "WEBVTT\r\nKind: captions\r\nLanguage: en\r\n\r\n"
+            "NOTE a comment\r\n\r\n"
+            "STYLE\r\n::cue { color: red }\r\n\r\n"
+            "cue-1\r\n00:01.000 --> 00:02.500 align:start position:0%\r\n"
+            "<c.speaker>Hello</c> <00:00:02.000>there\r\nsecond line\r\n\r\n"
+            "00:00:03.000 --> 00:00:04.000\r\nlast",
+            encoding='utf-8'
+        )
+        
+        segments = VTTParser().parse_file(vtt_file)
+        
+        assert [(s["start"], s["end"], s["raw_text"], s["text"]) for s in segments] == [
+            ("00:00:01.000", "00:00:02.500", "Hello there\nsecond line", "Hello there second line"),
+            ("00:00:03.000", "00:00:04.000", "last", "last")
         ]
+    
+    def test_parse_file_youtube_auto_subs(self, tmp_path):
+        """Test that whitespace-only lines end a cue and cues without text are dropped."""
+        vtt_file = tmp_path / "captions.vtt"
+        vtt_file.write_text(_YOUTUBE_VTT, encoding='utf-8')
         
-        mock_webvtt_read.return_value = mock_captions
+        parser = VTTParser()
+        segments = parser.parse_file(vtt_file)
         
-        # Create temporary VTT file
-        with tempfile.NamedTemporaryFile(suffix='.vtt', delete=False) as tmp:
-            tmp.write(b"WEBVTT\n\n00:00:01.000 --> 00:00:05.000\nHello world")
-            tmp_path = tmp.name
+        assert [(s["start"], s["raw_text"]) for s in segments] == [
+            ("00:00:02.390", "hello there everyone"),
+            ("00:00:02.400", "hello there everyone\nhow are you"),
+            ("00:00:04.010", "thanks for joining")
+        ]
+        assert parser.get_stats()["total_words"] == 12
+    
+    def test_parse_file_missing_header(self, tmp_path):
+        """Test parsing a .vtt file without the WEBVTT header."""
+        vtt_file = tmp_path / "captions.vtt"
+        vtt_file.write_text("00:00:01.000 --> 00:00:05.000\nHello world\n", encoding='utf-8')
         
-        try:
-            parser = VTTParser()
-            segments = parser.parse_file(tmp_path)
-            
-            assert len(segments) == 2
-            assert segments[0]["text"] == "Hello world"
-            assert segments[0]["start"] == "00:00:01.000"
-            assert segments[0]["end"] == "00:00:05.000"
-            assert segments[0]["start_seconds"] == 1.0
-            assert segments[0]["end_seconds"] == 5.0
-            assert segments[0]["duration"] == 4.0
-            
-        finally:
-            os.unlink(tmp_path)
+        with pytest.raises(ValueError, match="Invalid VTT file format"):
+            VTTParser().parse_file(vtt_file)
     
     def test_get_full_transcript(self):
         """Test full transcript generation."""
@@ -134,6 +190,13 @@ class TestVTTParser:
         # Test range that includes multiple segments
         filtered = parser.get_segments_by_time_range(0.0, 12.0)
         assert len(filtered) == 2
+        
+        # Test range that starts and ends between segments
+        filtered = parser.get_segments_by_time_range(5.5, 16.0)
+        assert [segment["text"] for segment in filtered] == ["Segment 2", "Segment 3"]
+        
+        # Test range that overlaps segments without containing any
+        assert parser.get_segments_by_time_range(2.0, 8.0) == []
     
     def test_get_stats(self):
         """Test statistics generation."""
@@ -157,6 +220,23 @@ class TestVTTParser:
         assert stats["total_duration"] == 10.0
         assert stats["total_words"] == 6  # "Hello world" (2) + "This is a test" (4) = 6
         assert stats["average_segment_duration"] == 4.0
+        
+        # Segments assigned directly may carry unnormalized whitespace
+        parser.segments = [{"text": "hello  world ", "end_seconds": 1.0, "duration": 1.0}]
+        assert parser.get_stats()["total_words"] == 2
+    
+    def test_get_stats_reflects_in_place_edits(self, tmp_path):
+        """Test that get_stats counts words in segments edited after parsing."""
+        vtt_file = tmp_path / "captions.vtt"
+        vtt_file.write_text(_SAMPLE_VTT, encoding='utf-8')
+        
+        parser = VTTParser()
+        parser.parse_file(vtt_file)
+        assert parser.get_stats()["total_words"] == 6
+        
+        parser.segments.append({"text": "One more", "end_seconds": 12.0, "duration": 2.0})
+        parser.segments[0]["text"] = "Hello"
+        assert parser.get_stats()["total_words"] == 7
     
     def test_export_to_json(self):
         """Test JSON export functionality."""
@@ -180,6 +260,27 @@ class TestVTTParser:
                 
         finally:
             os.unlink(tmp_path)
+    
+    @pytest.mark.parametrize("pretty", [True, False], ids=["pretty", "compact"])
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_export_to_json_round_trip(self, tmp_path, pretty, use_orjson):
+        """Test that both JSON backends write the same segments."""
+        parser = VTTParser()
+        parser.segments = [
+            {"text": "Olá mundo", "start": "00:00:01.000", "start_seconds": 1.0}
+        ]
+        output_path = tmp_path / "segments.json"
+        
+        if use_orjson:
+            pytest.importorskip("orjson")
+            parser.export_to_json(output_path, pretty=pretty)
+        else:
+            with patch('src.ingest.parser.orjson', None):
+                parser.export_to_json(output_path, pretty=pretty)
+        
+        import json
+        assert json.loads(output_path.read_text(encoding='utf-8')) == parser.segments
+        assert "Olá mundo" in output_path.read_text(encoding='utf-8')
 
 
 class TestConvenienceFunctions:
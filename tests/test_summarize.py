@@ -6,13 +6,14 @@ These tests verify GPT summarization functionality.
 
 import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, create_autospec
 from datetime import datetime
-import sys
-from pathlib import Path
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from openai import AzureOpenAI
+from openai.resources.chat.completions import Completions
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+from openai.types.completion_usage import CompletionUsage
 
 from src.summarize.gpt import (
     GPTSummarizer, 
@@ -22,6 +23,144 @@ from src.summarize.gpt import (
 )
 
 
+def _mk_completion(content: str, tokens: int) -> ChatCompletion:
+    """Build a real ChatCompletion carrying the given content and token usage."""
+    return ChatCompletion(
+        id="t",
+        model="gpt-4o",
+        object="chat.completion",
+        choices=[Choice(
+            finish_reason="stop",
+            index=0,
+            message=ChatCompletionMessage(content=content, role="assistant")
+        )],
+        created=0,
+        usage=CompletionUsage(prompt_tokens=0, completion_tokens=tokens, total_tokens=tokens)
+    )
+
+
+_CANONICAL_RESPONSE_MD = """
+### Resumo executivo
+Esta é uma reunião importante sobre desenvolvimento de software realizada em 2024-01-15.
+
+### Decisões
+- Implementar nova funcionalidade de autenticação
+- Revisar processo de deploy
+
+### Próximas ações
+| Responsável | Ação | Prazo |
+|-------------|------|-------|
+| João Silva | Criar documentação | 2024-01-20 |
+| Maria Santos | Revisar código | 2024-01-25 |
+
+### Transcrição completa
+Esta é a transcrição completa da reunião.
+"""
+
+_EMPTY_RESPONSE_MD = """
+### Resumo executivo
+Esta é uma reunião sem decisões específicas.
+
+### Decisões
+*(nenhuma)*
+
+### Próximas ações
+*(nenhuma)*
+
+### Transcrição completa
+Esta é a transcrição completa da reunião.
+"""
+
+_NUMBERED_DECISIONS_MD = """
+### Decisões
+1. Primeira decisão importante
+2. Segunda decisão também importante
+3. Terceira e última decisão
+"""
+
+_SINGLE_DECISION_RESPONSE_MD = """
+### Resumo executivo
+Resumo da reunião teste.
+
+### Decisões
+- Decisão teste
+
+### Próximas ações
+| Responsável | Ação | Prazo |
+|-------------|------|-------|
+| João | Tarefa teste | 2024-01-20 |
+
+### Transcrição completa
+Transcrição completa.
+"""
+
+_SEGMENTS_FIXTURE = [
+    {
+        "text_translated": "Primeira frase traduzida.",
+        "start_seconds": 0.0,
+        "end_seconds": 5.0,
+        "duration": 5.0
+    },
+    {
+        "text_translated": "Segunda frase traduzida.",
+        "start_seconds": 5.0,
+        "end_seconds": 10.0,
+        "duration": 5.0
+    }
+]
+
+_RESPONSE_SINGLE_CHUNK = _mk_completion(_SINGLE_DECISION_RESPONSE_MD, 1000)
+_RESPONSE_SHORT = _mk_completion(_SINGLE_DECISION_RESPONSE_MD, 1500)
+_RESPONSE_TIMING = _mk_completion(_EMPTY_RESPONSE_MD, 800)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_azure():
+    """
+    Patch the AzureOpenAI client class once for the whole module.
+    
+    Under pytest-xdist every worker builds its own copy, and azure_client
+    clears call records and canned responses after each test, so tests
+    stay independent of ordering and distribution mode.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        # chat and completions are cached properties that autospec cannot
+        # follow, so the Completions resource is specced explicitly.
+        client = create_autospec(AzureOpenAI, instance=True)
+        client.chat = MagicMock()
+        client.chat.completions = create_autospec(Completions, instance=True)
+        client_class = MagicMock(return_value=client)
+        mp.setattr("src.summarize.gpt.AzureOpenAI", client_class)
+        yield client_class
+
+
+@pytest.fixture(autouse=True)
+def azure_client(mock_azure):
+    """Client instance returned by the patched AzureOpenAI, reset after each test."""
+    client = mock_azure.return_value
+    yield client
+    mock_azure.reset_mock()
+    client.chat.completions.create.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def summarizer(mock_azure):
+    """Shared summarizer for tests that only call pure helper methods."""
+    return GPTSummarizer(
+        api_key='test_key',
+        endpoint='https://test.openai.azure.com/'
+    )
+
+
+@pytest.fixture
+def summarizer_fn(azure_client):
+    """Fresh summarizer for tests that configure or inspect the client mock."""
+    return GPTSummarizer(
+        api_key='test_key',
+        endpoint='https://test.openai.azure.com/'
+    )
+
+
 class TestSummaryResult:
     """Test cases for SummaryResult dataclass."""
     
@@ -60,7 +199,7 @@ class TestSummaryResult:
 class TestGPTSummarizer:
     """Test cases for GPTSummarizer class."""
     
-    def test_init_with_env_vars(self):
+    def test_init_with_env_vars(self, mock_azure):
         """Test GPTSummarizer initialization with environment variables."""
         with patch.dict(os.environ, {
             'AZURE_OPENAI_KEY': 'test_key',
@@ -68,30 +207,28 @@ class TestGPTSummarizer:
             'AZURE_OPENAI_DEPLOYMENT': 'gpt-4o-test',
             'AZURE_OPENAI_API_VERSION': '2024-02-01'
         }):
-            with patch('src.summarize.gpt.AzureOpenAI') as mock_client:
-                summarizer = GPTSummarizer()
-                
-                assert summarizer.api_key == 'test_key'
-                assert summarizer.endpoint == 'https://test.openai.azure.com/'
-                assert summarizer.deployment_name == 'gpt-4o-test'
-                assert summarizer.api_version == '2024-02-01'
-                mock_client.assert_called_once()
+            summarizer = GPTSummarizer()
+            
+            assert summarizer.api_key == 'test_key'
+            assert summarizer.endpoint == 'https://test.openai.azure.com/'
+            assert summarizer.deployment_name == 'gpt-4o-test'
+            assert summarizer.api_version == '2024-02-01'
+            mock_azure.assert_called_once()
     
-    def test_init_with_parameters(self):
+    def test_init_with_parameters(self, mock_azure):
         """Test GPTSummarizer initialization with explicit parameters."""
-        with patch('src.summarize.gpt.AzureOpenAI') as mock_client:
-            summarizer = GPTSummarizer(
-                api_key='param_key',
-                endpoint='https://param.openai.azure.com/',
-                deployment_name='param-deployment',
-                api_version='2024-03-01'
-            )
-            
-            assert summarizer.api_key == 'param_key'
-            assert summarizer.endpoint == 'https://param.openai.azure.com/'
-            assert summarizer.deployment_name == 'param-deployment'
-            assert summarizer.api_version == '2024-03-01'
-            mock_client.assert_called_once()
+        summarizer = GPTSummarizer(
+            api_key='param_key',
+            endpoint='https://param.openai.azure.com/',
+            deployment_name='param-deployment',
+            api_version='2024-03-01'
+        )
+        
+        assert summarizer.api_key == 'param_key'
+        assert summarizer.endpoint == 'https://param.openai.azure.com/'
+        assert summarizer.deployment_name == 'param-deployment'
+        assert summarizer.api_version == '2024-03-01'
+        mock_azure.assert_called_once()
     
     def test_init_missing_api_key(self):
         """Test GPTSummarizer initialization with missing API key."""
@@ -105,200 +242,80 @@ class TestGPTSummarizer:
             with pytest.raises(ValueError, match="Azure OpenAI endpoint is required"):
                 GPTSummarizer()
     
-    def test_build_canonical_prompt(self):
+    def test_build_canonical_prompt(self, summarizer):
         """Test canonical prompt building."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            transcript = "Esta é uma transcrição de teste."
-            duration = 30
-            meeting_date = "2024-01-15"
-            language_note = "Reunião em português"
-            
-            prompt = summarizer._build_canonical_prompt(
-                transcript, duration, meeting_date, language_note
-            )
-            
-            # Verify key components are present
-            assert "Resumo executivo" in prompt
-            assert "Decisões" in prompt
-            assert "Próximas ações" in prompt
-            assert "Transcrição completa" in prompt
-            assert meeting_date in prompt
-            assert str(duration) in prompt
-            assert language_note in prompt
-            assert transcript in prompt
+        transcript = "Esta é uma transcrição de teste."
+        duration = 30
+        meeting_date = "2024-01-15"
+        language_note = "Reunião em português"
+        
+        prompt = summarizer._build_canonical_prompt(
+            transcript, duration, meeting_date, language_note
+        )
+        
+        # Verify key components are present
+        required = (
+            "Resumo executivo", "Decisões", "Próximas ações", "Transcrição completa",
+            meeting_date, str(duration), language_note, transcript
+        )
+        missing = [part for part in required if part not in prompt]
+        assert not missing, missing
     
-    def test_build_canonical_prompt_no_language_note(self):
+    def test_build_canonical_prompt_no_language_note(self, summarizer):
         """Test canonical prompt building without language note."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            prompt = summarizer._build_canonical_prompt(
-                "Transcrição", 30, "2024-01-15", ""
-            )
-            
-            # Should not contain language note section
-            assert "Nota de idioma:" not in prompt
+        prompt = summarizer._build_canonical_prompt(
+            "Transcrição", 30, "2024-01-15", ""
+        )
+        
+        # Should not contain language note section
+        assert "Nota de idioma:" not in prompt
     
-    def test_chunk_text_short_text(self):
+    def test_chunk_text_short_text(self, summarizer):
         """Test text chunking with short text."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            short_text = "Esta é uma frase curta."
-            chunks = summarizer._chunk_text(short_text, max_tokens=1000)
-            
-            assert len(chunks) == 1
-            assert chunks[0] == short_text
+        short_text = "Esta é uma frase curta."
+        chunks = summarizer._chunk_text(short_text, max_tokens=1000)
+        
+        assert len(chunks) == 1
+        assert chunks[0] == short_text
     
-    def test_chunk_text_long_text(self):
+    @pytest.mark.parametrize("n_sentences", [20, 100])
+    def test_chunk_text_long_text(self, summarizer, n_sentences):
         """Test text chunking with long text."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            # Create a long text with multiple sentences
-            long_text = ". ".join([f"Esta é a frase número {i}" for i in range(1000)])
-            chunks = summarizer._chunk_text(long_text, max_tokens=100)  # Very small chunks
-            
-            assert len(chunks) > 1
-            # Each chunk should be within the token limit
-            for chunk in chunks:
-                assert len(chunk) <= 100 * 4  # 4 chars per token approximation
+        # 25 chars per sentence, so even 20 sentences exceed a 400-char chunk
+        long_text = "Esta é a frase número 0. " * n_sentences
+        chunks = summarizer._chunk_text(long_text, max_tokens=100)  # Very small chunks
+        
+        assert len(chunks) > 1
+        # Each chunk should be within the token limit
+        for chunk in chunks:
+            assert len(chunk) <= 100 * 4  # 4 chars per token approximation
     
-    def test_parse_gpt_response_complete(self):
-        """Test parsing complete GPT response."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            response_text = """
-### Resumo executivo
-Esta é uma reunião importante sobre desenvolvimento de software realizada em 2024-01-15.
-
-### Decisões
-- Implementar nova funcionalidade de autenticação
-- Revisar processo de deploy
-
-### Próximas ações
-| Responsável | Ação | Prazo |
-|-------------|------|-------|
-| João Silva | Criar documentação | 2024-01-20 |
-| Maria Santos | Revisar código | 2024-01-25 |
-
-### Transcrição completa
-Esta é a transcrição completa da reunião.
-"""
-            
-            resumo, decisoes, proximas_acoes = summarizer._parse_gpt_response(response_text)
-            
-            assert "reunião importante" in resumo
-            assert len(decisoes) == 2
-            assert "autenticação" in decisoes[0]
-            assert "deploy" in decisoes[1]
-            assert len(proximas_acoes) == 2
-            assert proximas_acoes[0]["responsavel"] == "João Silva"
-            assert proximas_acoes[0]["acao"] == "Criar documentação"
-            assert proximas_acoes[0]["prazo"] == "2024-01-20"
-    
-    def test_parse_gpt_response_empty_sections(self):
-        """Test parsing GPT response with empty sections."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            response_text = """
-### Resumo executivo
-Esta é uma reunião sem decisões específicas.
-
-### Decisões
-*(nenhuma)*
-
-### Próximas ações
-*(nenhuma)*
-
-### Transcrição completa
-Esta é a transcrição completa da reunião.
-"""
-            
-            resumo, decisoes, proximas_acoes = summarizer._parse_gpt_response(response_text)
-            
-            assert "reunião sem decisões" in resumo
-            assert len(decisoes) == 0
-            assert len(proximas_acoes) == 0
-    
-    def test_parse_gpt_response_numbered_decisions(self):
-        """Test parsing GPT response with numbered decisions."""
-        with patch('src.summarize.gpt.AzureOpenAI'):
-            summarizer = GPTSummarizer(
-                api_key='test_key',
-                endpoint='https://test.openai.azure.com/'
-            )
-            
-            response_text = """
-### Decisões
-1. Primeira decisão importante
-2. Segunda decisão também importante
-3. Terceira e última decisão
-"""
-            
-            resumo, decisoes, proximas_acoes = summarizer._parse_gpt_response(response_text)
-            
-            assert len(decisoes) == 3
-            assert "Primeira decisão" in decisoes[0]
-            assert "Segunda decisão" in decisoes[1]
-            assert "Terceira e última" in decisoes[2]
+    @pytest.mark.parametrize("response_text, expected_resumo_sub, expected_decisoes, expected_acoes", [
+        pytest.param(_CANONICAL_RESPONSE_MD, "reunião importante", ["autenticação", "deploy"], [
+            {"responsavel": "João Silva", "acao": "Criar documentação", "prazo": "2024-01-20"},
+            {"responsavel": "Maria Santos", "acao": "Revisar código", "prazo": "2024-01-25"}
+        ], id="complete"),
+        pytest.param(_EMPTY_RESPONSE_MD, "reunião sem decisões", [], [], id="empty_sections"),
+        pytest.param(
+            _NUMBERED_DECISIONS_MD, "", ["Primeira decisão", "Segunda decisão", "Terceira e última"], [],
+            id="numbered_decisions"
+        ),
+    ])
+    def test_parse_gpt_response(self, response_text, expected_resumo_sub, expected_decisoes, expected_acoes, summarizer):
+        """Test parsing GPT responses into summary, decisions and actions."""
+        resumo, decisoes, proximas_acoes = summarizer._parse_gpt_response(response_text)
+        
+        assert expected_resumo_sub in resumo
+        assert len(decisoes) == len(expected_decisoes)
+        for decisao, expected in zip(decisoes, expected_decisoes):
+            assert expected in decisao
+        assert proximas_acoes == expected_acoes
     
-    @patch('src.summarize.gpt.AzureOpenAI')
-    def test_process_single_chunk(self, mock_azure_client):
+    def test_process_single_chunk(self, azure_client, summarizer_fn):
         """Test processing single chunk of text."""
-        # Mock the Azure OpenAI client
-        mock_client = MagicMock()
-        mock_azure_client.return_value = mock_client
+        azure_client.chat.completions.create.return_value = _RESPONSE_SINGLE_CHUNK
         
-        # Mock the completion response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = """
-### Resumo executivo
-Resumo da reunião teste.
-
-### Decisões
-- Decisão teste
-
-### Próximas ações
-| Responsável | Ação | Prazo |
-|-------------|------|-------|
-| João | Tarefa teste | 2024-01-20 |
-
-### Transcrição completa
-Transcrição completa.
-"""
-        mock_response.usage.total_tokens = 1000
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        summarizer = GPTSummarizer(
-            api_key='test_key',
-            endpoint='https://test.openai.azure.com/'
-        )
-        
-        resumo, decisoes, proximas_acoes, tokens = summarizer._process_single_chunk(
+        resumo, decisoes, proximas_acoes, tokens = summarizer_fn._process_single_chunk(
             "Transcrição teste",
             30,
             "2024-01-15",
@@ -312,40 +329,11 @@ Transcrição completa.
         assert proximas_acoes[0]["responsavel"] == "João"
         assert tokens == 1000
     
-    @patch('src.summarize.gpt.AzureOpenAI')
-    def test_summarize_transcript_short(self, mock_azure_client):
+    def test_summarize_transcript_short(self, azure_client, summarizer_fn):
         """Test summarizing short transcript."""
-        # Mock the Azure OpenAI client
-        mock_client = MagicMock()
-        mock_azure_client.return_value = mock_client
+        azure_client.chat.completions.create.return_value = _RESPONSE_SHORT
         
-        # Mock the completion response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = """
-### Resumo executivo
-Resumo da reunião teste realizada em 2024-01-15.
-
-### Decisões
-- Decisão importante da reunião
-
-### Próximas ações
-| Responsável | Ação | Prazo |
-|-------------|------|-------|
-| João | Implementar funcionalidade | 2024-01-20 |
-
-### Transcrição completa
-Transcrição completa da reunião.
-"""
-        mock_response.usage.total_tokens = 1500
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        summarizer = GPTSummarizer(
-            api_key='test_key',
-            endpoint='https://test.openai.azure.com/'
-        )
-        
-        result = summarizer.summarize_transcript(
+        result = summarizer_fn.summarize_transcript(
             transcript_pt="Esta é uma transcrição de teste.",
             duration_minutes=30,
             meeting_date="2024-01-15"
@@ -359,65 +347,28 @@ Transcrição completa da reunião.
         assert result.processing_time > 0
         assert result.transcricao_completa == "Esta é uma transcrição de teste."
     
-    @patch('src.summarize.gpt.time.time')
-    @patch('src.summarize.gpt.AzureOpenAI')
-    def test_summarize_transcript_timing(self, mock_azure_client, mock_time):
+    def test_summarize_transcript_timing(self, monkeypatch, azure_client, summarizer_fn):
         """Test that processing time is calculated correctly."""
-        # Mock time to return predictable values
-        mock_time.side_effect = [100.0, 112.5]  # 12.5 seconds difference
+        # Stub time to return predictable values
+        times = iter([100.0, 112.5])  # 12.5 seconds difference
+        monkeypatch.setattr("src.summarize.gpt.time.time", lambda: next(times))
         
-        # Mock the Azure OpenAI client
-        mock_client = MagicMock()
-        mock_azure_client.return_value = mock_client
+        azure_client.chat.completions.create.return_value = _RESPONSE_TIMING
         
-        # Mock the completion response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = """
-### Resumo executivo
-Resumo teste.
-
-### Decisões
-*(nenhuma)*
-
-### Próximas ações
-*(nenhuma)*
-
-### Transcrição completa
-Transcrição.
-"""
-        mock_response.usage.total_tokens = 800
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        summarizer = GPTSummarizer(
-            api_key='test_key',
-            endpoint='https://test.openai.azure.com/'
-        )
-        
-        result = summarizer.summarize_transcript(
+        result = summarizer_fn.summarize_transcript(
             transcript_pt="Transcrição teste",
             duration_minutes=15
         )
         
         assert result.processing_time == 12.5
     
-    @patch('src.summarize.gpt.AzureOpenAI')
-    def test_summarize_transcript_api_error(self, mock_azure_client):
+    def test_summarize_transcript_api_error(self, azure_client, summarizer_fn):
         """Test handling of API errors."""
-        # Mock the Azure OpenAI client
-        mock_client = MagicMock()
-        mock_azure_client.return_value = mock_client
-        
         # Mock API error
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
-        
-        summarizer = GPTSummarizer(
-            api_key='test_key',
-            endpoint='https://test.openai.azure.com/'
-        )
+        azure_client.chat.completions.create.side_effect = Exception("API Error")
         
         with pytest.raises(Exception, match="API Error"):
-            summarizer.summarize_transcript(
+            summarizer_fn.summarize_transcript(
                 transcript_pt="Transcrição teste",
                 duration_minutes=30
             )
@@ -481,25 +432,9 @@ class TestStandaloneFunctions:
         )
         mock_summarizer.summarize_transcript.return_value = mock_result
         
-        # Test segments
-        segments = [
-            {
-                "text_translated": "Primeira frase traduzida.",
-                "start_seconds": 0.0,
-                "end_seconds": 5.0,
-                "duration": 5.0
-            },
-            {
-                "text_translated": "Segunda frase traduzida.",
-                "start_seconds": 5.0,
-                "end_seconds": 10.0,
-                "duration": 5.0
-            }
-        ]
-        
         # Call the function
         result = summarize_translated_segments(
-            segments=segments,
+            segments=_SEGMENTS_FIXTURE,
             meeting_date="2024-01-15",
             language_note="Reunião em português"
         )
@@ -5,25 +5,72 @@ These tests verify Azure translation functionality.
 """
 
 import asyncio
+import aiohttp
 import json
 import os
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
-import sys
-from pathlib import Path
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from src.translate import azure
 from src.translate.azure import (
     AzureTranslator, 
     TranslationResult, 
     translate_text, 
     translate_segments_async,
-    translate_segments
+    translate_segments,
+    close_translators,
+    _CharRateLimiter,
+    _retry_delay,
+    _split_batches,
+    _translator_cache
 )
 
 
+def _mock_response(status=200, json_data=None, text_data="", headers=None):
+    """Build a stand-in for an aiohttp response with only the awaited methods async."""
+    return Mock(
+        status=status,
+        headers=headers or {},
+        json=AsyncMock(return_value=json_data),
+        read=AsyncMock(return_value=json.dumps(json_data).encode()),
+        text=AsyncMock(return_value=text_data)
+    )
+
+
+def _wire_session(get_session, status=200, json_data=None, text_data=""):
+    """
+    Point a patched _get_session at a session whose post() yields one response.
+    
+    Returns:
+        Tuple of (session, response) mocks
+    """
+    response = _mock_response(status, json_data, text_data)
+    session = MagicMock()
+    session.post.return_value.__aenter__.return_value = response
+    get_session.return_value = session
+    return session, response
+
+
+@pytest.fixture
+def mock_aiohttp_session(monkeypatch):
+    """
+    Patch AzureTranslator._get_session and return a builder for the session mock.
+    
+    The builder wires one response for every post() call and returns the
+    (session, response) pair so tests can inspect the requests made.
+    Retries of failed requests happen without delay.
+    """
+    get_session = AsyncMock()
+    monkeypatch.setattr(AzureTranslator, '_get_session', get_session)
+    monkeypatch.setattr('src.translate.azure._retry_delay', lambda attempt, retry_after=None: 0.0)
+    
+    def _mk(status=200, json_data=None, text_data=""):
+        return _wire_session(get_session, status, json_data, text_data)
+    
+    return _mk
+
+
 class TestTranslationResult:
     """Test cases for TranslationResult dataclass."""
     
@@ -54,7 +101,8 @@ class TestAzureTranslator:
         with patch.dict(os.environ, {
             'AZURE_TRANSLATOR_KEY': 'test_key',
             'AZURE_TRANSLATOR_ENDPOINT': 'https://test.translator.com',
-            'AZURE_TRANSLATOR_REGION': 'westus'
+            'AZURE_TRANSLATOR_REGION': 'westus',
+            'AZURE_TRANSLATOR_MAX_CHARS_PER_SECOND': '555'
         }):
             translator = AzureTranslator()
             
@@ -62,6 +110,7 @@ class TestAzureTranslator:
             assert translator.endpoint == 'https://test.translator.com'
             assert translator.region == 'westus'
             assert translator.target_language == 'pt'
+            assert translator.max_chars_per_second == 555.0
     
     def test_init_with_parameters(self):
         """Test AzureTranslator initialization with explicit parameters."""
@@ -91,6 +140,17 @@ class TestAzureTranslator:
         assert translator.region == 'eastus'
         assert translator.target_language == 'pt'
         assert translator.api_version == '3.0'
+        assert translator.max_chars_per_second is None
+    
+    def test_init_precomputes_url(self):
+        """Test that the URL and default query parameters are built once in __init__."""
+        translator = AzureTranslator(subscription_key='test_key', target_language='es')
+        
+        assert translator.translate_url.endswith('/translate')
+        assert translator._base_params == {'api-version': '3.0', 'to': 'es'}
+        assert translator._translate_params(None, 'es') is translator._base_params
+        assert translator._translate_params('en', 'fr') == {'api-version': '3.0', 'to': 'fr', 'from': 'en'}
+        assert translator._base_params == {'api-version': '3.0', 'to': 'es'}
     
     def test_headers_configuration(self):
         """Test that headers are configured correctly."""
@@ -107,9 +167,42 @@ class TestAzureTranslator:
         
         assert translator.headers == expected_headers
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_text_success(self, mock_session):
+    async def test_session_is_reused_until_closed(self):
+        """Test that one HTTP session is shared across requests and closed by aclose."""
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        session = await translator._get_session()
+        
+        assert await translator._get_session() is session
+        assert session.headers['Ocp-Apim-Subscription-Key'] == 'test_key'
+        assert session.timeout.total == 30
+        assert session.connector.limit == 32
+        assert session.connector.limit_per_host == 16
+        
+        await translator.aclose()
+        
+        assert session.closed
+        assert translator._session is None
+    
+    def test_session_is_replaced_for_a_new_event_loop(self):
+        """Test that a session from a finished event loop is not reused."""
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        first = asyncio.run(translator._get_session())
+        second = asyncio.run(translator._get_session())
+        
+        assert second is not first
+        assert first.closed
+        asyncio.run(translator.aclose())
+    
+    async def test_async_context_manager_closes_session(self):
+        """Test that leaving the async context closes the shared session."""
+        async with AzureTranslator(subscription_key='test_key') as translator:
+            session = await translator._get_session()
+        
+        assert session.closed
+    
+    async def test_translate_text_success(self, mock_aiohttp_session):
         """Test successful text translation."""
         # Mock response data
         mock_response_data = [{
@@ -123,19 +216,17 @@ class TestAzureTranslator:
             }]
         }]
         
-        # Mock aiohttp session and response
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        session, _ = mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
         result = await translator.translate_text('Hello world')
         
+        session.post.assert_called_once_with(
+            translator.translate_url,
+            params={'api-version': '3.0', 'to': 'pt'},
+            json=[{'text': 'Hello world'}]
+        )
         assert isinstance(result, TranslationResult)
         assert result.original_text == 'Hello world'
         assert result.translated_text == 'Olá mundo'
@@ -144,9 +235,7 @@ class TestAzureTranslator:
         assert result.confidence == 0.95
         assert result.processing_time > 0
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_text_with_source_language(self, mock_session):
+    async def test_translate_text_with_source_language(self, mock_aiohttp_session):
         """Test text translation with specified source language."""
         mock_response_data = [{
             'translations': [{
@@ -155,13 +244,7 @@ class TestAzureTranslator:
             }]
         }]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        session, _ = mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -171,31 +254,110 @@ class TestAzureTranslator:
             target_language='es'
         )
         
+        session.post.assert_called_once_with(
+            translator.translate_url,
+            params={'api-version': '3.0', 'to': 'es', 'from': 'en'},
+            json=[{'text': 'Hello world'}]
+        )
         assert result.translated_text == 'Hola mundo'
         assert result.source_language == 'en'
         assert result.target_language == 'es'
         assert result.confidence == 1.0  # Default when no detection info
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_text_api_error(self, mock_session):
+    async def test_translate_text_api_error(self, mock_aiohttp_session):
         """Test translation with API error."""
-        mock_response = AsyncMock()
-        mock_response.status = 400
-        mock_response.text.return_value = "Bad Request"
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_aiohttp_session(status=400, text_data="Bad Request")
         
         translator = AzureTranslator(subscription_key='test_key')
         
         with pytest.raises(Exception, match="Translation API error 400"):
             await translator.translate_text('Hello world')
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_batch_success(self, mock_session):
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    async def test_response_parsing_backends(self, mock_aiohttp_session, use_orjson):
+        """Test that responses are decoded with orjson when available and aiohttp otherwise."""
+        mock_session_instance, mock_response = mock_aiohttp_session(json_data=[
+            {'translations': [{'text': 'Olá mundo', 'to': 'pt'}]}
+        ])
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        if use_orjson:
+            pytest.importorskip("orjson")
+            with patch('src.translate.azure.orjson.loads', wraps=azure.orjson.loads) as mock_loads:
+                result = await translator.translate_text('Hello world')
+            mock_loads.assert_called_once_with(mock_response.read.return_value)
+            mock_response.json.assert_not_called()
+        else:
+            with patch('src.translate.azure.orjson', None):
+                result = await translator.translate_text('Hello world')
+            mock_response.read.assert_not_called()
+        
+        assert result.translated_text == 'Olá mundo'
+    
+    async def test_session_serializes_with_orjson(self):
+        """Test that the shared session serializes request bodies with orjson."""
+        pytest.importorskip("orjson")
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        session = await translator._get_session()
+        
+        assert session.json_serialize([{'text': 'Olá'}]) == '[{"text":"Olá"}]'
+        await translator.aclose()
+    
+    async def test_translate_text_retries_on_429(self, mock_aiohttp_session):
+        """Test that a throttled request is retried and then succeeds."""
+        mock_session_instance, _ = mock_aiohttp_session()
+        
+        throttled = _mock_response(429, headers={'Retry-After': '1'})
+        ok = _mock_response(json_data=[{'translations': [{'text': 'Olá mundo', 'to': 'pt'}]}])
+        mock_session_instance.post.return_value.__aenter__.side_effect = [throttled, ok]
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        result = await translator.translate_text('Hello world')
+        
+        assert result.translated_text == 'Olá mundo'
+        assert mock_session_instance.post.call_count == 2
+    
+    @pytest.mark.parametrize("error", [
+        aiohttp.ClientConnectionError("reset"),
+        asyncio.TimeoutError()
+    ], ids=["connection_error", "timeout"])
+    async def test_translate_text_retries_transient_errors(self, mock_aiohttp_session, error):
+        """Test that connection errors and timeouts are retried, and re-raised once attempts run out."""
+        mock_session_instance, _ = mock_aiohttp_session()
+        ok = _mock_response(json_data=[{'translations': [{'text': 'Olá mundo', 'to': 'pt'}]}])
+        mock_session_instance.post.return_value.__aenter__.side_effect = [error, ok]
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        result = await translator.translate_text('Hello world')
+        assert result.translated_text == 'Olá mundo'
+        
+        mock_session_instance.post.return_value.__aenter__.side_effect = [error] * 3
+        with pytest.raises(type(error)):
+            await translator.translate_text('Goodbye')
+    
+    async def test_post_with_retry_requires_an_attempt(self, mock_aiohttp_session):
+        """Test that max_attempts=0 raises instead of returning None."""
+        mock_aiohttp_session()
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        with pytest.raises(Exception, match="no request made"):
+            await translator._post_with_retry(
+                translator.translate_url, {}, [], "Translation API error", max_attempts=0
+            )
+    
+    def test_retry_delay(self):
+        """Test backoff growth, jitter, the cap and Retry-After handling."""
+        assert 1.0 <= _retry_delay(0) < 2.0
+        assert 4.0 <= _retry_delay(2) < 5.0
+        assert _retry_delay(10) == 30.0
+        assert _retry_delay(0, '7') == 7.0
+        assert _retry_delay(0, '120') == 30.0
+        assert 1.0 <= _retry_delay(0, 'Wed, 21 Oct 2015 07:28:00 GMT') < 2.0
+    
+    async def test_translate_batch_success(self, mock_aiohttp_session):
         """Test successful batch translation."""
         mock_response_data = [
             {
@@ -208,13 +370,7 @@ class TestAzureTranslator:
             }
         ]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -227,9 +383,16 @@ class TestAzureTranslator:
         assert all(r.source_language == 'en' for r in results)
         assert all(r.target_language == 'pt' for r in results)
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_batch_large_batch(self, mock_session):
+    async def test_translate_batch_short_response(self, mock_aiohttp_session):
+        """Test that a response with fewer results than texts raises a descriptive error."""
+        mock_aiohttp_session(json_data=[{'translations': [{'text': 'Olá', 'to': 'pt'}]}])
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        with pytest.raises(Exception, match="expected 2 results, got 1"):
+            await translator.translate_batch(['Hello', 'World'])
+    
+    async def test_translate_batch_large_batch(self, mock_aiohttp_session):
         """Test batch translation with large batch that needs splitting."""
         # Mock response for multiple batches
         mock_response_data = [
@@ -240,13 +403,7 @@ class TestAzureTranslator:
             for i in range(50)  # 50 items per batch
         ]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_session_instance, _ = mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -258,22 +415,205 @@ class TestAzureTranslator:
         # Should have made 3 API calls (150/50 = 3)
         assert mock_session_instance.post.call_count == 3
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_detect_language_success(self, mock_session):
+    async def test_translate_batch_skips_empty(self, mock_aiohttp_session):
+        """Test that blank texts are answered locally without an API call."""
+        mock_session_instance, _ = mock_aiohttp_session(json_data=[])
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        results = await translator.translate_batch(['', '   ', '\n'])
+        
+        assert mock_session_instance.post.call_count == 0
+        assert [r.translated_text for r in results] == ['', '', '']
+        assert all(r.confidence == 1.0 for r in results)
+        assert all(r.target_language == 'pt' for r in results)
+    
+    async def test_translate_batch_splices_blank_texts(self, mock_aiohttp_session):
+        """Test that only non-blank texts are sent and results keep their positions."""
+        mock_session_instance, _ = mock_aiohttp_session(json_data=[
+            {'translations': [{'text': 'Olá', 'to': 'pt'}]},
+            {'translations': [{'text': 'Mundo', 'to': 'pt'}]}
+        ])
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        results = await translator.translate_batch(['Hello', ' ', 'World', ''])
+        
+        assert mock_session_instance.post.call_args.kwargs['json'] == [
+            {'text': 'Hello'}, {'text': 'World'}
+        ]
+        assert [r.translated_text for r in results] == ['Olá', '', 'Mundo', '']
+        assert [r.original_text for r in results] == ['Hello', ' ', 'World', '']
+    
+    async def test_translate_batch_dedups_repeats(self, mock_aiohttp_session):
+        """Test that repeated texts are requested once and cached for later calls."""
+        mock_session_instance, _ = mock_aiohttp_session(json_data=[
+            {'translations': [{'text': 'Oi', 'to': 'pt'}]}
+        ])
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        results = await translator.translate_batch(['Hi', 'Hi', 'Hi'])
+        
+        assert mock_session_instance.post.call_args.kwargs['json'] == [{'text': 'Hi'}]
+        assert [r.translated_text for r in results] == ['Oi', 'Oi', 'Oi']
+        
+        results = await translator.translate_batch(['Hi'])
+        
+        assert mock_session_instance.post.call_count == 1
+        assert results[0].translated_text == 'Oi'
+    
+    async def test_translation_cache_is_bounded(self, monkeypatch):
+        """Test that the translation cache evicts its least recently used entries."""
+        async def fake_batch(texts, source_language, target_language):
+            return [
+                TranslationResult(text, text.upper(), 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        monkeypatch.setattr('src.translate.azure._TRANSLATION_CACHE_SIZE', 2)
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch):
+            await translator.translate_batch(['a', 'b'])
+            await translator.translate_batch(['a'])
+            await translator.translate_batch(['c'])
+        
+        assert [key[2] for key in translator._translation_cache] == ['a', 'c']
+    
+    async def test_rate_limiter_applied(self):
+        """Test that every batch request reserves its characters with the limiter."""
+        async def fake_batch(texts, source_language, target_language):
+            return [
+                TranslationResult(text, text, 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key', max_chars_per_second=1000)
+        texts = [f'text {i:02d}' for i in range(5)]
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch), \
+                patch.object(translator._rate_limiter, 'acquire', new_callable=AsyncMock) as mock_acquire:
+            await translator.translate_batch(texts, batch_size=2)
+        
+        assert [call.args[0] for call in mock_acquire.call_args_list] == [14, 14, 7]
+    
+    async def test_rate_limiter_paces_characters(self):
+        """Test that the limiter delays requests once the burst allowance is spent."""
+        limiter = _CharRateLimiter(1000)
+        
+        start = time.monotonic()
+        await limiter.acquire(1000)
+        burst = time.monotonic() - start
+        await limiter.acquire(100)
+        
+        assert burst < 0.05
+        assert time.monotonic() - start >= 0.09
+    
+    async def test_translate_batch_parallel_dispatch(self):
+        """Test that batches are dispatched concurrently and results keep their order."""
+        started = []
+        all_started = asyncio.Event()
+        
+        async def fake_batch(texts, source_language, target_language):
+            started.append(texts[0])
+            if len(started) == 3:
+                all_started.set()
+            # Only returns once every batch is in flight, so a serial loop would hang
+            await all_started.wait()
+            return [
+                TranslationResult(text, text.upper(), 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        texts = [f'text {i}' for i in range(150)]
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch):
+            results = await asyncio.wait_for(
+                translator.translate_batch(texts, batch_size=50), timeout=1
+            )
+        
+        assert [r.translated_text for r in results] == [t.upper() for t in texts]
+    
+    async def test_translate_batch_streaming(self):
+        """Test that iter_translate_batch yields ordered results with a bounded window."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_batch(texts, source_language, target_language):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [
+                TranslationResult(text, text.upper(), 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key', max_concurrency=2)
+        texts = [f'text {i}' for i in range(95)]
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch) as mock_batch:
+            results = [r async for r in translator.iter_translate_batch(texts, batch_size=10)]
+        
+        assert [r.translated_text for r in results] == [t.upper() for t in texts]
+        assert mock_batch.call_count == 10
+        assert peak <= 2
+    
+    async def test_translate_batch_streaming_stops_early(self):
+        """Test that abandoning iter_translate_batch cancels and awaits pending batches."""
+        async def fake_batch(texts, source_language, target_language):
+            if texts[0] != 'text 0':
+                await asyncio.Event().wait()
+            return [
+                TranslationResult(text, text.upper(), 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key', max_concurrency=3)
+        texts = [f'text {i}' for i in range(50)]
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch):
+            stream = translator.iter_translate_batch(texts, batch_size=10)
+            async for result in stream:
+                break
+            await stream.aclose()
+        
+        assert result.translated_text == 'TEXT 0'
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+    
+    async def test_translate_batch_respects_max_concurrency(self):
+        """Test that no more than max_concurrency batches are in flight."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_batch(texts, source_language, target_language):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [
+                TranslationResult(text, text, 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key', max_concurrency=2)
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch) as mock_batch:
+            results = await translator.translate_batch([f'x{i}' for i in range(10)], batch_size=1)
+        
+        assert len(results) == 10
+        assert mock_batch.call_count == 10
+        assert peak == 2
+    
+    async def test_detect_language_success(self, mock_aiohttp_session):
         """Test successful language detection."""
         mock_response_data = [{
             'language': 'en',
             'score': 0.95
         }]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -282,26 +622,43 @@ class TestAzureTranslator:
         assert result['language'] == 'en'
         assert result['confidence'] == 0.95
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_detect_language_api_error(self, mock_session):
+    async def test_detect_language_api_error(self, mock_aiohttp_session):
         """Test language detection with API error."""
-        mock_response = AsyncMock()
-        mock_response.status = 500
-        mock_response.text.return_value = "Internal Server Error"
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_session_instance, _ = mock_aiohttp_session(status=500, text_data="Internal Server Error")
         
         translator = AzureTranslator(subscription_key='test_key')
         
         with pytest.raises(Exception, match="Language detection API error 500"):
             await translator.detect_language('Hello world')
+        
+        # 500 is transient, so the request is attempted three times before failing
+        assert mock_session_instance.post.call_count == 3
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_segments_success(self, mock_session):
+    async def test_detect_languages_batch_success(self, mock_aiohttp_session):
+        """Test batched language detection."""
+        mock_session_instance, mock_response = mock_aiohttp_session()
+        pages = [
+            [{'language': 'en', 'score': 0.95}, {'language': 'es', 'score': 0.9}],
+            [{'language': 'fr', 'score': 0.8}]
+        ]
+        mock_response.json.side_effect = pages
+        mock_response.read.side_effect = [json.dumps(page).encode() for page in pages]
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        
+        results = await translator.detect_languages_batch(
+            ['Hello', 'Hola', 'Bonjour'], batch_size=2
+        )
+        
+        assert results == [
+            {'language': 'en', 'confidence': 0.95},
+            {'language': 'es', 'confidence': 0.9},
+            {'language': 'fr', 'confidence': 0.8}
+        ]
+        # Should have made 2 API calls (3 texts in batches of 2)
+        assert mock_session_instance.post.call_count == 2
+    
+    async def test_translate_segments_success(self, mock_aiohttp_session):
         """Test successful segment translation."""
         mock_response_data = [
             {
@@ -314,13 +671,7 @@ class TestAzureTranslator:
             }
         ]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -345,7 +696,64 @@ class TestAzureTranslator:
         assert result[0]['start_seconds'] == 0.0
         assert result[0]['end_seconds'] == 5.0
     
-    @pytest.mark.asyncio
+    async def test_translate_segments_sends_one_request_per_hundred(self):
+        """Test that segments are translated in batches of 100 texts per request."""
+        async def fake_batch(texts, source_language, target_language):
+            return [
+                TranslationResult(text, text.upper(), 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        segments = [{'text': f'segment {i}'} for i in range(250)]
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch) as mock_batch:
+            result = await translator.translate_segments(segments)
+        
+        assert [len(call.args[0]) for call in mock_batch.call_args_list] == [100, 100, 50]
+        assert [segment['text_translated'] for segment in result] == [f'SEGMENT {i}' for i in range(250)]
+    
+    async def test_translate_segments_single_batch_call(self, mock_aiohttp_session):
+        """Test that 50 segments are translated with a single request."""
+        mock_session_instance, _ = mock_aiohttp_session(json_data=[
+            {'translations': [{'text': f'Texto {i}', 'to': 'pt'}]}
+            for i in range(50)
+        ])
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        segments = [{'text': f'Text {i}'} for i in range(50)]
+        
+        result = await translator.translate_segments(segments)
+        
+        assert mock_session_instance.post.call_count == 1
+        assert len(mock_session_instance.post.call_args.kwargs['json']) == 50
+        assert result[49]['text_translated'] == 'Texto 49'
+    
+    async def test_translate_segments_skips_empty_text(self):
+        """Test that segments without text are not sent for translation."""
+        async def fake_batch(texts, source_language, target_language):
+            return [
+                TranslationResult(text, text.upper(), 'en', 'pt', 1.0, 0.0)
+                for text in texts
+            ]
+        
+        translator = AzureTranslator(subscription_key='test_key')
+        segments = [{'text': 'first'}, {'text': ''}, {'raw_text': 'third'}]
+        
+        with patch.object(translator, '_translate_batch_internal', side_effect=fake_batch) as mock_batch:
+            result = await translator.translate_segments(segments)
+        
+        assert mock_batch.call_args.args[0] == ['first', 'third']
+        assert [segment['text_translated'] for segment in result] == ['FIRST', '', 'THIRD']
+    
+    def test_split_batches_respects_character_limit(self):
+        """Test that batches close at the item count or the character limit."""
+        texts = ['a' * 20000, 'b' * 20000, 'c' * 20000, 'd', 'e', 'f']
+        
+        assert _split_batches(texts, batch_size=100) == [texts[:2], texts[2:]]
+        assert _split_batches(texts, batch_size=2) == [texts[:2], texts[2:4], texts[4:]]
+        assert _split_batches([], batch_size=100) == []
+    
     async def test_translate_segments_empty_list(self):
         """Test segment translation with empty list."""
         translator = AzureTranslator(subscription_key='test_key')
@@ -354,28 +762,17 @@ class TestAzureTranslator:
         
         assert result == []
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_segments_missing_text(self, mock_session):
+    async def test_translate_segments_missing_text(self, mock_aiohttp_session):
         """Test segment translation with missing text fields."""
+        # Only the segment with text is sent, so Azure returns a single result
         mock_response_data = [
             {
                 'detectedLanguage': {'language': 'en', 'score': 0.95},
                 'translations': [{'text': 'Olá mundo', 'to': 'pt'}]
-            },
-            {
-                'detectedLanguage': {'language': 'unknown', 'score': 0.0},
-                'translations': [{'text': '', 'to': 'pt'}]
             }
         ]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -390,22 +787,14 @@ class TestAzureTranslator:
         assert result[0]['text_translated'] == 'Olá mundo'
         assert result[1]['text_translated'] == ''  # Empty text translated to empty
     
-    @pytest.mark.asyncio
-    @patch('src.translate.azure.aiohttp.ClientSession')
-    async def test_translate_segments_with_raw_text(self, mock_session):
+    async def test_translate_segments_with_raw_text(self, mock_aiohttp_session):
         """Test segment translation using raw_text field."""
         mock_response_data = [{
             'detectedLanguage': {'language': 'en', 'score': 0.95},
             'translations': [{'text': 'Olá mundo', 'to': 'pt'}]
         }]
         
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json.return_value = mock_response_data
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post.return_value.__aenter__.return_value = mock_response
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
+        mock_aiohttp_session(json_data=mock_response_data)
         
         translator = AzureTranslator(subscription_key='test_key')
         
@@ -422,7 +811,13 @@ class TestAzureTranslator:
 class TestStandaloneFunctions:
     """Test cases for standalone functions."""
     
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def clear_translator_cache(self):
+        """Start and finish every test with an empty translator cache."""
+        _translator_cache.clear()
+        yield
+        _translator_cache.clear()
+    
     @patch('src.translate.azure.AzureTranslator')
     async def test_translate_text_convenience_function(self, mock_translator_class):
         """Test translate_text convenience function."""
@@ -466,7 +861,43 @@ class TestStandaloneFunctions:
         
         assert result == mock_result
     
-    @pytest.mark.asyncio
+    @patch('src.translate.azure.AzureTranslator')
+    async def test_translate_text_convenience_reuses_translator(self, mock_translator_class):
+        """Test that repeated calls with the same settings share one translator."""
+        mock_translator = AsyncMock()
+        mock_translator_class.return_value = mock_translator
+        
+        await translate_text('Hello', subscription_key='test_key', region='westus')
+        await translate_text('World', subscription_key='test_key', region='westus')
+        await translate_text('Hola', subscription_key='test_key', target_language='es')
+        
+        assert mock_translator_class.call_count == 2
+        assert mock_translator.translate_text.call_count == 3
+    
+    async def test_close_translators(self):
+        """Test that close_translators closes cached sessions and empties the cache."""
+        translator = AzureTranslator(subscription_key='test_key')
+        session = await translator._get_session()
+        _translator_cache[(asyncio.get_running_loop(), 'test_key', None, None, 'pt')] = translator
+        
+        await close_translators()
+        
+        assert session.closed
+        assert _translator_cache == {}
+    
+    def test_cached_translators_closed_when_loop_ends(self):
+        """Test that a cached translator's session is closed before its asyncio.run loop ends."""
+        async def use_cached_translator():
+            translator = azure._get_translator('test_key', None, None, 'pt')
+            return await translator._get_session()
+        
+        first = asyncio.run(use_cached_translator())
+        second = asyncio.run(use_cached_translator())
+        
+        assert first.closed and second.closed
+        assert second is not first
+        assert _translator_cache == {}
+    
     @patch('src.translate.azure.AzureTranslator')
     async def test_translate_segments_async_convenience_function(self, mock_translator_class):
         """Test translate_segments_async convenience function."""
@@ -513,6 +944,7 @@ class TestStandaloneFunctions:
         
         assert result == mock_result
     
+    @patch('src.translate.azure.uvloop', None)
     @patch('src.translate.azure.asyncio.run')
     @patch('src.translate.azure.translate_segments_async')
     def test_translate_segments_sync_wrapper(self, mock_translate_async, mock_asyncio_run):
@@ -545,7 +977,46 @@ class TestStandaloneFunctions:
         
         assert result == mock_result
     
-    @pytest.mark.asyncio
+    @patch('src.translate.azure.translate_segments_async', new_callable=AsyncMock)
+    def test_translate_segments_sync_uses_uvloop(self, mock_translate_async):
+        """Test that the sync wrapper runs on a uvloop event loop when uvloop is installed."""
+        uvloop = pytest.importorskip("uvloop")
+        loop_types = []
+        
+        async def fake_translate(*args):
+            loop_types.append(type(asyncio.get_running_loop()))
+            return [{'text': 'Hello world', 'text_translated': 'Olá mundo'}]
+        
+        mock_translate_async.side_effect = fake_translate
+        
+        result = translate_segments([{'text': 'Hello world'}], subscription_key='test_key')
+        
+        assert result == [{'text': 'Hello world', 'text_translated': 'Olá mundo'}]
+        assert loop_types == [uvloop.Loop]
+    
+    @patch('src.translate.azure.uvloop')
+    @patch('src.translate.azure.translate_segments_async', new_callable=AsyncMock)
+    def test_translate_segments_sync_loop_factory(self, mock_translate_async, mock_uvloop):
+        """Test that the sync wrapper builds its loop through uvloop.new_event_loop."""
+        mock_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        mock_translate_async.return_value = [{'text': 'Hello world', 'text_translated': 'Olá mundo'}]
+        
+        result = translate_segments([{'text': 'Hello world'}], subscription_key='test_key')
+        
+        assert result == [{'text': 'Hello world', 'text_translated': 'Olá mundo'}]
+        mock_uvloop.new_event_loop.assert_called_once_with()
+    
+    @patch('src.translate.azure.translate_segments_async', new_callable=AsyncMock)
+    async def test_translate_segments_in_running_loop(self, mock_translate_async):
+        """Test that the sync wrapper schedules on a running loop instead of nesting asyncio.run."""
+        mock_result = [{'text': 'Hello world', 'text_translated': 'Olá mundo'}]
+        mock_translate_async.return_value = mock_result
+        
+        future = translate_segments([{'text': 'Hello world'}], subscription_key='test_key')
+        
+        assert asyncio.isfuture(future)
+        assert await future == mock_result
+    
     @patch('src.translate.azure.AzureTranslator')
     async def test_translate_text_with_defaults(self, mock_translator_class):
         """Test translate_text with default parameters."""